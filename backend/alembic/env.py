@@ -16,6 +16,7 @@ from app.models import (  # noqa: F401
     EvaluationConfig,
     EvaluationConfigHistory,
     EvaluationDetail,
+    EvaluationJob,
     Industry,
     InterviewSession,
     QuestionBank,
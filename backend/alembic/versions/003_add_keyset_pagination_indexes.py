@@ -0,0 +1,36 @@
+"""Add keyset pagination indexes
+
+Revision ID: 003_add_keyset_pagination_indexes
+Revises: 002_add_evaluation_jobs
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "003_add_keyset_pagination_indexes"
+down_revision: Union[str, None] = "002_add_evaluation_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Session history: WHERE user_id, status ORDER BY completed_at, id
+    op.create_index(
+        "idx_sessions_user_history",
+        "interview_sessions",
+        ["user_id", "status", "completed_at", "id"],
+    )
+    # Admin session list: ORDER BY created_at, id
+    op.create_index("idx_sessions_created_id", "interview_sessions", ["created_at", "id"])
+    # Admin user list: ORDER BY created_at, id
+    op.create_index("idx_users_created_id", "users", ["created_at", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("idx_users_created_id", table_name="users")
+    op.drop_index("idx_sessions_created_id", table_name="interview_sessions")
+    op.drop_index("idx_sessions_user_history", table_name="interview_sessions")
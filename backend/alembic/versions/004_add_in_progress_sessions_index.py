@@ -0,0 +1,32 @@
+"""Add partial index on in-progress sessions
+
+Revision ID: 004_add_in_progress_sessions_index
+Revises: 003_add_keyset_pagination_indexes
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004_add_in_progress_sessions_index"
+down_revision: Union[str, None] = "003_add_keyset_pagination_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Abandoned session reaper: in-progress sessions ordered by start time
+    op.create_index(
+        "idx_sessions_in_progress_started",
+        "interview_sessions",
+        ["started_at"],
+        postgresql_where=sa.text("status = 'in_progress'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_sessions_in_progress_started", table_name="interview_sessions")
@@ -0,0 +1,47 @@
+"""Add session_events table
+
+Revision ID: 005_add_session_events
+Revises: 004_add_in_progress_sessions_index
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "005_add_session_events"
+down_revision: Union[str, None] = "004_add_in_progress_sessions_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Create session_events table (append-only telemetry, written with COPY)
+    op.create_table(
+        "session_events",
+        sa.Column("id", sa.BigInteger(), sa.Identity(), nullable=False),
+        sa.Column("session_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("event_type", sa.String(50), nullable=False),
+        sa.Column("payload", postgresql.JSONB(), nullable=True),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "idx_session_events_session_id",
+        "session_events",
+        ["session_id", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("session_events")
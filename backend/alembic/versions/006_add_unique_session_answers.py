@@ -0,0 +1,89 @@
+"""Deduplicate session answers and make them unique per question
+
+Revision ID: 006_add_unique_session_answers
+Revises: 005_add_session_events
+Create Date: 2026-10-19
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_add_unique_session_answers"
+down_revision: Union[str, None] = "005_add_session_events"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the first answer of each question; later rows are client retries.
+    # Audio and transcripts attached only to a retry are carried over first.
+    op.execute(
+        """
+        WITH ranked AS (
+            SELECT
+                id,
+                first_value(id) OVER w AS keep_id,
+                row_number() OVER w AS rn
+            FROM session_answers
+            WINDOW w AS (
+                PARTITION BY session_id, question_order
+                ORDER BY answered_at, created_at, id
+            )
+        ),
+        extras AS (
+            SELECT
+                ranked.keep_id,
+                (array_agg(a.audio_url ORDER BY a.answered_at)
+                    FILTER (WHERE a.audio_url IS NOT NULL))[1] AS audio_url,
+                (array_agg(a.transcript ORDER BY a.answered_at)
+                    FILTER (WHERE a.transcript IS NOT NULL))[1] AS transcript
+            FROM ranked
+            JOIN session_answers a ON a.id = ranked.id
+            WHERE ranked.rn > 1
+            GROUP BY ranked.keep_id
+        )
+        UPDATE session_answers k
+        SET
+            audio_url = COALESCE(k.audio_url, extras.audio_url),
+            transcript = COALESCE(k.transcript, extras.transcript),
+            skipped = k.skipped AND extras.audio_url IS NULL AND extras.transcript IS NULL
+        FROM extras
+        WHERE k.id = extras.keep_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM session_answers
+        WHERE id IN (
+            SELECT id FROM (
+                SELECT
+                    id,
+                    row_number() OVER (
+                        PARTITION BY session_id, question_order
+                        ORDER BY answered_at, created_at, id
+                    ) AS rn
+                FROM session_answers
+            ) ranked
+            WHERE rn > 1
+        )
+        """
+    )
+
+    op.add_column(
+        "session_answers",
+        sa.Column("idempotency_key", sa.String(100), nullable=True),
+    )
+    op.create_unique_constraint(
+        "uq_session_answers_session_order",
+        "session_answers",
+        ["session_id", "question_order"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_session_answers_session_order", "session_answers", type_="unique")
+    op.drop_column("session_answers", "idempotency_key")
@@ -2,7 +2,18 @@
 
 from fastapi import APIRouter
 
-from app.api.routes import admin, auth, config, evaluations, face_analysis, health, questions, sessions
+from app.api.routes import (
+    admin,
+    auth,
+    config,
+    evaluations,
+    face_analysis,
+    health,
+    questions,
+    sessions,
+    storage,
+    tts,
+)
 
 api_router = APIRouter()
 
@@ -25,3 +36,9 @@ api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
 
 # Face Analysis API
 api_router.include_router(face_analysis.router, prefix="/face", tags=["face-analysis"])
+
+# Local object storage (stand-in for direct S3 uploads)
+api_router.include_router(storage.router, prefix="/storage", tags=["storage"])
+
+# Question audio (text-to-speech assets)
+api_router.include_router(tts.router, prefix="/tts", tags=["tts"])
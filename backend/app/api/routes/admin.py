@@ -184,12 +184,25 @@ async def get_users(
     current_admin: CurrentAdmin,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = True,
 ) -> dict:
     """Get user list."""
     admin_service = AdminService(db)
 
-    result = await admin_service.get_users(limit=limit, offset=offset)
-    return result
+    try:
+        result = await admin_service.get_users(
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        return result
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
 
 # Session Management
@@ -201,17 +214,27 @@ async def get_sessions(
     status_filter: str | None = Query(None, alias="status"),
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = True,
 ) -> dict:
     """Get session list for admin."""
     admin_service = AdminService(db)
 
-    result = await admin_service.get_sessions(
-        user_id=user_id,
-        status_filter=status_filter,
-        limit=limit,
-        offset=offset,
-    )
-    return result
+    try:
+        result = await admin_service.get_sessions(
+            user_id=user_id,
+            status_filter=status_filter,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        return result
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
 
 
 # Statistics
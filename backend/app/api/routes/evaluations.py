@@ -1,14 +1,83 @@
 """Evaluation endpoints."""
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Header, HTTPException, status
+from fastapi.responses import StreamingResponse
 
+from app.core.config import settings
 from app.core.deps import CurrentUser, DbSession
-from app.schemas.evaluation import EvaluationResponse, EvaluationSummaryResponse
+from app.schemas.evaluation import (
+    EvaluationJobResponse,
+    EvaluationResponse,
+    EvaluationSummaryResponse,
+)
+from app.services.evaluation_events import evaluation_event_stream
 from app.services.evaluation_service import EvaluationService
+from app.services.session_channel import SessionChannel
 
 router = APIRouter()
 
 
+@router.get("/jobs/{job_id}", response_model=EvaluationJobResponse)
+async def get_evaluation_job(
+    job_id: str,
+    db: DbSession,
+    current_user: CurrentUser,
+) -> EvaluationJobResponse:
+    """Get the status of an evaluation job (returned by session completion)."""
+    evaluation_service = EvaluationService(db)
+
+    result = await evaluation_service.get_job(
+        job_id=job_id,
+        user_id=current_user["sub"],
+    )
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Evaluation job not found",
+        )
+    return result
+
+
+@router.get("/{session_id}/events")
+async def stream_evaluation_events(
+    session_id: str,
+    db: DbSession,
+    current_user: CurrentUser,
+    last_event_id: str | None = Header(default=None),
+) -> StreamingResponse:
+    """Stream evaluation progress and the result of a session as server-sent events."""
+    if not settings.session_channel_enabled:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Evaluation events are not available",
+        )
+    try:
+        channel = SessionChannel(session_id, last_event_id=last_event_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    exists, _ = await EvaluationService(db).get_session_job(
+        session_id=session_id,
+        user_id=current_user["sub"],
+    )
+    if not exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found",
+        )
+    # The stream opens its own database sessions; release this one now
+    await db.close()
+
+    return StreamingResponse(
+        evaluation_event_stream(session_id, current_user["sub"], channel),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.get("/{session_id}", response_model=EvaluationResponse)
 async def get_evaluation(
     session_id: str,
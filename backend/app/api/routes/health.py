@@ -3,7 +3,8 @@
 from fastapi import APIRouter
 
 from app.core.config import settings
-from app.schemas.common import HealthResponse
+from app.core.metrics import metrics
+from app.schemas.common import HealthResponse, MetricsResponse
 
 router = APIRouter()
 
@@ -16,3 +17,9 @@ async def health_check() -> HealthResponse:
         version=settings.app_version,
         environment=settings.environment,
     )
+
+
+@router.get("/metrics", response_model=MetricsResponse)
+async def get_metrics() -> MetricsResponse:
+    """Get in-process metrics for this node."""
+    return MetricsResponse(**metrics.snapshot())
@@ -1,18 +1,31 @@
 """Interview session endpoints."""
 
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, Header, HTTPException, Query, Request, Response, WebSocket, status
 
 from app.core.deps import CurrentUser, DbSession
 from app.schemas.session import (
     AnswerRequest,
     AnswerResponse,
+    AudioUploadConfirmRequest,
+    AudioUploadResponse,
+    AudioUploadUrlRequest,
+    AudioUploadUrlResponse,
+    BulkAnswerRequest,
+    BulkAnswerResponse,
+    InterviewManifest,
     SessionCompleteResponse,
     SessionCreateRequest,
     SessionCreateResponse,
+    SessionEventBatchRequest,
+    SessionEventBatchResponse,
+    SessionEventListResponse,
     SessionHistoryResponse,
     SessionResponse,
 )
+from app.services.session_events import SessionEventService
 from app.services.session_service import SessionService
+from app.services.session_socket import SessionSocket
+from app.services.storage import StorageError
 
 router = APIRouter()
 
@@ -65,14 +78,123 @@ async def get_session(
     return result
 
 
+@router.get("/{session_id}/manifest", response_model=InterviewManifest)
+async def get_session_manifest(
+    session_id: str,
+    db: DbSession,
+    current_user: CurrentUser,
+    response: Response,
+    jlpt_level: str | None = Query(None, pattern=r"^N[1-5]$"),
+    if_none_match: str | None = Header(None),
+) -> InterviewManifest | Response:
+    """
+    Get the interview manifest.
+
+    Lists all questions with their text variants and audio URLs, so the
+    client can move between questions without a request per question.
+    While ``audio_pending`` is set, refetch with ``If-None-Match``.
+    """
+    session_service = SessionService(db)
+
+    manifest = await session_service.get_manifest(
+        session_id=session_id,
+        user_id=current_user["sub"],
+        jlpt_level=jlpt_level,
+    )
+    if manifest is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found",
+        )
+
+    etag = f'"{manifest.etag}"'
+    # Revalidate while audio is pending so clients pick it up once it is ready
+    cache_control = "private, no-cache" if manifest.audio_pending else "private, max-age=3600"
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if if_none_match == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return manifest
+
+
+@router.websocket("/{session_id}/ws")
+async def session_websocket(websocket: WebSocket, session_id: str) -> None:
+    """
+    Interview channel for answers, questions, face frames and results.
+
+    The first message must be ``{"type": "auth", "data": {"token": ...}}``;
+    see ``app.services.session_socket`` for the protocol.
+    """
+    await SessionSocket(websocket, session_id).run()
+
+
+@router.post(
+    "/{session_id}/events",
+    response_model=SessionEventBatchResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def record_session_events(
+    session_id: str,
+    request: SessionEventBatchRequest,
+    db: DbSession,
+    current_user: CurrentUser,
+) -> SessionEventBatchResponse:
+    """Report client telemetry events; they are written asynchronously."""
+    event_service = SessionEventService(db)
+
+    accepted = await event_service.record_events(
+        session_id=session_id,
+        user_id=current_user["sub"],
+        events=request.events,
+    )
+    if accepted is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found",
+        )
+    return SessionEventBatchResponse(accepted=accepted)
+
+
+@router.get("/{session_id}/events", response_model=SessionEventListResponse)
+async def list_session_events(
+    session_id: str,
+    db: DbSession,
+    current_user: CurrentUser,
+    after: int | None = Query(None, ge=0, description="next_after of the previous page"),
+    limit: int = Query(100, ge=1, le=1000),
+    event_type: str | None = Query(None, alias="type"),
+) -> SessionEventListResponse:
+    """List the recorded telemetry events of a session."""
+    event_service = SessionEventService(db)
+
+    result = await event_service.list_events(
+        session_id=session_id,
+        user_id=current_user["sub"],
+        after=after,
+        limit=limit,
+        event_type=event_type,
+    )
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Session not found",
+        )
+    return result
+
+
 @router.post("/{session_id}/answers", response_model=AnswerResponse)
 async def submit_answer(
     session_id: str,
     request: AnswerRequest,
     db: DbSession,
     current_user: CurrentUser,
+    idempotency_key: str | None = Header(default=None, max_length=100),
 ) -> AnswerResponse:
-    """Submit an answer for a question."""
+    """
+    Submit an answer for a question.
+
+    Retries with the same Idempotency-Key header return the original answer.
+    """
     session_service = SessionService(db)
 
     try:
@@ -82,6 +204,128 @@ async def submit_answer(
             question_id=request.question_id,
             audio_data=request.audio_data,
             transcript=request.transcript,
+            idempotency_key=idempotency_key,
+        )
+        return result
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.put("/{session_id}/answers/{question_id}/audio", response_model=AudioUploadResponse)
+async def upload_answer_audio(
+    session_id: str,
+    question_id: int,
+    request: Request,
+    db: DbSession,
+    current_user: CurrentUser,
+    content_type: str = Header("application/octet-stream"),
+) -> AudioUploadResponse:
+    """
+    Upload the recording of an answer as the raw request body.
+
+    The body is streamed to object storage in chunks, so recordings are never
+    held in memory as a whole.
+    """
+    session_service = SessionService(db)
+
+    try:
+        result = await session_service.upload_answer_audio(
+            session_id=session_id,
+            user_id=current_user["sub"],
+            question_id=question_id,
+            chunks=request.stream(),
+            content_type=content_type,
+        )
+        return result
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.post(
+    "/{session_id}/answers/{question_id}/audio/upload-url",
+    response_model=AudioUploadUrlResponse,
+)
+async def create_audio_upload_url(
+    session_id: str,
+    question_id: int,
+    request: AudioUploadUrlRequest,
+    db: DbSession,
+    current_user: CurrentUser,
+) -> AudioUploadUrlResponse:
+    """
+    Get a pre-signed URL for uploading answer audio directly to storage.
+
+    After the upload, call the confirm endpoint with the returned key.
+    """
+    session_service = SessionService(db)
+
+    try:
+        result = await session_service.create_audio_upload_url(
+            session_id=session_id,
+            user_id=current_user["sub"],
+            question_id=question_id,
+            content_type=request.content_type,
+        )
+        return result
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.post("/{session_id}/answers/{question_id}/audio/confirm", response_model=AudioUploadResponse)
+async def confirm_audio_upload(
+    session_id: str,
+    question_id: int,
+    request: AudioUploadConfirmRequest,
+    db: DbSession,
+    current_user: CurrentUser,
+) -> AudioUploadResponse:
+    """Attach audio uploaded with a pre-signed URL to the answer."""
+    session_service = SessionService(db)
+
+    try:
+        result = await session_service.confirm_audio_upload(
+            session_id=session_id,
+            user_id=current_user["sub"],
+            question_id=question_id,
+            key=request.key,
+        )
+        return result
+    except (ValueError, StorageError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+
+@router.post("/{session_id}/answers/bulk", response_model=BulkAnswerResponse)
+async def submit_answers_bulk(
+    session_id: str,
+    request: BulkAnswerRequest,
+    db: DbSession,
+    current_user: CurrentUser,
+) -> BulkAnswerResponse:
+    """
+    Submit buffered answers in order.
+
+    Used by clients replaying answers after a reconnect; answers that were
+    already recorded are reported as duplicates instead of failing.
+    """
+    session_service = SessionService(db)
+
+    try:
+        result = await session_service.submit_answers_bulk(
+            session_id=session_id,
+            user_id=current_user["sub"],
+            answers=request.answers,
         )
         return result
     except ValueError as e:
@@ -119,13 +363,23 @@ async def get_session_history(
     current_user: CurrentUser,
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    include_total: bool = True,
 ) -> SessionHistoryResponse:
     """Get session history for the current user."""
     session_service = SessionService(db)
 
-    result = await session_service.get_history(
-        user_id=current_user["sub"],
-        limit=limit,
-        offset=offset,
-    )
-    return result
+    try:
+        result = await session_service.get_history(
+            user_id=current_user["sub"],
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            include_total=include_total,
+        )
+        return result
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
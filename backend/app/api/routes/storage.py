@@ -0,0 +1,51 @@
+"""Local object storage endpoints.
+
+Stand-in for direct-to-S3 uploads when STORAGE_BACKEND=local: pre-signed URLs
+issued by the local backend point here.
+"""
+
+from collections.abc import AsyncIterator
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+
+from app.core.config import settings
+from app.services.storage import LocalStorageBackend, StorageError, get_storage, verify_local_upload
+
+router = APIRouter()
+
+
+async def _limited_stream(request: Request) -> AsyncIterator[bytes]:
+    total = 0
+    async for chunk in request.stream():
+        total += len(chunk)
+        if total > settings.audio_upload_max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail="Object is too large",
+            )
+        yield chunk
+
+
+@router.put("/local/{key:path}", status_code=status.HTTP_204_NO_CONTENT)
+async def upload_local_object(
+    key: str,
+    request: Request,
+    expires: int = Query(...),
+    content_type: str = Query(...),
+    signature: str = Query(...),
+) -> None:
+    """Upload an object with a pre-signed local storage URL."""
+    storage = get_storage()
+    if not isinstance(storage, LocalStorageBackend):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not found")
+
+    if not verify_local_upload(key, content_type, expires, signature):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid or expired signature",
+        )
+
+    try:
+        await storage.upload_stream(key, _limited_stream(request), content_type)
+    except StorageError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
@@ -0,0 +1,31 @@
+"""Question audio endpoints."""
+
+from fastapi import APIRouter, HTTPException, Response, status
+
+from app.services.tts import get_tts_store, is_asset_hash
+
+router = APIRouter()
+
+
+@router.get("/{audio_hash}")
+async def get_tts_audio(audio_hash: str) -> Response:
+    """Serve synthesised question audio.
+
+    Assets are content-addressed, so responses never change and can be
+    cached indefinitely. They are served from memory (question audio is
+    small) so a concurrent local cache eviction cannot remove the file
+    mid-response.
+    """
+    if not is_asset_hash(audio_hash):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audio not found")
+
+    store = get_tts_store()
+    data = await store.read(audio_hash)
+    if data is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Audio not found")
+
+    return Response(
+        content=data,
+        media_type=store.backend.content_type,
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
@@ -0,0 +1,61 @@
+"""Model artifact registry CLI.
+
+Usage:
+    python -m app.cli.models prefetch [--only NAME ...] [--force] [--pin]
+    python -m app.cli.models verify [--only NAME ...]
+    python -m app.cli.models list
+"""
+
+import argparse
+import sys
+
+from app.services.model_registry import ModelArtifactError, ModelRegistry
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the model registry CLI."""
+    parser = argparse.ArgumentParser(prog="python -m app.cli.models")
+    parser.add_argument("--dir", help="Registry directory (default: MODEL_ARTIFACT_DIR)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    prefetch = subparsers.add_parser("prefetch", help="Download and record model artifacts")
+    prefetch.add_argument("--only", nargs="+", help="Artifact names to fetch")
+    prefetch.add_argument("--force", action="store_true", help="Re-download existing files")
+    prefetch.add_argument(
+        "--pin",
+        action="store_true",
+        help="Write fetched checksums into the bundled source manifest",
+    )
+
+    verify = subparsers.add_parser("verify", help="Verify stored artifacts")
+    verify.add_argument("--only", nargs="+", help="Artifact names to verify")
+
+    subparsers.add_parser("list", help="List declared artifacts")
+
+    args = parser.parse_args(argv)
+    registry = ModelRegistry(root=args.dir)
+
+    try:
+        if args.command == "prefetch":
+            artifacts = registry.prefetch(names=args.only, force=args.force)
+            if args.pin:
+                registry.pin(artifacts)
+            for artifact in artifacts:
+                print(f"{artifact.name}\t{artifact.sha256}\t{artifact.size}")
+        elif args.command == "verify":
+            for artifact in registry.verify(names=args.only):
+                print(f"{artifact.name}\tOK\t{artifact.sha256}")
+        else:
+            stored = registry.stored_artifacts()
+            for artifact in registry.declared_artifacts():
+                state = "stored" if artifact.name in stored else "missing"
+                print(f"{artifact.name}\t{state}\t{artifact.path}")
+    except ModelArtifactError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
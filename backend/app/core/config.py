@@ -113,12 +113,33 @@ class Settings(BaseSettings):
     google_cloud_credentials_path: str = ""
     heygen_api_key: str = ""
 
+    # HeyGen streaming avatars (warm sessions kept per avatar; disabled without an API key)
+    heygen_base_url: str = "https://api.heygen.com"
+    heygen_timeout_seconds: float = 30
+    heygen_quality: str = "medium"
+    heygen_default_avatar_id: str = "wayne_asian_male"
+    heygen_pool_enabled: bool = True
+    heygen_pool_avatar_ids: list[str] = Field(default_factory=lambda: ["wayne_asian_male"])
+    heygen_pool_size: int = 2
+    # Idle sessions older than this are closed and replaced
+    heygen_session_ttl_seconds: float = 240
+    heygen_pool_refill_seconds: float = 5
+
     # AWS S3
     aws_access_key_id: str = ""
     aws_secret_access_key: str = ""
     aws_region: str = "ap-northeast-1"
     s3_bucket_name: str = "ai-interview-audio"
 
+    # Object storage ("local" stores files under storage_local_dir)
+    storage_backend: Literal["local", "s3"] = "local"
+    storage_local_dir: str = "storage"
+    audio_upload_max_bytes: int = 50 * 1024 * 1024
+    # Lifetime of pre-signed upload URLs
+    storage_presign_expires_seconds: int = 900
+    # Public base URL of this API, used in local storage upload URLs
+    storage_local_base_url: str = "http://localhost:8000"
+
     # mintoku work API
     mintoku_api_base_url: str = ""
     mintoku_api_key: str = ""
@@ -127,6 +148,116 @@ class Settings(BaseSettings):
     rate_limit_requests: int = 100
     rate_limit_window_seconds: int = 60
 
+    # Transcription (answers without a transcript are transcribed in the background)
+    transcription_enabled: bool = True
+    transcription_backend: Literal["google", "fake"] = "google"
+    transcription_language: str = "ja-JP"
+    transcription_max_concurrency: int = 4
+    transcription_queue_size: int = 100
+    transcription_batch_wait_ms: int = 50
+    transcription_timeout_seconds: float = 30
+    transcription_cache_size: int = 1024
+
+    # Question text-to-speech (assets in object storage, hot ones on local disk)
+    tts_enabled: bool = True
+    tts_backend: Literal["openai", "fake"] = "openai"
+    tts_model: str = "tts-1"
+    tts_voice: str = "alloy"
+    tts_max_concurrency: int = 4
+    tts_cache_dir: str = "./storage/tts-cache"
+    tts_cache_max_bytes: int = 256 * 1024 * 1024
+    # Manifest requests wait this long for question audio, then omit it
+    # (session creation only includes audio that is already cached)
+    tts_manifest_timeout_seconds: float = 2
+
+    # Evaluation jobs
+    evaluation_job_max_attempts: int = 5
+    evaluation_job_backoff_seconds: float = 10
+    evaluation_job_backoff_max_seconds: float = 600
+    # Running jobs not finished within the lease are reclaimed by other workers
+    evaluation_job_lease_seconds: int = 300
+    evaluation_worker_concurrency: int = 2
+    evaluation_worker_poll_seconds: float = 2
+    # Answers are scored by the chat model ("fake" scores by answer length, for development)
+    evaluation_scoring_backend: Literal["openai", "fake"] = "openai"
+    evaluation_scoring_max_concurrency: int = 4
+
+    # Session WebSocket channel
+    ws_auth_timeout_seconds: float = 10
+    ws_max_inflight_frames: int = 2
+
+    # Session event channels (Redis Streams, read by the node holding the connection)
+    session_channel_enabled: bool = True
+    session_channel_maxlen: int = 1000
+    session_channel_ttl_seconds: int = 86400
+    session_channel_block_ms: int = 15000
+
+    # Evaluation server-sent events
+    evaluation_sse_keepalive_seconds: float = 15
+
+    # In-progress session state in Redis
+    session_state_enabled: bool = True
+    session_state_ttl_seconds: int = 7200
+
+    # Abandoned session reaper (in-progress sessions idle this long are abandoned)
+    session_reaper_enabled: bool = True
+    session_idle_timeout_seconds: int = 7200
+    session_reaper_interval_seconds: float = 300
+    session_reaper_batch_size: int = 500
+    session_reaper_max_batches: int = 20
+
+    # Session telemetry event log (buffered, written in batches with COPY)
+    session_events_enabled: bool = True
+    session_events_batch_size: int = 500
+    session_events_flush_interval_seconds: float = 2
+    session_events_max_buffered: int = 50000
+    session_events_max_retries: int = 3
+
+    # Script question cache (scripts per process)
+    script_cache_max_scripts: int = 256
+
+    # Event loop monitoring
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval_ms: int = 100
+    # Stalls longer than this are logged with the blocking stack
+    loop_monitor_threshold_ms: int = 200
+
+    # Face detection
+    # "auto" benchmarks the candidates at startup on the frames in
+    # face_calibration_dir (none are bundled) and picks the fastest one that
+    # meets the accuracy floor
+    face_detector_backend: Literal["auto", "opencv_haar", "yunet", "mediapipe"] = "opencv_haar"
+    face_detector_candidates: list[str] = Field(
+        default_factory=lambda: ["opencv_haar", "yunet", "mediapipe"]
+    )
+    face_detector_min_accuracy: float = Field(default=0.9, ge=0.0, le=1.0)
+    face_detector_fallback: str = "opencv_haar"
+    face_calibration_dir: str = ""
+    face_yunet_model_path: str = ""
+
+    # Model artifact registry (populated by `python -m app.cli.models prefetch`)
+    model_artifact_dir: str = "models"
+    # Off until the checksums in app/data/models/manifest.json are pinned
+    # (`prefetch --pin`); enable it for images built with pinned artifacts
+    model_registry_verify: bool = False
+    model_registry_required: list[str] = Field(default_factory=lambda: ["deepface_emotion"])
+
+    # Face inference
+    # "inline" runs the pipeline in the API process, "redis" sends frames to
+    # face workers through a Redis stream
+    face_inference_mode: Literal["inline", "redis"] = "inline"
+    face_stream_name: str = "face:requests"
+    face_stream_group: str = "face-workers"
+    face_stream_maxlen: int = 10000
+    face_reply_timeout_seconds: int = 10
+    face_worker_concurrency: int = 2
+    # Pending messages idle this long are reclaimed; workers refresh the idle
+    # time of messages they are still processing every third of it
+    face_worker_claim_idle_ms: int = 5000
+    face_worker_max_deliveries: int = 3
+    # Run a face worker inside the API process (single-node setups and tests)
+    face_worker_embedded: bool = False
+
 
 @lru_cache
 def get_settings() -> Settings:
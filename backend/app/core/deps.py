@@ -1,7 +1,7 @@
 """FastAPI dependencies for dependency injection."""
 
 from collections.abc import AsyncGenerator
-from typing import Annotated
+from typing import Annotated, Any
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
@@ -27,7 +27,7 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
 
 async def get_current_user(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
-) -> dict:
+) -> dict[str, Any]:
     """Get the current authenticated user from JWT token."""
     if credentials is None:
         raise HTTPException(
@@ -49,7 +49,7 @@ async def get_current_user(
 
 async def get_current_admin(
     credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(admin_bearer_scheme)],
-) -> dict:
+) -> dict[str, Any]:
     """Get the current authenticated admin from JWT token."""
     if credentials is None:
         raise HTTPException(
@@ -81,5 +81,5 @@ async def get_current_admin(
 
 # Type aliases for cleaner dependency injection
 DbSession = Annotated[AsyncSession, Depends(get_db)]
-CurrentUser = Annotated[dict, Depends(get_current_user)]
-CurrentAdmin = Annotated[dict, Depends(get_current_admin)]
+CurrentUser = Annotated[dict[str, Any], Depends(get_current_user)]
+CurrentAdmin = Annotated[dict[str, Any], Depends(get_current_admin)]
@@ -0,0 +1,173 @@
+"""Event loop lag monitoring.
+
+A probe task sleeps for a fixed interval and records how late it wakes up
+(event loop lag). A watchdog thread watches the probe's heartbeat; when the
+loop is stuck longer than the threshold it captures the stack of the loop
+thread, i.e. the synchronous code that is blocking it, and logs it together
+with the route of the request being handled.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+
+logger = get_logger(__name__)
+
+# Route being handled by each request task, for attributing blocking calls
+_task_routes: "weakref.WeakKeyDictionary[asyncio.Task[Any], str]" = weakref.WeakKeyDictionary()
+
+# Stack frames kept in blocked-loop reports
+MAX_STACK_FRAMES = 25
+
+
+class RouteTrackingMiddleware:
+    """ASGI middleware recording the route handled by the current task."""
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] in ("http", "websocket"):
+            task = asyncio.current_task()
+            if task is not None:
+                _task_routes[task] = f"{scope.get('method', 'WS')} {scope['path']}"
+        await self.app(scope, receive, send)
+
+
+@dataclass
+class BlockedLoopReport:
+    """A detected event loop stall."""
+
+    blocked_ms: float
+    route: str | None
+    stack: str
+
+
+class EventLoopMonitor:
+    """Measures event loop lag and reports blocking calls."""
+
+    def __init__(
+        self,
+        interval_ms: int | None = None,
+        threshold_ms: int | None = None,
+        window: int = 1000,
+    ) -> None:
+        self.interval = (interval_ms or settings.loop_monitor_interval_ms) / 1000
+        self.threshold = (threshold_ms or settings.loop_monitor_threshold_ms) / 1000
+        self.last_report: BlockedLoopReport | None = None
+        self._samples: deque[float] = deque(maxlen=window)
+        self._heartbeat = time.monotonic()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._probe_task: asyncio.Task[None] | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stop.clear()
+        self._probe_task = asyncio.create_task(self._probe())
+        self._watchdog = threading.Thread(
+            target=self._watch,
+            name="event-loop-watchdog",
+            daemon=True,
+        )
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop monitoring."""
+        self._stop.set()
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=1)
+
+    def percentiles(self) -> dict[str, float]:
+        """Lag percentiles (ms) over the recent sample window."""
+        samples = sorted(self._samples)
+        if not samples:
+            return {}
+
+        def pick(q: float) -> float:
+            return round(samples[min(len(samples) - 1, int(q * len(samples)))] * 1000, 2)
+
+        return {
+            "p50": pick(0.50),
+            "p95": pick(0.95),
+            "p99": pick(0.99),
+            "max": round(samples[-1] * 1000, 2),
+        }
+
+    async def _probe(self) -> None:
+        """Sleep for the interval and record how late the loop wakes up."""
+        loop = asyncio.get_running_loop()
+        export_every = max(1, int(1 / self.interval))
+        count = 0
+        while True:
+            self._heartbeat = time.monotonic()
+            expected = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self._samples.append(max(0.0, loop.time() - expected))
+
+            count += 1
+            if count % export_every == 0:
+                for name, value in self.percentiles().items():
+                    metrics.set_gauge(f"event_loop_lag_{name}_ms", value)
+
+    def _watch(self) -> None:
+        """Watchdog thread: capture the loop thread's stack when it stalls."""
+        reported_heartbeat = None
+        while not self._stop.wait(self.threshold / 2):
+            heartbeat = self._heartbeat
+            stalled = time.monotonic() - heartbeat - self.interval
+            if stalled < self.threshold or heartbeat == reported_heartbeat:
+                continue
+
+            # Report each stall once
+            reported_heartbeat = heartbeat
+            self._report(stalled)
+
+    def _report(self, stalled: float) -> None:
+        """Log the stack and route of the code blocking the loop."""
+        frame = sys._current_frames().get(self._loop_thread_id or 0)
+        if frame is None:
+            return
+        stack = "".join(traceback.format_stack(frame, limit=MAX_STACK_FRAMES))
+
+        route = None
+        try:
+            task = asyncio.current_task(self._loop)
+            if task is not None:
+                route = _task_routes.get(task)
+        except RuntimeError:
+            pass
+
+        self.last_report = BlockedLoopReport(
+            blocked_ms=round(stalled * 1000, 1),
+            route=route,
+            stack=stack,
+        )
+        metrics.inc("event_loop_blocked_total")
+        logger.warning(
+            "Event loop blocked",
+            blocked_ms=self.last_report.blocked_ms,
+            route=route,
+            stack=stack,
+        )
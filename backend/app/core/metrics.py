@@ -0,0 +1,34 @@
+"""In-process application metrics."""
+
+import threading
+from typing import Any
+
+
+class MetricsRegistry:
+    """Thread-safe registry of counters and gauges exposed by the metrics endpoint."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._counters: dict[str, float] = {}
+        self._gauges: dict[str, Any] = {}
+
+    def inc(self, name: str, value: float = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def set_gauge(self, name: str, value: Any) -> None:
+        """Set a gauge to the given value."""
+        with self._lock:
+            self._gauges[name] = value
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Get a copy of all current metric values."""
+        with self._lock:
+            return {
+                "counters": dict(self._counters),
+                "gauges": dict(self._gauges),
+            }
+
+
+metrics = MetricsRegistry()
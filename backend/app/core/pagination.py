@@ -0,0 +1,57 @@
+"""Keyset (cursor) pagination helpers.
+
+Lists are ordered by ``(timestamp, id)`` descending. A cursor encodes the
+sort key of the last row of a page; the next page is fetched with a row
+comparison against it, which uses the composite index and costs the same at
+any depth (unlike ``OFFSET``). Cursors are opaque base64url tokens.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, tuple_
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor token cannot be decoded."""
+
+    def __init__(self) -> None:
+        super().__init__("Invalid cursor")
+
+
+def encode_cursor(sort_value: datetime, row_id: UUID) -> str:
+    """Encode the sort key of a row as a cursor token."""
+    payload = json.dumps([sort_value.isoformat(), str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[datetime, UUID]:
+    """Decode a cursor token into a sort key."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(sort_value), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise InvalidCursorError()
+
+
+def after_cursor(sort_column: Any, id_column: Any, token: str) -> ColumnElement[bool]:
+    """Condition selecting rows after the cursor in descending order."""
+    sort_value, row_id = decode_cursor(token)
+    return tuple_(sort_column, id_column) < tuple_(sort_value, row_id)
+
+
+def next_cursor(rows: list[Any], limit: int, sort_attr: str, id_attr: str = "id") -> str | None:
+    """Cursor of the page after ``rows``, fetched with ``limit + 1``.
+
+    Returns None on the last page. The extra row is only used to detect
+    whether another page exists; callers must drop it.
+    """
+    if len(rows) <= limit:
+        return None
+    last = rows[limit - 1]
+    return encode_cursor(getattr(last, sort_attr), getattr(last, id_attr))
@@ -0,0 +1,27 @@
+"""Redis client configuration."""
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+# Stream replies of a client with decode_responses=True
+StreamEntry = tuple[str, dict[str, str]]
+StreamReadReply = list[tuple[str, list[StreamEntry]]]
+
+_redis: Redis | None = None
+
+
+def get_redis() -> Redis:
+    """Get the shared Redis client (created on first use)."""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(settings.redis_url, decode_responses=True)
+    return _redis
+
+
+async def close_redis() -> None:
+    """Close the shared Redis client."""
+    global _redis
+    if _redis is not None:
+        await _redis.aclose()
+        _redis = None
@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import asyncio
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
@@ -12,6 +13,15 @@ from app.api.routes import api_router
 from app.core.config import settings
 from app.core.exceptions import AppException
 from app.core.logging import get_logger, setup_logging
+from app.core.loop_monitor import EventLoopMonitor, RouteTrackingMiddleware
+from app.db.redis import close_redis
+from app.services.face_detection import init_face_detector
+from app.services.face_queue import FaceInferenceWorker
+from app.services.heygen import close_avatar_pool, get_avatar_pool
+from app.services.model_registry import configure_model_environment
+from app.services.session_events import get_session_event_buffer
+from app.services.session_reaper import SessionReaper
+from app.services.transcription import close_transcription
 
 logger = get_logger(__name__)
 
@@ -27,9 +37,54 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         version=settings.app_version,
         environment=settings.environment,
     )
+    loop_monitor: EventLoopMonitor | None = None
+    if settings.loop_monitor_enabled:
+        loop_monitor = EventLoopMonitor()
+        loop_monitor.start()
+
+    try:
+        await asyncio.to_thread(configure_model_environment)
+        await asyncio.to_thread(init_face_detector)
+    except Exception as e:
+        logger.exception("Face pipeline initialization failed", error=str(e))
+
+    face_worker: FaceInferenceWorker | None = None
+    face_worker_task: asyncio.Task[None] | None = None
+    if settings.face_worker_embedded:
+        face_worker = FaceInferenceWorker()
+        face_worker_task = asyncio.create_task(face_worker.run())
+
+    avatar_pool = get_avatar_pool()
+    if avatar_pool is not None and settings.heygen_pool_enabled:
+        avatar_pool.start()
+
+    session_reaper: SessionReaper | None = None
+    session_reaper_task: asyncio.Task[None] | None = None
+    if settings.session_reaper_enabled:
+        session_reaper = SessionReaper()
+        session_reaper_task = asyncio.create_task(session_reaper.run())
+
+    session_events_task: asyncio.Task[None] | None = None
+    if settings.session_events_enabled:
+        session_events_task = asyncio.create_task(get_session_event_buffer().run())
+
     yield
     # Shutdown
     logger.info("Shutting down application")
+    if face_worker is not None and face_worker_task is not None:
+        face_worker.stop()
+        await face_worker_task
+    if session_reaper is not None and session_reaper_task is not None:
+        session_reaper.stop()
+        await session_reaper_task
+    if session_events_task is not None:
+        get_session_event_buffer().stop()
+        await session_events_task
+    await close_avatar_pool()
+    await close_transcription()
+    await close_redis()
+    if loop_monitor is not None:
+        await loop_monitor.stop()
 
 
 def create_application() -> FastAPI:
@@ -53,6 +108,9 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Attribute event loop stalls to routes
+    app.add_middleware(RouteTrackingMiddleware)
+
     # Exception handlers
     @app.exception_handler(AppException)
     async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
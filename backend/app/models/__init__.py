@@ -1,9 +1,14 @@
 """Database models."""
 
 from app.models.admin import Admin
-from app.models.evaluation import AptitudeEvaluation, Evaluation, EvaluationDetail
+from app.models.evaluation import (
+    AptitudeEvaluation,
+    Evaluation,
+    EvaluationDetail,
+    EvaluationJob,
+)
 from app.models.evaluation_config import EvaluationConfig, EvaluationConfigHistory
-from app.models.interview import InterviewSession, SessionAnswer
+from app.models.interview import InterviewSession, SessionAnswer, SessionTelemetryEvent
 from app.models.question import (
     Industry,
     QuestionBank,
@@ -22,6 +27,7 @@ __all__ = [
     "EvaluationConfig",
     "EvaluationConfigHistory",
     "EvaluationDetail",
+    "EvaluationJob",
     "Industry",
     "InterviewSession",
     "QuestionBank",
@@ -31,6 +37,7 @@ __all__ = [
     "Script",
     "ScriptQuestion",
     "SessionAnswer",
+    "SessionTelemetryEvent",
     "User",
     "WeakPoint",
 ]
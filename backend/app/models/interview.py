@@ -2,13 +2,27 @@
 
 import uuid
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Integer, String, Text
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Identity,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.uuid7 import uuid7
 
 if TYPE_CHECKING:
     from app.models.evaluation import Evaluation
@@ -24,7 +38,7 @@ class InterviewSession(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -73,6 +87,15 @@ class InterviewSession(Base):
     __table_args__ = (
         Index("idx_sessions_user_status", "user_id", "status"),
         Index("idx_sessions_completed", "completed_at"),
+        # Keyset pagination of session history and the admin session list
+        Index("idx_sessions_user_history", "user_id", "status", "completed_at", "id"),
+        Index("idx_sessions_created_id", "created_at", "id"),
+        # Only in-progress sessions, scanned by the abandoned session reaper
+        Index(
+            "idx_sessions_in_progress_started",
+            "started_at",
+            postgresql_where=text("status = 'in_progress'"),
+        ),
     )
 
 
@@ -84,7 +107,7 @@ class SessionAnswer(Base):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     session_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -100,6 +123,8 @@ class SessionAnswer(Base):
     audio_url: Mapped[str | None] = mapped_column(String(500), nullable=True)
     transcript: Mapped[str | None] = mapped_column(Text, nullable=True)
     skipped: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
+    # Idempotency-Key of the request that created the answer
+    idempotency_key: Mapped[str | None] = mapped_column(String(100), nullable=True)
     answered_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
@@ -115,3 +140,31 @@ class SessionAnswer(Base):
         back_populates="answers",
     )
     question: Mapped["ScriptQuestion"] = relationship("ScriptQuestion")
+
+    __table_args__ = (
+        # One answer per question: retried submissions return the original
+        UniqueConstraint("session_id", "question_order", name="uq_session_answers_session_order"),
+    )
+
+
+class SessionTelemetryEvent(Base):
+    """Session telemetry event - append-only, written in batches with COPY."""
+
+    __tablename__ = "session_events"
+
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    # No foreign key: a deleted session must not fail a whole COPY batch
+    session_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(50), nullable=False)
+    payload: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
+    occurred_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+    )
+
+    __table_args__ = (Index("idx_session_events_session_id", "session_id", "id"),)
@@ -9,6 +9,7 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base, TimestampMixin
+from app.db.uuid7 import uuid7
 
 if TYPE_CHECKING:
     from app.models.interview import InterviewSession
@@ -55,6 +56,7 @@ class User(Base, TimestampMixin):
     __table_args__ = (
         Index("idx_users_mintoku_id", "mintoku_user_id"),
         Index("idx_users_email", "email"),
+        Index("idx_users_created_id", "created_at", "id"),
     )
 
 
@@ -66,7 +68,7 @@ class WeakPoint(Base, TimestampMixin):
     id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
     )
     user_id: Mapped[uuid.UUID] = mapped_column(
         UUID(as_uuid=True),
@@ -54,3 +54,10 @@ class HealthResponse(BaseModel):
     status: str = "healthy"
     version: str
     environment: str
+
+
+class MetricsResponse(BaseModel):
+    """In-process metrics snapshot."""
+
+    counters: dict[str, float]
+    gauges: dict[str, Any]
@@ -138,3 +138,17 @@ class EvaluationSummaryResponse(BaseModel):
     aptitude_summary: AptitudeSummary
     practice_time_minutes: int
     jlpt_level: str | None = None
+
+
+class EvaluationJobResponse(BaseModel):
+    """Status of a queued evaluation."""
+
+    job_id: str
+    session_id: str
+    status: str
+    attempts: int
+    evaluation_id: str | None = None
+    last_error: str | None = None
+    created_at: datetime
+    updated_at: datetime
+    finished_at: datetime | None = None
@@ -124,3 +124,14 @@ class FaceAnalysisResponse(BaseModel):
             }
         }
     }
+
+
+class FaceCodeTablesResponse(BaseModel):
+    """Code tables for decoding compact face analysis responses."""
+
+    version: int = Field(description="コード表のバージョン (コンパクト応答の先頭要素と一致)")
+    emotions: list[str] = Field(description="感情コード表")
+    face_directions: list[str] = Field(description="顔の向きコード表")
+    feedback_types: list[str] = Field(description="フィードバック種類コード表")
+    brightness_statuses: list[str] = Field(description="明るさ状態コード表")
+    messages: list[str] = Field(description="フィードバック・エラーメッセージコード表")
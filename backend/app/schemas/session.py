@@ -1,6 +1,7 @@
 """Session related schemas."""
 
 from datetime import datetime
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
@@ -27,6 +28,37 @@ class ScriptInfo(BaseModel):
     total_questions: int
 
 
+class ManifestQuestion(BaseModel):
+    """A question in the interview manifest."""
+
+    id: int
+    question_id: str
+    # Variant to display and speak for the JLPT level
+    text: str
+    question_ja: str
+    question_simplified: str | None = None
+    question_reading: str | None = None
+    expected_duration_seconds: int | None = None
+    # None while the audio is still being synthesised
+    audio_url: str | None = None
+
+
+class InterviewManifest(BaseModel):
+    """Everything the client needs to run an interview without round-trips."""
+
+    session_id: str
+    script_id: str
+    jlpt_level: str
+    speech_rate: float
+    use_simplified: bool
+    total_questions: int
+    questions: list[ManifestQuestion]
+    # Some question audio is still being synthesised; refetch the manifest
+    audio_pending: bool = False
+    # Changes whenever the script, level settings or audio change
+    etag: str
+
+
 class SessionCreateResponse(BaseModel):
     """Response for session creation."""
 
@@ -34,6 +66,7 @@ class SessionCreateResponse(BaseModel):
     script: ScriptInfo
     heygen_session: HeyGenSession
     started_at: datetime
+    manifest: InterviewManifest | None = None
 
 
 class QuestionInfo(BaseModel):
@@ -87,13 +120,69 @@ class AnswerResponse(BaseModel):
     next_question: NextQuestion | None = None
 
 
+class AudioUploadUrlRequest(BaseModel):
+    """Request body for a direct audio upload URL."""
+
+    content_type: str = Field("audio/webm", pattern=r"^audio/[\w.+-]+(;.*)?$")
+
+
+class AudioUploadUrlResponse(BaseModel):
+    """Pre-signed URL for uploading answer audio directly to storage."""
+
+    key: str
+    upload_url: str
+    method: str = "PUT"
+    headers: dict[str, str]
+    expires_at: datetime
+
+
+class AudioUploadConfirmRequest(BaseModel):
+    """Request body for confirming a direct audio upload."""
+
+    key: str
+
+
+class AudioUploadResponse(BaseModel):
+    """Response for uploading answer audio."""
+
+    answer_id: str
+    question_id: int
+    audio_url: str
+    size: int
+
+
+class BulkAnswerRequest(BaseModel):
+    """Request body for submitting buffered answers in order."""
+
+    answers: list[AnswerRequest] = Field(min_length=1, max_length=50)
+
+
+class BulkAnswerResult(BaseModel):
+    """Result of one answer in a bulk submission."""
+
+    question_id: int
+    status: Literal["accepted", "duplicate", "rejected"]
+    answer_id: str | None = None
+    error: str | None = None
+
+
+class BulkAnswerResponse(BaseModel):
+    """Response for a bulk answer submission."""
+
+    results: list[BulkAnswerResult]
+    next_question: NextQuestion | None = None
+
+
 class SessionCompleteResponse(BaseModel):
     """Response for completing a session."""
 
     session_id: str
     status: str = "completed"
     completed_at: datetime
-    evaluation_id: str
+    # Evaluation job ID; poll GET /evaluations/jobs/{id} for the result
+    job_id: str
+    # Not evaluated yet when the session completes
+    evaluation_id: str | None = None
 
 
 class SessionHistoryItem(BaseModel):
@@ -109,6 +198,46 @@ class SessionHistoryResponse(BaseModel):
     """Response for session history."""
 
     sessions: list[SessionHistoryItem]
-    total: int
+    # Omitted when include_total=false
+    total: int | None = None
     limit: int
     offset: int
+    next_cursor: str | None = None
+
+
+class SessionEventRequest(BaseModel):
+    """A telemetry event reported by the client."""
+
+    type: str = Field(min_length=1, max_length=50, pattern=r"^[a-z][a-z0-9_.]*$")
+    data: dict[str, Any] | None = None
+    # When the event happened on the client; defaults to receipt time
+    occurred_at: datetime | None = None
+
+
+class SessionEventBatchRequest(BaseModel):
+    """Request body for reporting telemetry events."""
+
+    events: list[SessionEventRequest] = Field(min_length=1, max_length=100)
+
+
+class SessionEventBatchResponse(BaseModel):
+    """Response for reporting telemetry events."""
+
+    accepted: int
+
+
+class SessionEventItem(BaseModel):
+    """A recorded session event."""
+
+    id: int
+    type: str
+    data: dict[str, Any] | None = None
+    occurred_at: datetime
+
+
+class SessionEventListResponse(BaseModel):
+    """Response for listing session events."""
+
+    events: list[SessionEventItem]
+    # Pass as ``after`` to get the next page; None on the last page
+    next_after: int | None = None
@@ -6,6 +6,7 @@ from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.core.pagination import after_cursor, next_cursor
 from app.models.admin import Admin
 from app.models.evaluation import Evaluation
 from app.models.interview import InterviewSession
@@ -28,22 +29,29 @@ class AdminService:
         self,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict[str, Any]:
         """Get user list for admin."""
-        # Count total
-        count_stmt = select(func.count()).select_from(User)
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar() or 0
+        total = None
+        if include_total:
+            count_stmt = select(func.count()).select_from(User)
+            total_result = await self.db.execute(count_stmt)
+            total = total_result.scalar() or 0
 
-        # Get users
+        # Get users (one extra row tells whether there is a next page)
         stmt = (
             select(User)
-            .order_by(User.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            .order_by(User.created_at.desc(), User.id.desc())
+            .limit(limit + 1)
         )
+        if cursor:
+            stmt = stmt.where(after_cursor(User.created_at, User.id, cursor))
+            offset = 0
+        else:
+            stmt = stmt.offset(offset)
         result = await self.db.execute(stmt)
-        users = result.scalars().all()
+        users = list(result.scalars().all())
 
         return {
             "users": [
@@ -56,11 +64,12 @@ class AdminService:
                     "jlpt_level": user.jlpt_level,
                     "created_at": user.created_at.isoformat(),
                 }
-                for user in users
+                for user in users[:limit]
             ],
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor(users, limit, "created_at"),
         }
 
     async def get_sessions(
@@ -69,39 +78,41 @@ class AdminService:
         status_filter: str | None = None,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict[str, Any]:
         """Get session list for admin."""
-        # Build query
-        stmt = select(InterviewSession)
-
-        if user_id:
-            stmt = stmt.where(InterviewSession.user_id == user_id)
-        if status_filter:
-            stmt = stmt.where(InterviewSession.status == status_filter)
-
-        # Count total
-        count_stmt = select(func.count()).select_from(InterviewSession)
+        filters = []
         if user_id:
-            count_stmt = count_stmt.where(InterviewSession.user_id == user_id)
+            filters.append(InterviewSession.user_id == user_id)
         if status_filter:
-            count_stmt = count_stmt.where(InterviewSession.status == status_filter)
+            filters.append(InterviewSession.status == status_filter)
 
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar() or 0
+        total = None
+        if include_total:
+            count_stmt = select(func.count()).select_from(InterviewSession).where(*filters)
+            total_result = await self.db.execute(count_stmt)
+            total = total_result.scalar() or 0
 
-        # Get sessions with relationships
+        # Get sessions with relationships (one extra row tells whether there is a next page)
         stmt = (
-            stmt.options(
+            select(InterviewSession)
+            .where(*filters)
+            .options(
                 selectinload(InterviewSession.user),
                 selectinload(InterviewSession.script),
                 selectinload(InterviewSession.evaluation),
             )
-            .order_by(InterviewSession.created_at.desc())
-            .limit(limit)
-            .offset(offset)
+            .order_by(InterviewSession.created_at.desc(), InterviewSession.id.desc())
+            .limit(limit + 1)
         )
+        if cursor:
+            stmt = stmt.where(after_cursor(InterviewSession.created_at, InterviewSession.id, cursor))
+            offset = 0
+        else:
+            stmt = stmt.offset(offset)
         result = await self.db.execute(stmt)
-        sessions = result.scalars().all()
+        sessions = list(result.scalars().all())
 
         return {
             "sessions": [
@@ -121,11 +132,12 @@ class AdminService:
                     else None,
                     "duration_seconds": session.duration_seconds,
                 }
-                for session in sessions
+                for session in sessions[:limit]
             ],
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor(sessions, limit, "created_at"),
         }
 
     async def get_statistics(self) -> dict[str, Any]:
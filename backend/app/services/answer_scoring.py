@@ -0,0 +1,248 @@
+"""Scoring of interview answers.
+
+Each answered question is scored 0-100 on the Japanese proficiency
+categories (vocabulary, grammar, content, honorifics) by a scorer backend.
+The OpenAI backend asks the chat model for a JSON verdict with the prompt
+of the PoC evaluation service; session totals weight the category scores
+by JLPT level (``jlpt_config`` weights).
+"""
+
+import json
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.core.config import settings
+
+CATEGORIES = ("vocabulary", "grammar", "content", "honorifics")
+
+# Fallback weights when the JLPT config is unavailable
+DEFAULT_JLPT_WEIGHTS: dict[str, dict[str, float]] = {
+    "N1": {"vocabulary": 0.20, "grammar": 0.20, "content": 0.25, "honorifics": 0.35},
+    "N2": {"vocabulary": 0.20, "grammar": 0.25, "content": 0.25, "honorifics": 0.30},
+    "N3": {"vocabulary": 0.25, "grammar": 0.30, "content": 0.25, "honorifics": 0.20},
+    "N4": {"vocabulary": 0.30, "grammar": 0.35, "content": 0.25, "honorifics": 0.10},
+    "N5": {"vocabulary": 0.35, "grammar": 0.40, "content": 0.20, "honorifics": 0.05},
+}
+
+DEFAULT_WEAK_POINT_THRESHOLD = 70
+
+_LEVEL_GUIDANCE = {
+    "N1": """- ビジネス即戦力レベル
+- 尊敬語・謙譲語の使い分けを厳しく評価
+- 論理的思考と逆質問の妥当性を重視
+- 専門用語の適切な使用を確認""",
+    "N3": """- 実務・接客対応レベル
+- 丁寧語（です・ます）の維持を確認
+- 質問の意図解釈能力を評価
+- 定型表現の使用を確認""",
+    "N4": """- 基本意思疎通レベル
+- 基本挨拶の使用を確認
+- 語順の正しさを重視
+- 聞き取りと応答の適切さを評価""",
+}
+_LEVEL_GUIDANCE["N2"] = _LEVEL_GUIDANCE["N1"]
+_LEVEL_GUIDANCE["N5"] = _LEVEL_GUIDANCE["N4"]
+
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
+class ScoringError(Exception):
+    """Raised when an answer cannot be scored."""
+
+
+@dataclass
+class AnswerScore:
+    """Category scores and feedback of one answer."""
+
+    scores: dict[str, int]
+    feedback: dict[str, str] = field(default_factory=dict)
+    overall_feedback: str = ""
+
+
+def system_prompt(jlpt_level: str) -> str:
+    """System prompt of the scoring model."""
+    return f"""あなたは日本語能力試験（JLPT）の評価専門家です。
+外国人求職者の面接練習における回答を評価し、改善点を具体的にフィードバックします。
+
+評価対象者のJLPTレベル: {jlpt_level}
+評価基準:
+1. 語彙（vocabulary）: 適切な語彙選択、語彙の豊富さ、専門用語の使用
+2. 文法（grammar）: 文法の正確性、文構造、接続表現の適切さ
+3. 内容（content）: 質問への適切な応答、論理性、具体例の使用
+4. 敬語（honorifics）: 尊敬語・謙譲語・丁寧語の正確な使い分け
+
+JLPTレベル別の評価重点:
+{_LEVEL_GUIDANCE.get(jlpt_level, "")}
+
+出力形式はJSON形式で、以下の構造に従ってください。"""
+
+
+def user_prompt(question: str, answer: str, criteria: list[str]) -> str:
+    """User prompt asking for the verdict on one answer."""
+    criteria_text = "、".join(criteria) if criteria else "明瞭さ、構成、適切な敬語使用"
+    return f"""以下の面接質問に対する回答を評価してください。
+
+【質問】
+{question}
+
+【回答】
+{answer}
+
+【評価基準】
+{criteria_text}
+
+以下のJSON形式で回答してください:
+{{
+  "scores": {{
+    "vocabulary": <0-100の整数>,
+    "grammar": <0-100の整数>,
+    "content": <0-100の整数>,
+    "honorifics": <0-100の整数>
+  }},
+  "feedback": {{
+    "vocabulary": "<具体的なフィードバック>",
+    "grammar": "<具体的なフィードバック>",
+    "content": "<具体的なフィードバック>",
+    "honorifics": "<具体的なフィードバック>"
+  }},
+  "overall_feedback": "<全体的な総評>"
+}}"""
+
+
+def parse_answer_score(text: str) -> AnswerScore:
+    """Parse the model's JSON verdict (optionally in a ```json block)."""
+    match = _JSON_BLOCK_RE.search(text)
+    try:
+        data = json.loads(match.group(1) if match else text)
+    except json.JSONDecodeError as e:
+        raise ScoringError(f"Invalid scoring response: {e}")
+
+    raw_scores = data.get("scores") if isinstance(data, dict) else None
+    if not isinstance(raw_scores, dict):
+        raise ScoringError("Invalid scoring response: missing scores")
+    scores = {}
+    for category in CATEGORIES:
+        value = raw_scores.get(category)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ScoringError(f"Invalid scoring response: missing {category} score")
+        scores[category] = max(0, min(100, round(value)))
+
+    raw_feedback = data.get("feedback")
+    feedback = raw_feedback if isinstance(raw_feedback, dict) else {}
+    return AnswerScore(
+        scores=scores,
+        feedback={c: str(feedback.get(c) or "") for c in CATEGORIES},
+        overall_feedback=str(data.get("overall_feedback") or ""),
+    )
+
+
+def weighted_total(scores: dict[str, int], weights: dict[str, float]) -> int:
+    """Total score of category scores weighted for a JLPT level."""
+    return round(sum(scores[c] * weights.get(c, 0.0) for c in CATEGORIES))
+
+
+def weak_point_description(category: str, score: int) -> str:
+    """Description of a category scored below the weak point threshold."""
+    severity = "大きな改善が必要" if score < 50 else "改善の余地あり"
+    subject = {
+        "vocabulary": "語彙力に",
+        "grammar": "文法に",
+        "content": "回答内容に",
+        "honorifics": "敬語の使用に",
+    }.get(category, "")
+    return f"{subject}{severity}です"
+
+
+class AnswerScorer(ABC):
+    """Interface of answer scoring backends."""
+
+    name: str
+
+    @abstractmethod
+    async def score(
+        self,
+        question: str,
+        answer: str,
+        jlpt_level: str,
+        criteria: list[str],
+    ) -> AnswerScore:
+        """Score an answer to a question."""
+
+
+class OpenAIAnswerScorer(AnswerScorer):
+    """OpenAI chat completions."""
+
+    name = "openai"
+
+    def __init__(self, model: str | None = None) -> None:
+        self.model = model or settings.openai_model
+        self._client: Any = None
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        return self._client
+
+    async def score(
+        self,
+        question: str,
+        answer: str,
+        jlpt_level: str,
+        criteria: list[str],
+    ) -> AnswerScore:
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt(jlpt_level)},
+                    {"role": "user", "content": user_prompt(question, answer, criteria)},
+                ],
+                response_format={"type": "json_object"},
+                temperature=0,
+            )
+        except Exception as e:
+            raise ScoringError(str(e))
+        return parse_answer_score(response.choices[0].message.content or "")
+
+
+class FakeAnswerScorer(AnswerScorer):
+    """Offline backend for development and tests (scores by answer length)."""
+
+    name = "fake"
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, str, str]] = []
+
+    async def score(
+        self,
+        question: str,
+        answer: str,
+        jlpt_level: str,
+        criteria: list[str],
+    ) -> AnswerScore:
+        self.calls.append((question, answer, jlpt_level))
+        length = len(answer)
+        if length < 20:
+            base = 50
+        elif length < 50:
+            base = 65
+        elif length < 100:
+            base = 75
+        else:
+            base = 85
+        return AnswerScore(scores=dict.fromkeys(CATEGORIES, base))
+
+
+def create_answer_scorer(name: str | None = None) -> AnswerScorer:
+    """Create an answer scorer by name."""
+    name = name or settings.evaluation_scoring_backend
+    if name == "openai":
+        return OpenAIAnswerScorer()
+    if name == "fake":
+        return FakeAnswerScorer()
+    raise ValueError(f"Unknown scoring backend: {name}")
@@ -1,8 +1,10 @@
 """Service for evaluation config CRUD operations."""
 
 import uuid
+from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.evaluation_config import EvaluationConfig, EvaluationConfigHistory
@@ -46,38 +48,83 @@ class ConfigService:
         admin_id: str,
     ) -> EvaluationConfigResponse | None:
         """Update an evaluation config with validation and history tracking."""
-        config = await self._get_by_key(config_key)
-        if config is None:
-            return None
-
         # Validate the new config value
-        validated_value = validate_config_value(config_key, request.config_value)
-
-        # Store previous value for history
-        previous_value = config.config_value
-
-        # Create history record
-        history = EvaluationConfigHistory(
-            config_id=config.id,
-            config_key=config_key,
-            previous_value=previous_value,
-            new_value=validated_value,
-            version=config.version + 1,
-            changed_by=uuid.UUID(admin_id),
+        try:
+            validated_value = validate_config_value(config_key, request.config_value)
+        except ValueError:
+            # Keys that do not exist are not found rather than invalid
+            if await self._get_by_key(config_key) is None:
+                return None
+            raise
+        admin_uuid = uuid.UUID(admin_id)
+
+        # Lock the current row; its value becomes the history's previous value
+        current = (
+            select(
+                EvaluationConfig.id,
+                EvaluationConfig.config_value,
+                EvaluationConfig.version,
+            )
+            .where(EvaluationConfig.config_key == config_key)
+            .with_for_update()
+            .cte("current_config")
+        )
+
+        # Create history record (runs as part of the update statement)
+        history = (
+            insert(EvaluationConfigHistory)
+            .from_select(
+                [
+                    "id",
+                    "config_id",
+                    "config_key",
+                    "previous_value",
+                    "new_value",
+                    "version",
+                    "changed_by",
+                    "changed_at",
+                ],
+                select(
+                    func.gen_random_uuid(),
+                    current.c.id,
+                    literal(config_key),
+                    current.c.config_value,
+                    literal(validated_value, JSONB),
+                    current.c.version + 1,
+                    literal(admin_uuid, UUID(as_uuid=True)),
+                    func.now(),
+                ),
+            )
+            .cte("config_history")
         )
-        self.db.add(history)
 
         # Update config
-        config.config_value = validated_value
-        config.version += 1
-        config.updated_by = uuid.UUID(admin_id)
+        values: dict[str, Any] = {
+            "config_value": validated_value,
+            "version": current.c.version + 1,
+            "updated_by": admin_uuid,
+            "updated_at": func.now(),
+        }
         if request.description is not None:
-            config.description = request.description
+            values["description"] = request.description
+
+        stmt = (
+            update(EvaluationConfig)
+            .add_cte(history)
+            .where(EvaluationConfig.id == current.c.id)
+            .values(**values)
+            # Plain columns: the ORM cannot load entities from UPDATE ... FROM
+            .returning(*EvaluationConfig.__table__.c)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
 
         await self.db.commit()
-        await self.db.refresh(config)
 
-        return self._to_response(config)
+        return self._to_response(row)
 
     async def get_config_history(
         self,
@@ -130,8 +177,8 @@ class ConfigService:
         return result.scalar_one_or_none()
 
     @staticmethod
-    def _to_response(config: EvaluationConfig) -> EvaluationConfigResponse:
-        """Convert model to response schema."""
+    def _to_response(config: EvaluationConfig | Row[Any]) -> EvaluationConfigResponse:
+        """Convert model (or a row of its columns) to response schema."""
         return EvaluationConfigResponse(
             id=str(config.id),
             config_key=config.config_key,
@@ -0,0 +1,108 @@
+"""Server-sent event stream of a session's evaluation.
+
+Replaces polling ``GET /evaluations/{session_id}``: the stream sends the
+current job status, then the progress events evaluation workers publish on
+the session channel (``app.services.session_channel``), and finally the
+evaluation itself, after which it ends. Evaluations are read from the
+database once, when the job reports success, instead of on every poll.
+"""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.session import async_session_factory
+from app.services.evaluation_jobs import JOB_FAILED, JOB_SUCCEEDED
+from app.services.evaluation_service import EvaluationService
+from app.services.session_channel import SessionChannel, SessionEvent
+
+logger = get_logger(__name__)
+
+
+def format_sse(event: str, data: Any, event_id: str | None = None) -> str:
+    """Format one server-sent event."""
+    if isinstance(data, BaseModel):
+        data = data.model_dump(mode="json")
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    lines.append(f"data: {json.dumps(data, ensure_ascii=False, default=str)}")
+    return "\n".join(lines) + "\n\n"
+
+
+async def evaluation_event_stream(
+    session_id: str,
+    user_id: str,
+    channel: SessionChannel,
+) -> AsyncIterator[str]:
+    """Stream job progress and the evaluation of a session.
+
+    Events: ``job`` (current status), ``progress`` (worker updates),
+    ``evaluation`` (final result) or ``failed``. Comment lines are sent as
+    keep-alives.
+    """
+    metrics.inc("evaluation_sse_streams")
+    # Position the channel before reading the job, so no update is lost
+    await channel.mark_position()
+    async with async_session_factory() as db:
+        _, job = await EvaluationService(db).get_session_job(session_id, user_id)
+
+    if job is not None:
+        yield format_sse("job", job)
+        if job.status == JOB_SUCCEEDED:
+            yield await _evaluation_event(session_id, user_id)
+            return
+        if job.status == JOB_FAILED:
+            yield format_sse("failed", job)
+            return
+
+    queue: asyncio.Queue[SessionEvent] = asyncio.Queue()
+
+    async def _read() -> None:
+        try:
+            async for event in channel.events():
+                await queue.put(event)
+        except Exception as e:
+            logger.exception("Evaluation event stream failed", session_id=session_id, error=str(e))
+            raise
+
+    reader = asyncio.create_task(_read())
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(
+                    queue.get(),
+                    timeout=settings.evaluation_sse_keepalive_seconds,
+                )
+            except asyncio.TimeoutError:
+                if reader.done():
+                    return
+                yield ": keep-alive\n\n"
+                continue
+
+            if event.type == "evaluation_progress":
+                yield format_sse("progress", event.data, event.id)
+            elif event.type == "evaluation":
+                if event.data.get("status") == JOB_SUCCEEDED:
+                    yield await _evaluation_event(session_id, user_id, event.id)
+                else:
+                    yield format_sse("failed", event.data, event.id)
+                return
+    finally:
+        reader.cancel()
+
+
+async def _evaluation_event(session_id: str, user_id: str, event_id: str | None = None) -> str:
+    async with async_session_factory() as db:
+        evaluation = await EvaluationService(db).get_evaluation(session_id, user_id)
+    if evaluation is None:
+        # Job succeeded without producing an evaluation
+        return format_sse("failed", {"status": JOB_SUCCEEDED, "evaluation_id": None}, event_id)
+    return format_sse("evaluation", evaluation, event_id)
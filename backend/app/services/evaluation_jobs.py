@@ -0,0 +1,320 @@
+"""Durable evaluation job queue backed by Postgres.
+
+Completing a session inserts a row into ``evaluation_jobs`` in the same
+transaction; evaluation workers (``python -m app.workers.evaluation_worker``)
+claim due jobs with ``FOR UPDATE SKIP LOCKED`` so several workers never pick
+the same job. Jobs whose worker died are reclaimed once their lease expires,
+and a per-session advisory lock keeps a reclaimed job from running while the
+original worker is still evaluating. A running worker renews its lease, and
+records an outcome only while it still holds the job. Failures (including an
+evaluator that produces no evaluation) are retried with exponential backoff
+up to ``evaluation_job_max_attempts``.
+"""
+
+import asyncio
+import random
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, func, or_, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.session import async_session_factory
+from app.models.evaluation import EvaluationJob
+from app.services.session_channel import publish_session_event
+
+logger = get_logger(__name__)
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# Evaluates a session and returns the evaluation ID (if one was produced)
+Evaluator = Callable[[AsyncSession, UUID], Awaitable[UUID | None]]
+
+
+async def enqueue_evaluation(db: AsyncSession, session_id: UUID) -> UUID:
+    """Queue the evaluation of a session, returning the (existing) job ID.
+
+    Does not commit, so the job is created atomically with the caller's
+    changes.
+    """
+    now = datetime.now(timezone.utc)
+    stmt = (
+        insert(EvaluationJob)
+        .values(
+            id=uuid.uuid4(),
+            session_id=session_id,
+            status=JOB_PENDING,
+            attempts=0,
+            run_at=now,
+            created_at=now,
+            updated_at=now,
+        )
+        .on_conflict_do_nothing(index_elements=[EvaluationJob.session_id])
+        .returning(EvaluationJob.id)
+    )
+    result = await db.execute(stmt)
+    job_id = result.scalar_one_or_none()
+    if job_id is None:
+        existing = await db.execute(
+            select(EvaluationJob.id).where(EvaluationJob.session_id == session_id)
+        )
+        job_id = existing.scalar_one()
+    return job_id
+
+
+def retry_delay(attempts: int) -> float:
+    """Backoff before retrying a job that failed on its nth attempt."""
+    delay = settings.evaluation_job_backoff_seconds * 2 ** max(0, attempts - 1)
+    # Jitter so jobs failing together do not retry together
+    delay *= random.uniform(0.8, 1.2)
+    return float(min(delay, settings.evaluation_job_backoff_max_seconds))
+
+
+async def _default_evaluator(db: AsyncSession, session_id: UUID) -> UUID | None:
+    from app.services.evaluation_service import EvaluationService
+
+    return await EvaluationService(db).evaluate_session(session_id)
+
+
+class EvaluationJobWorker:
+    """Claims and runs evaluation jobs."""
+
+    def __init__(
+        self,
+        evaluate: Evaluator | None = None,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        worker_id: str | None = None,
+        concurrency: int | None = None,
+    ) -> None:
+        self.evaluate = evaluate or _default_evaluator
+        self.session_factory = session_factory
+        self.worker_id = worker_id or f"evaluation-worker-{uuid.uuid4().hex[:8]}"
+        self.concurrency = concurrency or settings.evaluation_worker_concurrency
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        """Claim and run jobs until stopped."""
+        logger.info("Evaluation worker started", worker=self.worker_id)
+
+        while not self._stopping.is_set():
+            free = self.concurrency - len(self._tasks)
+            claimed = []
+            if free > 0:
+                try:
+                    claimed = await self._claim(free)
+                except Exception as e:
+                    logger.warning("Evaluation job claim failed", error=str(e))
+
+            for job_id, session_id, attempts in claimed:
+                task = asyncio.create_task(self._run(job_id, session_id, attempts))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+            if not claimed:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(),
+                        timeout=settings.evaluation_worker_poll_seconds,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info("Evaluation worker stopped", worker=self.worker_id)
+
+    def stop(self) -> None:
+        """Ask the worker to stop after running jobs finish."""
+        self._stopping.set()
+
+    async def _claim(self, limit: int) -> list[tuple[UUID, UUID, int]]:
+        """Mark due jobs (and jobs with expired leases) as running by this worker."""
+        now = datetime.now(timezone.utc)
+        lease_expired = now - timedelta(seconds=settings.evaluation_job_lease_seconds)
+        candidates = (
+            select(EvaluationJob.id)
+            .where(
+                or_(
+                    and_(EvaluationJob.status == JOB_PENDING, EvaluationJob.run_at <= now),
+                    and_(EvaluationJob.status == JOB_RUNNING, EvaluationJob.locked_at < lease_expired),
+                )
+            )
+            .order_by(EvaluationJob.run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        stmt = (
+            update(EvaluationJob)
+            .where(EvaluationJob.id.in_(candidates))
+            .values(
+                status=JOB_RUNNING,
+                attempts=EvaluationJob.attempts + 1,
+                locked_by=self.worker_id,
+                locked_at=now,
+                updated_at=now,
+            )
+            .returning(EvaluationJob.id, EvaluationJob.session_id, EvaluationJob.attempts)
+        )
+        async with self.session_factory() as db:
+            result = await db.execute(stmt)
+            rows = [(job_id, session_id, attempts) for job_id, session_id, attempts in result.all()]
+            await db.commit()
+        return rows
+
+    async def _run(self, job_id: UUID, session_id: UUID, attempts: int) -> None:
+        """Evaluate a session and record the outcome on its job."""
+        log = logger.bind(job_id=str(job_id), session_id=str(session_id), attempt=attempts)
+        await publish_session_event(
+            session_id,
+            "evaluation_progress",
+            {"job_id": str(job_id), "status": JOB_RUNNING, "attempts": attempts},
+        )
+        heartbeat = asyncio.create_task(self._renew_lease(job_id))
+        try:
+            async with self.session_factory() as db:
+                # Held until commit, i.e. while the evaluation is being written
+                lock = await db.execute(
+                    select(func.pg_try_advisory_xact_lock(func.hashtextextended(str(session_id), 0)))
+                )
+                if not lock.scalar():
+                    raise RuntimeError("Session is being evaluated by another worker")
+
+                evaluation_id = await self.evaluate(db, session_id)
+                if evaluation_id is None:
+                    raise RuntimeError("No evaluation was produced")
+                now = datetime.now(timezone.utc)
+                result = await db.execute(
+                    update(EvaluationJob)
+                    .where(*self._owned(job_id))
+                    .values(
+                        status=JOB_SUCCEEDED,
+                        evaluation_id=evaluation_id,
+                        locked_by=None,
+                        locked_at=None,
+                        last_error=None,
+                        finished_at=now,
+                        updated_at=now,
+                    )
+                    .returning(EvaluationJob.id)
+                )
+                if result.first() is None:
+                    await db.rollback()
+                    metrics.inc("evaluation_jobs_lease_lost")
+                    log.warning("Evaluation job lease lost; result discarded")
+                    return
+                await db.commit()
+        except Exception as e:
+            log.warning("Evaluation job failed", error=str(e))
+            await self._fail(job_id, session_id, attempts, e)
+            return
+        finally:
+            heartbeat.cancel()
+
+        metrics.inc("evaluation_jobs_succeeded")
+        log.info("Evaluation job succeeded")
+        await publish_session_event(
+            session_id,
+            "evaluation",
+            {
+                "job_id": str(job_id),
+                "status": JOB_SUCCEEDED,
+                "evaluation_id": str(evaluation_id),
+            },
+        )
+
+    def _owned(self, job_id: UUID) -> tuple[ColumnElement[bool], ...]:
+        """Conditions matching the job only while this worker holds its lease."""
+        return (
+            EvaluationJob.id == job_id,
+            EvaluationJob.locked_by == self.worker_id,
+            EvaluationJob.status == JOB_RUNNING,
+        )
+
+    async def _renew_lease(self, job_id: UUID) -> None:
+        """Keep the job's lease from expiring while it runs (until cancelled)."""
+        interval = settings.evaluation_job_lease_seconds / 3
+        while True:
+            await asyncio.sleep(interval)
+            now = datetime.now(timezone.utc)
+            try:
+                async with self.session_factory() as db:
+                    result = await db.execute(
+                        update(EvaluationJob)
+                        .where(*self._owned(job_id))
+                        .values(locked_at=now, updated_at=now)
+                        .returning(EvaluationJob.id)
+                    )
+                    renewed = result.first() is not None
+                    await db.commit()
+            except Exception as e:
+                logger.warning("Evaluation job lease renewal failed", job_id=str(job_id), error=str(e))
+                continue
+            if not renewed:
+                logger.warning("Evaluation job lease lost", job_id=str(job_id))
+                return
+
+    async def _fail(self, job_id: UUID, session_id: UUID, attempts: int, error: Exception) -> None:
+        """Schedule a retry, or mark the job failed once attempts run out."""
+        now = datetime.now(timezone.utc)
+        values: dict[str, Any] = {
+            "locked_by": None,
+            "locked_at": None,
+            "last_error": str(error)[:1000],
+            "updated_at": now,
+        }
+        if attempts >= settings.evaluation_job_max_attempts:
+            values.update(status=JOB_FAILED, finished_at=now)
+        else:
+            values.update(status=JOB_PENDING, run_at=now + timedelta(seconds=retry_delay(attempts)))
+
+        try:
+            async with self.session_factory() as db:
+                result = await db.execute(
+                    update(EvaluationJob)
+                    .where(*self._owned(job_id))
+                    .values(**values)
+                    .returning(EvaluationJob.id)
+                )
+                owned = result.first() is not None
+                await db.commit()
+        except Exception as e:
+            # The lease will expire and another worker will pick the job up
+            logger.exception("Failed to record evaluation job failure", job_id=str(job_id), error=str(e))
+            return
+        if not owned:
+            metrics.inc("evaluation_jobs_lease_lost")
+            logger.warning("Evaluation job lease lost; failure not recorded", job_id=str(job_id))
+            return
+
+        if values["status"] == JOB_FAILED:
+            metrics.inc("evaluation_jobs_failed")
+            logger.error("Evaluation job retries exhausted", job_id=str(job_id), attempts=attempts)
+            await publish_session_event(
+                session_id,
+                "evaluation",
+                {"job_id": str(job_id), "status": JOB_FAILED, "evaluation_id": None},
+            )
+        else:
+            metrics.inc("evaluation_jobs_retried")
+            await publish_session_event(
+                session_id,
+                "evaluation_progress",
+                {
+                    "job_id": str(job_id),
+                    "status": JOB_PENDING,
+                    "attempts": attempts,
+                    "run_at": values["run_at"].isoformat(),
+                },
+            )
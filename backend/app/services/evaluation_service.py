@@ -1,18 +1,25 @@
 """Evaluation service for evaluation management."""
 
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from app.models.evaluation import AptitudeEvaluation, Evaluation, EvaluationDetail
+from app.core.config import settings
+from app.models.evaluation import AptitudeEvaluation, Evaluation, EvaluationDetail, EvaluationJob
 from app.models.evaluation_config import EvaluationConfig
-from app.models.interview import InterviewSession
+from app.models.interview import InterviewSession, SessionAnswer
 from app.models.user import User, WeakPoint
 from app.schemas.evaluation import (
     Aptitude,
     AptitudeFeedback,
     AptitudeScores,
     AptitudeSummary,
+    EvaluationJobResponse,
     EvaluationResponse,
     EvaluationSummaryResponse,
     JapaneseProficiency,
@@ -23,6 +30,17 @@ from app.schemas.evaluation import (
     WeakPointResponse,
     WeakPointSummary,
 )
+from app.services.answer_scoring import (
+    CATEGORIES,
+    DEFAULT_JLPT_WEIGHTS,
+    DEFAULT_WEAK_POINT_THRESHOLD,
+    AnswerScore,
+    AnswerScorer,
+    create_answer_scorer,
+    weak_point_description,
+    weighted_total,
+)
+from app.services.config_service import ConfigService
 
 # Default grade thresholds (used as fallback when DB config is unavailable)
 DEFAULT_GRADE_THRESHOLDS = [
@@ -153,6 +171,221 @@ class EvaluationService:
             evaluated_at=evaluation.evaluated_at,
         )
 
+    async def get_job(self, job_id: str, user_id: str) -> EvaluationJobResponse | None:
+        """Get the status of an evaluation job of the user's session."""
+        stmt = (
+            select(EvaluationJob)
+            .join(InterviewSession, InterviewSession.id == EvaluationJob.session_id)
+            .where(
+                EvaluationJob.id == job_id,
+                InterviewSession.user_id == user_id,
+            )
+        )
+        result = await self.db.execute(stmt)
+        job = result.scalar_one_or_none()
+
+        if job is None:
+            return None
+
+        return self._to_job_response(job)
+
+    async def get_session_job(
+        self,
+        session_id: str,
+        user_id: str,
+    ) -> tuple[bool, EvaluationJobResponse | None]:
+        """Get the evaluation job of the user's session.
+
+        Returns whether the session exists, and its job (None until the
+        session is completed).
+        """
+        stmt = (
+            select(InterviewSession.id, EvaluationJob)
+            .outerjoin(EvaluationJob, EvaluationJob.session_id == InterviewSession.id)
+            .where(
+                InterviewSession.id == session_id,
+                InterviewSession.user_id == user_id,
+            )
+        )
+        result = await self.db.execute(stmt)
+        row = result.one_or_none()
+
+        if row is None:
+            return False, None
+
+        job = row.EvaluationJob
+        return True, self._to_job_response(job) if job is not None else None
+
+    @staticmethod
+    def _to_job_response(job: EvaluationJob) -> EvaluationJobResponse:
+        return EvaluationJobResponse(
+            job_id=str(job.id),
+            session_id=str(job.session_id),
+            status=job.status,
+            attempts=job.attempts,
+            evaluation_id=str(job.evaluation_id) if job.evaluation_id else None,
+            last_error=job.last_error,
+            created_at=job.created_at,
+            updated_at=job.updated_at,
+            finished_at=job.finished_at,
+        )
+
+    async def evaluate_session(
+        self,
+        session_id: UUID,
+        scorer: AnswerScorer | None = None,
+    ) -> UUID | None:
+        """Evaluate a completed session (run by evaluation workers).
+
+        Scores each answered question, averages the category scores and
+        weights them by the script's JLPT level, stores the evaluation with
+        its details and records weak points. Does not commit; the worker
+        commits together with the job outcome. Scoring errors and answers
+        still being transcribed raise, so the job is retried.
+        """
+        existing = await self.db.execute(
+            select(Evaluation.id).where(Evaluation.session_id == session_id)
+        )
+        evaluation_id = existing.scalar_one_or_none()
+        if evaluation_id is not None:
+            return evaluation_id
+
+        stmt = (
+            select(InterviewSession)
+            .where(InterviewSession.id == session_id)
+            .options(
+                selectinload(InterviewSession.script),
+                selectinload(InterviewSession.answers).selectinload(SessionAnswer.question),
+            )
+        )
+        result = await self.db.execute(stmt)
+        session = result.scalar_one_or_none()
+        if session is None:
+            return None
+
+        now = datetime.now(timezone.utc)
+        # Transcription of answers recorded just before completion may still be running
+        transcribing_since = now - timedelta(seconds=settings.transcription_timeout_seconds * 2)
+        answers = []
+        for answer in sorted(session.answers, key=lambda a: a.question_order):
+            if answer.transcript:
+                answers.append(answer)
+            elif not answer.skipped and answer.audio_url and answer.answered_at > transcribing_since:
+                raise RuntimeError("Answers are still being transcribed")
+
+        jlpt_level = session.script.jlpt_level
+        scorer = scorer or create_answer_scorer()
+        semaphore = asyncio.Semaphore(settings.evaluation_scoring_max_concurrency)
+
+        async def score(answer: SessionAnswer) -> AnswerScore:
+            criteria = answer.question.evaluation_criteria or {}
+            async with semaphore:
+                return await scorer.score(
+                    answer.question.question_text,
+                    answer.transcript or "",
+                    jlpt_level,
+                    list(criteria),
+                )
+
+        answer_scores = await asyncio.gather(*(score(a) for a in answers))
+
+        scores: dict[str, int] = {}
+        feedback: dict[str, str] = {}
+        for category in CATEGORIES:
+            if not answer_scores:
+                scores[category] = 0
+                feedback[category] = ""
+                continue
+            scores[category] = round(
+                sum(s.scores[category] for s in answer_scores) / len(answer_scores)
+            )
+            # Feedback of the weakest answer is the most actionable
+            weakest = min(answer_scores, key=lambda s: s.scores[category])
+            feedback[category] = weakest.feedback.get(category, "")
+
+        if answer_scores:
+            overall_feedback = "\n".join(
+                f"Q{a.question_order}: {s.overall_feedback}"
+                for a, s in zip(answers, answer_scores, strict=True)
+                if s.overall_feedback
+            )
+        else:
+            overall_feedback = "回答がありませんでした。"
+
+        jlpt_config = await ConfigService(self.db).get_config("jlpt_config")
+        weights = (jlpt_config.config_value.get("weights", {}) if jlpt_config else {}).get(
+            jlpt_level
+        ) or DEFAULT_JLPT_WEIGHTS.get(jlpt_level, DEFAULT_JLPT_WEIGHTS["N3"])
+
+        evaluation = Evaluation(
+            session_id=session_id,
+            total_score=weighted_total(scores, weights),
+            overall_feedback=overall_feedback,
+            evaluated_at=now,
+            created_at=now,
+            details=[
+                EvaluationDetail(
+                    category=category,
+                    score=scores[category],
+                    feedback=feedback[category] or None,
+                    created_at=now,
+                )
+                for category in CATEGORIES
+            ],
+        )
+        self.db.add(evaluation)
+        if answer_scores:
+            await self._record_weak_points(session.user_id, scores, now)
+        await self.db.flush()
+        return evaluation.id
+
+    async def _record_weak_points(
+        self,
+        user_id: UUID,
+        scores: dict[str, int],
+        now: datetime,
+    ) -> None:
+        """Add or re-occur the user's weak points for categories below the threshold."""
+        weak_point_config = await ConfigService(self.db).get_config("weak_point_config")
+        config = weak_point_config.config_value if weak_point_config else {}
+        threshold = config.get("threshold", DEFAULT_WEAK_POINT_THRESHOLD)
+        priority = config.get("priority", {})
+
+        weak = {c: score for c, score in scores.items() if score < threshold}
+        if not weak:
+            return
+
+        stmt = select(WeakPoint).where(
+            WeakPoint.user_id == user_id,
+            WeakPoint.category.in_(weak),
+            WeakPoint.resolved == False,
+        )
+        result = await self.db.execute(stmt)
+        existing = {wp.category: wp for wp in result.scalars().all()}
+
+        for category, score in weak.items():
+            weak_point = existing.get(category)
+            if weak_point is None:
+                weak_point = WeakPoint(user_id=user_id, category=category, occurrence_count=0)
+                self.db.add(weak_point)
+            weak_point.occurrence_count += 1
+            weak_point.last_occurred_at = now
+            weak_point.description = weak_point_description(category, score)
+            weak_point.priority = self._weak_point_priority(weak_point.occurrence_count, priority)
+
+    @staticmethod
+    def _weak_point_priority(occurrence_count: int, config: dict[str, Any]) -> str:
+        """Priority of a weak point that has just occurred again."""
+        # Occurrences weighted, plus the full recency window as it occurred today
+        score = occurrence_count * config.get("occurrenceMultiplier", 10) + config.get(
+            "recencyWindowDays", 30
+        )
+        if score >= config.get("highThreshold", 50):
+            return "high"
+        if score >= config.get("mediumThreshold", 25):
+            return "medium"
+        return "low"
+
     async def _load_grade_thresholds(self) -> list[dict]:
         """Load grade thresholds from DB config, falling back to defaults."""
         stmt = select(EvaluationConfig).where(
@@ -0,0 +1,132 @@
+"""Compact positional encoding of face analysis results.
+
+High-rate clients can request results as a short JSON array instead of the
+full ``FaceAnalysisResponse``. Enumerations and the fixed feedback messages
+are replaced with numeric codes; the code tables are served once by
+``GET /face/codes``.
+
+Layout (``None`` for absent parts, booleans as 0/1)::
+
+    [version, success, face_detected,
+     [x, y, w, h],
+     [angry, disgust, fear, happy, sad, surprise, neutral],
+     [tension_level, relax_level, dominant_emotion, feedback_message, feedback_type],
+     [average_brightness, brightness_status],
+     [yaw, pitch, roll, is_looking_at_camera, face_direction, feedback_message],
+     error_message]
+
+Messages that are not in the table (e.g. exception details) are sent as text.
+"""
+
+import json
+from typing import Any
+
+from app.schemas.face_analysis import FaceAnalysisResponse, FaceCodeTablesResponse
+from app.services import face_messages
+
+# Bump whenever a table below changes so clients refetch the tables
+CODE_TABLE_VERSION = 1
+
+EMOTIONS = ["angry", "disgust", "fear", "happy", "sad", "surprise", "neutral"]
+FACE_DIRECTIONS = ["center", "left", "right", "up", "down", "away"]
+FEEDBACK_TYPES = ["positive", "neutral", "negative"]
+BRIGHTNESS_STATUSES = ["ok", "too_dark", "too_bright", "unknown"]
+# Codes are list positions: append only
+MESSAGES = [
+    # Tension feedback
+    face_messages.TENSE,
+    face_messages.SLIGHTLY_TENSE,
+    face_messages.RELAXED,
+    face_messages.CALM,
+    face_messages.NATURAL,
+    # Head pose feedback
+    face_messages.LOOKING_AT_CAMERA,
+    face_messages.FACING_LEFT,
+    face_messages.FACING_RIGHT,
+    face_messages.FACING_UP,
+    face_messages.FACING_DOWN,
+    face_messages.FACING_AWAY,
+    # Errors
+    face_messages.INVALID_IMAGE,
+    face_messages.TOO_DARK,
+    face_messages.TOO_BRIGHT,
+    face_messages.NO_FACE,
+]
+
+_MESSAGE_CODES = {message: code for code, message in enumerate(MESSAGES)}
+
+
+def get_code_tables() -> FaceCodeTablesResponse:
+    """Get the code-to-value tables used by the compact encoding."""
+    return FaceCodeTablesResponse(
+        version=CODE_TABLE_VERSION,
+        emotions=EMOTIONS,
+        face_directions=FACE_DIRECTIONS,
+        feedback_types=FEEDBACK_TYPES,
+        brightness_statuses=BRIGHTNESS_STATUSES,
+        messages=MESSAGES,
+    )
+
+
+def _code(table: list[str], value: str) -> int | str:
+    """Encode a value as its table index, or pass it through if unknown."""
+    try:
+        return table.index(value)
+    except ValueError:
+        return value
+
+
+def _message_code(message: str | None) -> int | str | None:
+    """Encode a feedback message as its code, or pass it through if unknown."""
+    if message is None:
+        return None
+    return _MESSAGE_CODES.get(message, message)
+
+
+def encode_compact(response: FaceAnalysisResponse) -> list[Any]:
+    """Encode a face analysis response as a positional array."""
+    region = response.face_region
+    emotions = response.emotions
+    tension = response.tension
+    quality = response.image_quality
+    pose = response.head_pose
+
+    return [
+        CODE_TABLE_VERSION,
+        int(response.success),
+        int(response.face_detected),
+        [region.x, region.y, region.w, region.h] if region else None,
+        [round(getattr(emotions, e), 1) for e in EMOTIONS] if emotions else None,
+        [
+            tension.tension_level,
+            tension.relax_level,
+            _code(EMOTIONS, tension.dominant_emotion),
+            _message_code(tension.feedback_message),
+            _code(FEEDBACK_TYPES, tension.feedback_type),
+        ]
+        if tension
+        else None,
+        [round(quality.average_brightness), _code(BRIGHTNESS_STATUSES, quality.brightness_status)]
+        if quality
+        else None,
+        [
+            pose.yaw,
+            pose.pitch,
+            pose.roll,
+            int(pose.is_looking_at_camera),
+            _code(FACE_DIRECTIONS, pose.face_direction),
+            _message_code(pose.feedback_message),
+        ]
+        if pose
+        else None,
+        _message_code(response.error_message),
+    ]
+
+
+def dumps_compact(response: FaceAnalysisResponse) -> bytes:
+    """Serialize a face analysis response in compact form."""
+    return json.dumps(
+        encode_compact(response),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
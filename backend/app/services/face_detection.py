@@ -0,0 +1,318 @@
+"""Pluggable face detector backends with latency-based calibration."""
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+
+import cv2
+import numpy as np
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.services.model_registry import ModelRegistry
+
+logger = get_logger(__name__)
+
+@dataclass(frozen=True)
+class DetectedFace:
+    """A face bounding box in pixel coordinates."""
+
+    x: int
+    y: int
+    w: int
+    h: int
+    confidence: float
+
+
+@dataclass(frozen=True)
+class CalibrationResult:
+    """Benchmark result of a single detector backend."""
+
+    backend: str
+    accuracy: float
+    mean_latency_ms: float
+
+
+class FaceDetector(ABC):
+    """Base class for face detector backends.
+
+    Backends are not guaranteed to be thread-safe, so detection is serialized
+    per instance.
+    """
+
+    name: str
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+    def detect(self, image: np.ndarray) -> list[DetectedFace]:
+        """Detect faces in a BGR image, largest face first."""
+        with self._lock:
+            faces = self._detect(image)
+        return sorted(faces, key=lambda f: f.w * f.h, reverse=True)
+
+    @abstractmethod
+    def _detect(self, image: np.ndarray) -> list[DetectedFace]:
+        """Backend-specific detection."""
+
+
+class OpenCVHaarDetector(FaceDetector):
+    """OpenCV Haar cascade detector (fast, lower accuracy)."""
+
+    name = "opencv_haar"
+
+    def __init__(self) -> None:
+        super().__init__()
+        cascade_dir = cv2.data.haarcascades  # type: ignore[attr-defined]
+        cascade_path = Path(cascade_dir) / "haarcascade_frontalface_default.xml"
+        self._classifier = cv2.CascadeClassifier(str(cascade_path))
+        if self._classifier.empty():
+            raise RuntimeError(f"Failed to load Haar cascade: {cascade_path}")
+
+    def _detect(self, image: np.ndarray) -> list[DetectedFace]:
+        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        boxes = self._classifier.detectMultiScale(
+            gray,
+            scaleFactor=1.1,
+            minNeighbors=5,
+            minSize=(48, 48),
+        )
+        return [DetectedFace(int(x), int(y), int(w), int(h), 1.0) for x, y, w, h in boxes]
+
+
+class YuNetDetector(FaceDetector):
+    """OpenCV DNN detector using the YuNet ONNX model."""
+
+    name = "yunet"
+
+    def __init__(self, model_path: str | None = None, score_threshold: float = 0.7) -> None:
+        super().__init__()
+        model_path = (
+            model_path
+            or settings.face_yunet_model_path
+            or str(ModelRegistry().path_for("yunet"))
+        )
+        if not Path(model_path).is_file():
+            raise RuntimeError(f"YuNet model file not found: {model_path}")
+        self._detector = cv2.FaceDetectorYN.create(
+            model_path,
+            "",
+            (320, 320),
+            score_threshold,
+        )
+
+    def _detect(self, image: np.ndarray) -> list[DetectedFace]:
+        h, w = image.shape[:2]
+        self._detector.setInputSize((w, h))
+        _, faces = self._detector.detect(image)
+        if faces is None:
+            return []
+        # Each row: x, y, w, h, 5 landmark pairs, score
+        return [
+            DetectedFace(
+                x=max(0, int(row[0])),
+                y=max(0, int(row[1])),
+                w=int(row[2]),
+                h=int(row[3]),
+                confidence=float(row[14]),
+            )
+            for row in faces
+        ]
+
+
+class MediaPipeDetector(FaceDetector):
+    """MediaPipe short-range face detection."""
+
+    name = "mediapipe"
+
+    def __init__(self, min_detection_confidence: float = 0.5) -> None:
+        super().__init__()
+        import mediapipe as mp
+
+        self._detector = mp.solutions.face_detection.FaceDetection(
+            model_selection=0,
+            min_detection_confidence=min_detection_confidence,
+        )
+
+    def _detect(self, image: np.ndarray) -> list[DetectedFace]:
+        h, w = image.shape[:2]
+        results = self._detector.process(cv2.cvtColor(image, cv2.COLOR_BGR2RGB))
+        if not results.detections:
+            return []
+
+        faces = []
+        for detection in results.detections:
+            box = detection.location_data.relative_bounding_box
+            x = max(0, int(box.xmin * w))
+            y = max(0, int(box.ymin * h))
+            faces.append(
+                DetectedFace(
+                    x=x,
+                    y=y,
+                    w=min(int(box.width * w), w - x),
+                    h=min(int(box.height * h), h - y),
+                    confidence=float(detection.score[0]),
+                )
+            )
+        return faces
+
+
+DETECTOR_BACKENDS: dict[str, type[FaceDetector]] = {
+    OpenCVHaarDetector.name: OpenCVHaarDetector,
+    YuNetDetector.name: YuNetDetector,
+    MediaPipeDetector.name: MediaPipeDetector,
+}
+
+
+def create_detector(name: str) -> FaceDetector:
+    """Create a detector backend by name."""
+    detector_cls = DETECTOR_BACKENDS.get(name)
+    if detector_cls is None:
+        raise ValueError(f"Unknown face detector backend: {name}")
+    return detector_cls()
+
+
+def load_calibration_frames(directory: Path) -> list[tuple[np.ndarray, int]]:
+    """Load calibration frames and their expected face counts.
+
+    The directory must contain a manifest.json of the form
+    ``{"frames": [{"file": "frame01.jpg", "faces": 1}, ...]}``.
+    """
+    manifest_path = directory / "manifest.json"
+    if not manifest_path.is_file():
+        return []
+
+    manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    frames = []
+    for entry in manifest.get("frames", []):
+        image = cv2.imread(str(directory / entry["file"]), cv2.IMREAD_COLOR)
+        if image is None:
+            logger.warning("Failed to read calibration frame", file=entry["file"])
+            continue
+        frames.append((image, int(entry.get("faces", 1))))
+    return frames
+
+
+def benchmark_detector(
+    detector: FaceDetector,
+    frames: list[tuple[np.ndarray, int]],
+    rounds: int = 3,
+) -> CalibrationResult:
+    """Measure accuracy and mean latency of a detector on calibration frames."""
+    # Warm up (model loading, lazy allocations)
+    detector.detect(frames[0][0])
+
+    correct = 0
+    elapsed = 0.0
+    for image, expected_faces in frames:
+        detected = 0
+        for _ in range(rounds):
+            start = time.perf_counter()
+            detected = len(detector.detect(image))
+            elapsed += time.perf_counter() - start
+        if detected == expected_faces:
+            correct += 1
+
+    return CalibrationResult(
+        backend=detector.name,
+        accuracy=correct / len(frames),
+        mean_latency_ms=elapsed / (len(frames) * rounds) * 1000,
+    )
+
+
+def select_detector() -> FaceDetector:
+    """Select the detector backend for this node.
+
+    With ``face_detector_backend="auto"``, every candidate backend is benchmarked
+    on the calibration frames in ``face_calibration_dir`` and the fastest one
+    meeting the accuracy floor wins.
+    """
+    if settings.face_detector_backend != "auto":
+        detector = create_detector(settings.face_detector_backend)
+        _report_selection(detector.name, None)
+        return detector
+
+    if not settings.face_calibration_dir:
+        raise ValueError("face_detector_backend=auto requires face_calibration_dir")
+    calibration_dir = Path(settings.face_calibration_dir)
+    frames = load_calibration_frames(calibration_dir)
+    if not frames:
+        logger.warning(
+            "No face calibration frames found, using fallback detector",
+            calibration_dir=str(calibration_dir),
+            backend=settings.face_detector_fallback,
+        )
+        detector = create_detector(settings.face_detector_fallback)
+        _report_selection(detector.name, None)
+        return detector
+
+    candidates: list[tuple[CalibrationResult, FaceDetector]] = []
+    for name in settings.face_detector_candidates:
+        try:
+            detector = create_detector(name)
+            result = benchmark_detector(detector, frames)
+        except Exception as e:
+            logger.warning("Face detector backend unavailable", backend=name, error=str(e))
+            continue
+        logger.info(
+            "Face detector benchmarked",
+            backend=name,
+            accuracy=result.accuracy,
+            mean_latency_ms=round(result.mean_latency_ms, 2),
+        )
+        candidates.append((result, detector))
+
+    if not candidates:
+        detector = create_detector(settings.face_detector_fallback)
+        _report_selection(detector.name, None)
+        return detector
+
+    eligible = [c for c in candidates if c[0].accuracy >= settings.face_detector_min_accuracy]
+    if eligible:
+        result, detector = min(eligible, key=lambda c: c[0].mean_latency_ms)
+    else:
+        logger.warning(
+            "No face detector met the accuracy floor, using the most accurate one",
+            min_accuracy=settings.face_detector_min_accuracy,
+        )
+        result, detector = max(
+            candidates, key=lambda c: (c[0].accuracy, -c[0].mean_latency_ms)
+        )
+
+    _report_selection(detector.name, result)
+    return detector
+
+
+def _report_selection(backend: str, result: CalibrationResult | None) -> None:
+    """Log and export the selected detector backend."""
+    logger.info("Face detector selected", backend=backend)
+    metrics.set_gauge("face_detector_backend", backend)
+    if result is not None:
+        metrics.set_gauge("face_detector_accuracy", round(result.accuracy, 3))
+        metrics.set_gauge("face_detector_latency_ms", round(result.mean_latency_ms, 2))
+
+
+_detector: FaceDetector | None = None
+_detector_lock = threading.RLock()
+
+
+def init_face_detector() -> FaceDetector:
+    """Run detector selection and install the result for this process."""
+    global _detector
+    detector = select_detector()
+    with _detector_lock:
+        _detector = detector
+    return detector
+
+
+def get_face_detector() -> FaceDetector:
+    """Get the active face detector, selecting one on first use."""
+    if _detector is None:
+        with _detector_lock:
+            if _detector is None:
+                return init_face_detector()
+    return _detector
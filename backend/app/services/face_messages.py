@@ -0,0 +1,26 @@
+"""Fixed feedback and error messages of the face analysis pipeline.
+
+The compact result encoding numbers these messages, so they are defined once
+here for both the pipeline and ``face_compact``.
+"""
+
+# Tension feedback
+TENSE = "緊張しているようです。深呼吸してリラックスしてみましょう"
+SLIGHTLY_TENSE = "少し緊張気味です。肩の力を抜いてみてください"
+RELAXED = "リラックスして話せていますね"
+CALM = "落ち着いて話せています"
+NATURAL = "自然体で大丈夫ですよ"
+
+# Head pose feedback
+LOOKING_AT_CAMERA = "カメラをしっかり見ていますね"
+FACING_LEFT = "少し左を向いています。カメラを見てください"
+FACING_RIGHT = "少し右を向いています。カメラを見てください"
+FACING_UP = "少し上を向いています。カメラを見てください"
+FACING_DOWN = "少し下を向いています。カメラを見てください"
+FACING_AWAY = "カメラの方を向いてください"
+
+# Errors
+INVALID_IMAGE = "画像データの形式が不正です"
+TOO_DARK = "照明が暗すぎて顔を検出できません。明るい場所に移動してください"
+TOO_BRIGHT = "照明が明るすぎて顔を検出できません。逆光を避けてください"
+NO_FACE = "顔が検出されませんでした。カメラに顔が映っているか確認してください"
@@ -0,0 +1,282 @@
+"""Distributed face inference over Redis Streams.
+
+API nodes push frames onto a stream; face workers (``python -m
+app.workers.face_worker``, possibly on other nodes) consume them through a
+consumer group and push each result onto a per-request reply list that the
+API node is blocking on.
+
+Messages left pending by a crashed worker are reclaimed by other workers after
+``face_worker_claim_idle_ms`` and retried up to ``face_worker_max_deliveries``
+times before the request is failed. Workers keep resetting the idle time of
+messages they are still processing, so slow inferences are not reclaimed
+(and run twice) while their worker is alive.
+"""
+
+import asyncio
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any, cast
+
+from redis.asyncio import Redis
+from redis.exceptions import ResponseError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.redis import StreamEntry, StreamReadReply, get_redis
+from app.schemas.face_analysis import FaceAnalysisResponse
+
+logger = get_logger(__name__)
+
+REPLY_KEY_PREFIX = "face:reply:"
+# Reply lists outlive the API wait so late results are cleaned up by Redis
+REPLY_TTL_SECONDS = 60
+
+
+def _reply_key(request_id: str) -> str:
+    return f"{REPLY_KEY_PREFIX}{request_id}"
+
+
+async def submit_face_analysis(
+    image_base64: str,
+    redis: Redis | None = None,
+) -> FaceAnalysisResponse:
+    """Enqueue a frame for a face worker and wait for its result."""
+    redis = redis or get_redis()
+    request_id = uuid.uuid4().hex
+
+    await redis.xadd(
+        settings.face_stream_name,
+        {
+            "request_id": request_id,
+            "image": image_base64,
+            "enqueued_at": f"{time.time():.3f}",
+        },
+        maxlen=settings.face_stream_maxlen,
+        approximate=True,
+    )
+
+    reply = await redis.blpop(
+        [_reply_key(request_id)],
+        timeout=settings.face_reply_timeout_seconds,
+    )
+    if reply is None:
+        metrics.inc("face_queue_timeouts")
+        logger.warning("Face analysis timed out", request_id=request_id)
+        return FaceAnalysisResponse(
+            success=False,
+            face_detected=False,
+            error_message="分析がタイムアウトしました",
+        )
+
+    return FaceAnalysisResponse.model_validate_json(reply[1])
+
+
+class FaceInferenceWorker:
+    """Consumes frames from the face stream and publishes results."""
+
+    def __init__(
+        self,
+        consumer_name: str | None = None,
+        analyze: Callable[[str], FaceAnalysisResponse] | None = None,
+        redis: Redis | None = None,
+        concurrency: int | None = None,
+    ) -> None:
+        # Imported lazily so API nodes in redis mode do not load the pipeline
+        if analyze is None:
+            from app.services.face_analysis_service import analyze_face_image
+
+            analyze = analyze_face_image
+
+        self.consumer_name = consumer_name or f"face-worker-{uuid.uuid4().hex[:8]}"
+        self.analyze = analyze
+        self.redis = redis or get_redis()
+        self.stream = settings.face_stream_name
+        self.group = settings.face_stream_group
+        self.concurrency = concurrency or settings.face_worker_concurrency
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self._tasks: set[asyncio.Task[None]] = set()
+        # Message IDs dispatched by this worker and not finished yet
+        self._inflight: set[str] = set()
+        self._stopping = asyncio.Event()
+
+    async def ensure_group(self) -> None:
+        """Create the consumer group (and stream) if needed."""
+        try:
+            await self.redis.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def run(self) -> None:
+        """Consume messages until stopped."""
+        await self.ensure_group()
+        logger.info("Face worker started", consumer=self.consumer_name, stream=self.stream)
+        keepalive = asyncio.create_task(self._keep_claimed())
+
+        while not self._stopping.is_set():
+            try:
+                await self._reclaim_stale()
+                response = cast(
+                    StreamReadReply | None,
+                    await self.redis.xreadgroup(
+                        self.group,
+                        self.consumer_name,
+                        {self.stream: ">"},
+                        count=self._free_slots(),
+                        block=1000,
+                    ),
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Face worker read failed", error=str(e))
+                await asyncio.sleep(1)
+                continue
+
+            for _, messages in response or []:
+                for message_id, fields in messages:
+                    await self._dispatch(message_id, fields)
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        keepalive.cancel()
+        logger.info("Face worker stopped", consumer=self.consumer_name)
+
+    def stop(self) -> None:
+        """Ask the worker to stop after in-flight messages finish."""
+        self._stopping.set()
+
+    def _free_slots(self) -> int:
+        return max(1, self.concurrency - len(self._tasks))
+
+    async def _dispatch(self, message_id: str, fields: dict[str, str]) -> None:
+        """Process a message in the background, bounded by the concurrency limit."""
+        self._inflight.add(message_id)
+        try:
+            await self._semaphore.acquire()
+        except BaseException:
+            self._inflight.discard(message_id)
+            raise
+        task = asyncio.create_task(self._process(message_id, fields))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(lambda _: self._inflight.discard(message_id))
+        task.add_done_callback(lambda _: self._semaphore.release())
+
+    async def _process(self, message_id: str, fields: dict[str, str]) -> None:
+        """Analyze one frame, publish the result and acknowledge it."""
+        request_id = fields.get("request_id", "")
+        enqueued_at = float(fields.get("enqueued_at", "0"))
+
+        # The API node has given up waiting; skip the work
+        if time.time() - enqueued_at > settings.face_reply_timeout_seconds:
+            metrics.inc("face_queue_expired")
+            await self._ack(message_id)
+            return
+
+        try:
+            result = await asyncio.to_thread(self.analyze, fields.get("image", ""))
+        except Exception as e:
+            # Leave the message pending so it is retried after the claim idle time
+            logger.exception("Face inference failed", request_id=request_id, error=str(e))
+            return
+
+        await self._reply(request_id, result)
+        await self._ack(message_id)
+        metrics.inc("face_queue_processed")
+
+    async def _reclaim_stale(self) -> None:
+        """Claim messages left pending by crashed or failing consumers."""
+        # [next start ID, claimed entries, deleted IDs]
+        reply = await self.redis.xautoclaim(
+            self.stream,
+            self.group,
+            self.consumer_name,
+            min_idle_time=settings.face_worker_claim_idle_ms,
+            start_id="0-0",
+            count=self._free_slots(),
+        )
+        claimed: list[StreamEntry] = reply[1]
+        for message_id, fields in claimed:
+            if message_id in self._inflight:
+                # Our own message, still being processed
+                continue
+            if not fields:
+                # Trimmed from the stream while pending
+                await self._ack(message_id)
+                continue
+
+            pending = cast(
+                list[dict[str, Any]],
+                await self.redis.xpending_range(
+                    self.stream, self.group, min=message_id, max=message_id, count=1
+                ),
+            )
+            deliveries = int(pending[0]["times_delivered"]) if pending else 1
+            if deliveries > settings.face_worker_max_deliveries:
+                logger.error(
+                    "Face inference retries exhausted",
+                    request_id=fields.get("request_id"),
+                    deliveries=deliveries,
+                )
+                metrics.inc("face_queue_dead_letters")
+                await self._reply(
+                    fields.get("request_id", ""),
+                    FaceAnalysisResponse(
+                        success=False,
+                        face_detected=False,
+                        error_message="分析中にエラーが発生しました",
+                    ),
+                )
+                await self._ack(message_id)
+                continue
+
+            metrics.inc("face_queue_retries")
+            await self._dispatch(message_id, fields)
+
+    async def _keep_claimed(self) -> None:
+        """Reset the idle time of in-flight messages so other workers do not reclaim them."""
+        interval = max(settings.face_worker_claim_idle_ms / 3000, 0.1)
+        while True:
+            await asyncio.sleep(interval)
+            if not self._inflight:
+                continue
+            try:
+                # JUSTID: no delivery count increment, no payload transfer
+                await self.redis.xclaim(
+                    self.stream,
+                    self.group,
+                    self.consumer_name,
+                    min_idle_time=0,
+                    message_ids=list(self._inflight),
+                    justid=True,
+                )
+            except Exception as e:
+                logger.warning("Face worker claim refresh failed", error=str(e))
+
+    async def _reply(self, request_id: str, result: FaceAnalysisResponse) -> None:
+        key = _reply_key(request_id)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.rpush(key, result.model_dump_json())
+            pipe.expire(key, REPLY_TTL_SECONDS)
+            await pipe.execute()
+
+    async def _ack(self, message_id: str) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.xack(self.stream, self.group, message_id)
+            pipe.xdel(self.stream, message_id)
+            await pipe.execute()
+
+
+
+async def analyze_face_frame(image_base64: str) -> FaceAnalysisResponse:
+    """Analyze a frame inline or through face workers, per ``face_inference_mode``."""
+    if settings.face_inference_mode == "redis":
+        # Offload to face workers (possibly on other nodes) via Redis Streams
+        return await submit_face_analysis(image_base64)
+
+    from app.services.face_analysis_service import analyze_face_image
+
+    return await asyncio.to_thread(analyze_face_image, image_base64)
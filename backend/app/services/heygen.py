@@ -0,0 +1,238 @@
+"""HeyGen streaming avatar sessions.
+
+Creating a streaming session is a slow call to HeyGen, so it is kept off the
+"start interview" path: ``AvatarSessionPool`` keeps ``heygen_pool_size``
+pre-created sessions per avatar and hands one out when an interview starts.
+A background task refills the pool and closes sessions that sat idle longer
+than ``heygen_session_ttl_seconds`` (HeyGen times out idle sessions). When the
+pool is empty a session is created on demand.
+
+Each API process keeps its own pool; hand-out is a synchronous pop on the
+event loop, so two requests never receive the same session. Handed-out
+sessions are stopped with ``close_avatar_session`` when the interview ends
+(completed, abandoned, or never created).
+"""
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Coroutine
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from app.core.config import settings
+from app.core.exceptions import ExternalServiceError
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+
+logger = get_logger(__name__)
+
+
+class HeyGenError(ExternalServiceError):
+    """Raised when a HeyGen API call fails."""
+
+    def __init__(self, message: str = "HeyGen request failed") -> None:
+        super().__init__(message=message, service_name="heygen")
+
+
+@dataclass
+class AvatarSession:
+    """A HeyGen streaming session."""
+
+    session_id: str
+    session_token: str
+    avatar_id: str
+    url: str | None = None
+    created_at: float = field(default_factory=time.monotonic)
+
+    def is_stale(self, ttl_seconds: float) -> bool:
+        return time.monotonic() - self.created_at >= ttl_seconds
+
+
+class HeyGenClient:
+    """Client of the HeyGen streaming API."""
+
+    def __init__(
+        self,
+        api_key: str | None = None,
+        base_url: str | None = None,
+        http: httpx.AsyncClient | None = None,
+    ) -> None:
+        self._http = http or httpx.AsyncClient(
+            base_url=base_url or settings.heygen_base_url,
+            timeout=settings.heygen_timeout_seconds,
+        )
+        self._http.headers["X-Api-Key"] = api_key or settings.heygen_api_key
+
+    async def create_session(self, avatar_id: str) -> AvatarSession:
+        """Create a streaming session for an avatar."""
+        data = await self._post(
+            "/v1/streaming.new",
+            {"avatar_id": avatar_id, "quality": settings.heygen_quality, "version": "v2"},
+        )
+        try:
+            return AvatarSession(
+                session_id=data["session_id"],
+                session_token=data["access_token"],
+                avatar_id=avatar_id,
+                url=data.get("url"),
+            )
+        except KeyError as e:
+            raise HeyGenError(f"Unexpected HeyGen response: missing {e}")
+
+    async def close_session(self, session_id: str) -> None:
+        """Stop a streaming session."""
+        await self._post("/v1/streaming.stop", {"session_id": session_id})
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def _post(self, path: str, body: dict[str, Any]) -> dict[str, Any]:
+        try:
+            response = await self._http.post(path, json=body)
+            response.raise_for_status()
+            return response.json().get("data") or {}
+        except httpx.HTTPError as e:
+            raise HeyGenError(f"HeyGen {path} failed: {e}")
+
+
+class AvatarSessionPool:
+    """Keeps pre-created avatar sessions warm per avatar."""
+
+    def __init__(
+        self,
+        client: HeyGenClient,
+        avatar_ids: list[str] | None = None,
+        size: int | None = None,
+        ttl_seconds: float | None = None,
+        refill_seconds: float | None = None,
+    ) -> None:
+        self.client = client
+        self.size = size if size is not None else settings.heygen_pool_size
+        self.ttl_seconds = ttl_seconds or settings.heygen_session_ttl_seconds
+        self.refill_seconds = refill_seconds or settings.heygen_pool_refill_seconds
+        self._idle: dict[str, deque[AvatarSession]] = {
+            avatar_id: deque() for avatar_id in (avatar_ids or settings.heygen_pool_avatar_ids)
+        }
+        self._creating: dict[str, int] = dict.fromkeys(self._idle, 0)
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._background: set[asyncio.Task[None]] = set()
+
+    def idle_count(self, avatar_id: str) -> int:
+        return len(self._idle.get(avatar_id, ()))
+
+    async def acquire(self, avatar_id: str) -> AvatarSession:
+        """Take a warm session for an avatar, creating one if none is ready."""
+        idle = self._idle.get(avatar_id)
+        while idle:
+            session = idle.popleft()
+            if session.is_stale(self.ttl_seconds):
+                self._close_later(session.session_id)
+                continue
+            metrics.inc("heygen_pool_hits")
+            self._wake.set()
+            return session
+
+        metrics.inc("heygen_pool_misses")
+        self._wake.set()
+        return await self.client.create_session(avatar_id)
+
+    def release(self, session_id: str) -> None:
+        """Stop a handed-out session in the background."""
+        self._close_later(session_id)
+
+    def start(self) -> None:
+        """Start filling the pool in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._refill_loop())
+
+    async def stop(self) -> None:
+        """Stop refilling and close idle sessions."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for idle in self._idle.values():
+            while idle:
+                self._close_later(idle.popleft().session_id)
+        if self._background:
+            await asyncio.gather(*self._background, return_exceptions=True)
+
+    async def refill(self) -> None:
+        """Drop stale sessions and create sessions up to the pool size."""
+        creates: list[Coroutine[Any, Any, None]] = []
+        for avatar_id, idle in self._idle.items():
+            for session in [s for s in idle if s.is_stale(self.ttl_seconds)]:
+                idle.remove(session)
+                self._close_later(session.session_id)
+            missing = self.size - len(idle) - self._creating[avatar_id]
+            creates.extend(self._create(avatar_id) for _ in range(max(0, missing)))
+        if creates:
+            await asyncio.gather(*creates)
+        for avatar_id, idle in self._idle.items():
+            metrics.set_gauge(f"heygen_pool_idle_{avatar_id}", len(idle))
+
+    async def _create(self, avatar_id: str) -> None:
+        self._creating[avatar_id] += 1
+        try:
+            session = await self.client.create_session(avatar_id)
+        except Exception as e:
+            metrics.inc("heygen_pool_create_errors")
+            logger.warning("Failed to pre-create avatar session", avatar_id=avatar_id, error=str(e))
+            return
+        finally:
+            self._creating[avatar_id] -= 1
+        self._idle[avatar_id].append(session)
+
+    async def _refill_loop(self) -> None:
+        while True:
+            await self.refill()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.refill_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    def _close_later(self, session_id: str) -> None:
+        task = asyncio.create_task(self._close(session_id))
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+
+    async def _close(self, session_id: str) -> None:
+        try:
+            await self.client.close_session(session_id)
+        except Exception as e:
+            logger.warning("Failed to close avatar session", session_id=session_id, error=str(e))
+
+
+_pool: AvatarSessionPool | None = None
+
+
+def get_avatar_pool() -> AvatarSessionPool | None:
+    """Get the process-wide avatar pool, or None if HeyGen is not configured."""
+    global _pool
+    if _pool is None and settings.heygen_api_key:
+        _pool = AvatarSessionPool(HeyGenClient())
+    return _pool
+
+
+def close_avatar_session(session_id: str | None) -> None:
+    """Stop the avatar session of an interview that has ended (in the background)."""
+    pool = get_avatar_pool()
+    if pool is not None and session_id:
+        pool.release(session_id)
+
+
+async def close_avatar_pool() -> None:
+    """Stop the avatar pool and close its idle sessions."""
+    global _pool
+    if _pool is not None:
+        await _pool.stop()
+        await _pool.client.aclose()
+        _pool = None
@@ -0,0 +1,185 @@
+"""Interview manifest: the whole question flow of a session, prefetched.
+
+The manifest lists every question of the script in order, with the variant
+to show for the JLPT level (simplified text for levels with
+``useSimplified``), the reading, the expected duration and the URL of the
+question audio at the level's ``speechRate``. Clients fetch it once when the
+session starts and move between questions locally.
+
+Script questions carry only their text; simplified and reading variants come
+from the question bank entry with the same Japanese text, when there is one.
+"""
+
+import asyncio
+import hashlib
+import json
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import distinct_on
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.models.question import QuestionBank, Script, ScriptQuestion
+from app.schemas.session import InterviewManifest, ManifestQuestion
+from app.services.config_service import ConfigService
+from app.services.tts import get_tts_store, tts_url
+
+logger = get_logger(__name__)
+
+# Syntheses still running after a manifest was returned
+_background: set[asyncio.Task[str]] = set()
+
+
+def _finish_background(task: asyncio.Task[str]) -> None:
+    _background.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning("Question audio synthesis failed", error=str(task.exception()))
+
+
+@dataclass(frozen=True)
+class LevelSettings:
+    """Speech settings of a JLPT level."""
+
+    speech_rate: float = 1.0
+    use_simplified: bool = False
+    config_version: int = 0
+
+
+class ManifestService:
+    """Builds interview manifests."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def build(
+        self,
+        session_id: str,
+        script: Script,
+        jlpt_level: str,
+        audio_timeout: float | None = None,
+    ) -> InterviewManifest:
+        """Build the manifest of a session.
+
+        Question audio not cached locally or synthesised within
+        ``audio_timeout`` is left out (``audio_url`` is None, ``audio_pending``
+        is set) and keeps synthesising in the background. A zero timeout
+        never waits.
+        """
+        level = await self._level_settings(jlpt_level)
+
+        stmt = (
+            select(
+                ScriptQuestion.id,
+                ScriptQuestion.order_number,
+                ScriptQuestion.question_text,
+                ScriptQuestion.expected_duration_seconds,
+                QuestionBank.question_simplified,
+                QuestionBank.question_reading,
+            )
+            .outerjoin(
+                QuestionBank,
+                (QuestionBank.question_ja == ScriptQuestion.question_text)
+                & (QuestionBank.is_deleted == False),
+            )
+            .where(
+                ScriptQuestion.script_id == script.id,
+                ScriptQuestion.is_deleted == False,
+            )
+            .ext(distinct_on(ScriptQuestion.order_number))
+            .order_by(ScriptQuestion.order_number, QuestionBank.version.desc())
+        )
+        result = await self.db.execute(stmt)
+        rows = result.all()
+
+        questions = [
+            ManifestQuestion(
+                id=row.order_number,
+                question_id=str(row.id),
+                text=(row.question_simplified if level.use_simplified else None)
+                or row.question_text,
+                question_ja=row.question_text,
+                question_simplified=row.question_simplified,
+                question_reading=row.question_reading,
+                expected_duration_seconds=row.expected_duration_seconds,
+            )
+            for row in rows
+        ]
+        await self._resolve_audio(
+            questions,
+            level.speech_rate,
+            settings.tts_manifest_timeout_seconds if audio_timeout is None else audio_timeout,
+        )
+
+        etag_source = json.dumps(
+            [
+                session_id,
+                str(script.id),
+                script.synced_at,
+                jlpt_level,
+                level.config_version,
+                [q.audio_url for q in questions],
+            ]
+        )
+        return InterviewManifest(
+            session_id=session_id,
+            script_id=str(script.id),
+            jlpt_level=jlpt_level,
+            speech_rate=level.speech_rate,
+            use_simplified=level.use_simplified,
+            total_questions=len(questions),
+            questions=questions,
+            audio_pending=settings.tts_enabled and any(q.audio_url is None for q in questions),
+            etag=hashlib.sha256(etag_source.encode()).hexdigest()[:32],
+        )
+
+    async def _level_settings(self, jlpt_level: str) -> LevelSettings:
+        """Read the speech settings of a level from the JLPT config."""
+        config = await ConfigService(self.db).get_config("jlpt_config")
+        if config is None:
+            return LevelSettings()
+        level = config.config_value.get("settings", {}).get(jlpt_level, {})
+        return LevelSettings(
+            speech_rate=level.get("speechRate", 1.0),
+            use_simplified=level.get("useSimplified", False),
+            config_version=config.version,
+        )
+
+    async def _resolve_audio(
+        self,
+        questions: list[ManifestQuestion],
+        speech_rate: float,
+        timeout: float,
+    ) -> None:
+        """Fill in audio URLs of questions whose audio is ready in time."""
+        if not settings.tts_enabled or not questions:
+            return
+        store = get_tts_store()
+        missing = []
+        for q in questions:
+            audio_hash = store.cached(q.text, speech_rate)
+            if audio_hash is None:
+                missing.append(q)
+            else:
+                q.audio_url = tts_url(audio_hash)
+        if not missing:
+            return
+
+        tasks = {
+            asyncio.ensure_future(store.ensure(q.text, speech_rate)): q for q in missing
+        }
+        if timeout > 0:
+            done, pending = await asyncio.wait(tasks, timeout=timeout)
+        else:
+            done, pending = set(), set(tasks)
+        for task in done:
+            if task.exception() is not None:
+                logger.warning("Question audio synthesis failed", error=str(task.exception()))
+                continue
+            tasks[task].audio_url = tts_url(task.result())
+        if pending:
+            logger.info("Question audio still synthesising", pending=len(pending))
+            for task in pending:
+                _background.add(task)
+                task.add_done_callback(_finish_background)
@@ -0,0 +1,231 @@
+"""Local model artifact registry.
+
+Model files used by the face pipeline (DeepFace weights, ONNX detectors, ...)
+are fetched once at image build time into ``settings.model_artifact_dir`` and
+verified against SHA-256 checksums. At runtime the pipeline only loads from
+that directory, so no network I/O happens on the request path.
+
+The artifacts are declared in ``app/data/models/manifest.json``. ``prefetch``
+writes a manifest with the actual checksums and sizes into the registry
+directory; ``verify`` checks the files against it.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import httpx
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+SOURCE_MANIFEST_PATH = Path(__file__).resolve().parent.parent / "data" / "models" / "manifest.json"
+REGISTRY_MANIFEST_NAME = "manifest.json"
+
+_CHUNK_SIZE = 1024 * 1024
+
+
+class ModelArtifactError(Exception):
+    """Raised when a model artifact is missing or fails verification."""
+
+
+@dataclass
+class ModelArtifact:
+    """A single model file tracked by the registry."""
+
+    name: str
+    path: str
+    url: str
+    sha256: str | None = None
+    size: int | None = None
+    description: str | None = None
+
+
+def _file_sha256(path: Path) -> str:
+    """Compute the SHA-256 checksum of a file."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_manifest(path: Path) -> list[ModelArtifact]:
+    """Read artifacts from a manifest file."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return [ModelArtifact(**entry) for entry in data.get("artifacts", [])]
+
+
+def _write_manifest(path: Path, artifacts: list[ModelArtifact]) -> None:
+    """Atomically write artifacts to a manifest file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    content = json.dumps(
+        {"artifacts": [asdict(a) for a in artifacts]},
+        ensure_ascii=False,
+        indent=2,
+    )
+    with tempfile.NamedTemporaryFile(
+        "w", dir=path.parent, delete=False, encoding="utf-8", suffix=".tmp"
+    ) as tmp:
+        tmp.write(content + "\n")
+    os.replace(tmp.name, path)
+
+
+class ModelRegistry:
+    """Registry of model artifacts stored in a local directory."""
+
+    def __init__(
+        self,
+        root: Path | str | None = None,
+        source_manifest: Path = SOURCE_MANIFEST_PATH,
+    ) -> None:
+        self.root = Path(root or settings.model_artifact_dir).resolve()
+        self.source_manifest = source_manifest
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path of the registry manifest (actual checksums of stored files)."""
+        return self.root / REGISTRY_MANIFEST_NAME
+
+    def declared_artifacts(self) -> list[ModelArtifact]:
+        """Artifacts declared in the bundled source manifest."""
+        return _read_manifest(self.source_manifest)
+
+    def stored_artifacts(self) -> dict[str, ModelArtifact]:
+        """Artifacts recorded in the registry manifest, keyed by name."""
+        if not self.manifest_path.is_file():
+            return {}
+        return {a.name: a for a in _read_manifest(self.manifest_path)}
+
+    def path_for(self, name: str) -> Path:
+        """Get the local path of an artifact."""
+        for artifact in self.declared_artifacts():
+            if artifact.name == name:
+                return self.root / artifact.path
+        raise ModelArtifactError(f"Unknown model artifact: {name}")
+
+    def verify(self, names: list[str] | None = None) -> list[ModelArtifact]:
+        """Verify stored artifacts against recorded and pinned checksums."""
+        stored = self.stored_artifacts()
+        verified = []
+        for declared in self.declared_artifacts():
+            if names is not None and declared.name not in names:
+                continue
+            record = stored.get(declared.name)
+            local_path = self.root / declared.path
+            if record is None or not local_path.is_file():
+                raise ModelArtifactError(
+                    f"Model artifact '{declared.name}' is missing from {self.root}"
+                )
+            expected = declared.sha256 or record.sha256
+            actual = _file_sha256(local_path)
+            if actual != expected:
+                raise ModelArtifactError(
+                    f"Checksum mismatch for '{declared.name}': expected {expected}, got {actual}"
+                )
+            verified.append(record)
+        return verified
+
+    def prefetch(
+        self,
+        names: list[str] | None = None,
+        force: bool = False,
+    ) -> list[ModelArtifact]:
+        """Download artifacts into the registry and record their checksums."""
+        stored = self.stored_artifacts()
+        fetched = []
+        for declared in self.declared_artifacts():
+            if names is not None and declared.name not in names:
+                continue
+            local_path = self.root / declared.path
+            if not force and local_path.is_file():
+                sha256 = _file_sha256(local_path)
+                if sha256 == (declared.sha256 or sha256):
+                    logger.info("Model artifact already present", name=declared.name)
+                    stored[declared.name] = ModelArtifact(
+                        **{**asdict(declared), "sha256": sha256, "size": local_path.stat().st_size}
+                    )
+                    fetched.append(stored[declared.name])
+                    continue
+
+            sha256, size = self._download(declared, local_path)
+            stored[declared.name] = ModelArtifact(
+                **{**asdict(declared), "sha256": sha256, "size": size}
+            )
+            fetched.append(stored[declared.name])
+
+        _write_manifest(self.manifest_path, list(stored.values()))
+        return fetched
+
+    def pin(self, artifacts: list[ModelArtifact]) -> None:
+        """Write checksums of fetched artifacts back into the source manifest."""
+        checksums = {a.name: a.sha256 for a in artifacts}
+        declared = self.declared_artifacts()
+        for artifact in declared:
+            if artifact.name in checksums:
+                artifact.sha256 = checksums[artifact.name]
+                artifact.size = None
+        _write_manifest(self.source_manifest, declared)
+
+    def _download(self, artifact: ModelArtifact, local_path: Path) -> tuple[str, int]:
+        """Stream an artifact to disk, verifying the pinned checksum if any."""
+        logger.info("Downloading model artifact", name=artifact.name, url=artifact.url)
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+
+        with tempfile.NamedTemporaryFile(dir=local_path.parent, delete=False) as tmp:
+            try:
+                with httpx.stream("GET", artifact.url, follow_redirects=True, timeout=60) as r:
+                    r.raise_for_status()
+                    for chunk in r.iter_bytes(_CHUNK_SIZE):
+                        digest.update(chunk)
+                        size += len(chunk)
+                        tmp.write(chunk)
+            except Exception:
+                Path(tmp.name).unlink(missing_ok=True)
+                raise
+
+        sha256 = digest.hexdigest()
+        if artifact.sha256 and sha256 != artifact.sha256:
+            Path(tmp.name).unlink(missing_ok=True)
+            raise ModelArtifactError(
+                f"Checksum mismatch for '{artifact.name}': "
+                f"expected {artifact.sha256}, got {sha256}"
+            )
+
+        os.replace(tmp.name, local_path)
+        return sha256, size
+
+
+_verified: bool | None = None
+
+
+def configure_model_environment(registry: ModelRegistry | None = None) -> None:
+    """Point model-loading libraries at the registry directory.
+
+    Must run before DeepFace is imported. With ``model_registry_verify`` set,
+    the required artifacts are verified once per process and the face pipeline
+    refuses to run if they are missing, instead of downloading them.
+    """
+    global _verified
+    registry = registry or ModelRegistry()
+    # DeepFace resolves its weights under $DEEPFACE_HOME/.deepface/weights
+    os.environ["DEEPFACE_HOME"] = str(registry.root)
+    if not settings.model_registry_verify:
+        return
+
+    if _verified is None:
+        try:
+            registry.verify(settings.model_registry_required)
+        except ModelArtifactError:
+            _verified = False
+            raise
+        _verified = True
+    elif not _verified:
+        raise ModelArtifactError(f"Model registry verification failed: {registry.root}")
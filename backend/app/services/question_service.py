@@ -3,7 +3,7 @@
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -125,10 +125,20 @@ class QuestionService:
         data: QuestionBankUpdate,
     ) -> QuestionBankResponse | None:
         """Update a question (creates a new version)."""
-        # Get existing question
-        stmt = select(QuestionBank).where(
-            QuestionBank.id == question_id,
-            QuestionBank.is_deleted == False,
+        update_data = data.model_dump(exclude_unset=True)
+        stmt = (
+            update(QuestionBank)
+            .where(
+                QuestionBank.id == question_id,
+                QuestionBank.is_deleted == False,
+            )
+            .values(
+                **update_data,
+                version=QuestionBank.version + 1,
+                updated_at=datetime.now(timezone.utc),
+            )
+            .returning(QuestionBank)
+            .execution_options(populate_existing=True)
         )
         result = await self.db.execute(stmt)
         question = result.scalar_one_or_none()
@@ -136,33 +146,26 @@ class QuestionService:
         if question is None:
             return None
 
-        # Update fields
-        update_data = data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(question, field, value)
-
-        question.version += 1
-        question.updated_at = datetime.now(timezone.utc)
-
         await self.db.commit()
-        await self.db.refresh(question)
 
         return QuestionBankResponse.model_validate(question)
 
     async def delete_question(self, question_id: str) -> bool:
         """Soft delete a question."""
-        stmt = select(QuestionBank).where(
-            QuestionBank.id == question_id,
-            QuestionBank.is_deleted == False,
+        stmt = (
+            update(QuestionBank)
+            .where(
+                QuestionBank.id == question_id,
+                QuestionBank.is_deleted == False,
+            )
+            .values(is_deleted=True, deleted_at=datetime.now(timezone.utc))
+            .returning(QuestionBank.id)
+            .execution_options(synchronize_session=False)
         )
         result = await self.db.execute(stmt)
-        question = result.scalar_one_or_none()
-
-        if question is None:
+        if result.scalar_one_or_none() is None:
             return False
 
-        question.is_deleted = True
-        question.deleted_at = datetime.now(timezone.utc)
         await self.db.commit()
 
         return True
@@ -0,0 +1,95 @@
+"""In-process cache of ordered script questions.
+
+Scripts only change when they are synced from mintoku work, which bumps
+``Script.synced_at``. Entries are keyed by script ID and tagged with that
+stamp, so a resynced script is reloaded on the next lookup even on nodes that
+did not run the sync. ``invalidate`` drops entries eagerly.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.metrics import metrics
+from app.models.question import ScriptQuestion
+
+
+@dataclass(frozen=True)
+class CachedQuestion:
+    """The parts of a script question needed while answering."""
+
+    id: UUID
+    order_number: int
+    question_text: str
+
+
+class ScriptQuestionCache:
+    """LRU cache of ordered, non-deleted questions per script."""
+
+    def __init__(self, max_scripts: int) -> None:
+        self.max_scripts = max_scripts
+        self._entries: OrderedDict[str, tuple[str, tuple[CachedQuestion, ...]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, script_id: str, version: str) -> tuple[CachedQuestion, ...] | None:
+        """Get the questions of a script if cached for this version."""
+        with self._lock:
+            entry = self._entries.get(script_id)
+            if entry is None or entry[0] != version:
+                return None
+            self._entries.move_to_end(script_id)
+            return entry[1]
+
+    def put(self, script_id: str, version: str, questions: tuple[CachedQuestion, ...]) -> None:
+        """Store the questions of a script, evicting the least recently used."""
+        with self._lock:
+            self._entries[script_id] = (version, questions)
+            self._entries.move_to_end(script_id)
+            while len(self._entries) > self.max_scripts:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, script_id: str | None = None) -> None:
+        """Drop one script, or everything."""
+        with self._lock:
+            if script_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(script_id, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+script_question_cache = ScriptQuestionCache(settings.script_cache_max_scripts)
+
+
+async def get_ordered_questions(
+    db: AsyncSession,
+    script_id: UUID | str,
+    synced_at: str,
+) -> tuple[CachedQuestion, ...]:
+    """Get the ordered questions of a script, loading them on a cache miss."""
+    key = str(script_id)
+    questions = script_question_cache.get(key, synced_at)
+    if questions is not None:
+        metrics.inc("script_cache_hits")
+        return questions
+
+    metrics.inc("script_cache_misses")
+    stmt = (
+        select(ScriptQuestion.id, ScriptQuestion.order_number, ScriptQuestion.question_text)
+        .where(
+            ScriptQuestion.script_id == script_id,
+            ScriptQuestion.is_deleted == False,
+        )
+        .order_by(ScriptQuestion.order_number)
+    )
+    result = await db.execute(stmt)
+    questions = tuple(CachedQuestion(*row) for row in result.all())
+    script_question_cache.put(key, synced_at, questions)
+    return questions
@@ -0,0 +1,157 @@
+"""Cross-node session event fan-out over Redis Streams.
+
+Any process (API node, evaluation worker, transcription write-back) can
+publish an event for a session; the node holding that session's WebSocket or
+SSE connection reads it from the stream ``session:events:{id}`` and delivers
+it. Streams, unlike pub/sub, keep recent events, so a client that reconnects
+(to any node) resumes after the last event ID it saw, and a subscriber whose
+Redis connection drops reconnects and continues from where it stopped.
+
+Streams are capped at ``session_channel_maxlen`` events and expire
+``session_channel_ttl_seconds`` after the last event.
+"""
+
+import asyncio
+import json
+import re
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any, cast
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.redis import StreamReadReply, get_redis
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "session:events:"
+
+_EVENT_ID_RE = re.compile(r"^\d+-\d+$")
+
+
+@dataclass
+class SessionEvent:
+    """An event published on a session channel."""
+
+    id: str
+    type: str
+    data: Any
+
+
+def _key(session_id: str) -> str:
+    return f"{KEY_PREFIX}{session_id}"
+
+
+def validate_event_id(event_id: str) -> str:
+    """Check a client-supplied event ID."""
+    if not _EVENT_ID_RE.match(event_id):
+        raise ValueError("Invalid event ID")
+    return event_id
+
+
+async def publish_session_event(
+    session_id: str | UUID,
+    event_type: str,
+    data: Any = None,
+    redis: Redis | None = None,
+) -> str | None:
+    """Publish an event to a session's subscribers on any node.
+
+    Returns the event ID, or None if the event could not be published.
+    """
+    if not settings.session_channel_enabled:
+        return None
+    key = _key(str(session_id))
+    redis = redis or get_redis()
+    try:
+        async with redis.pipeline(transaction=True) as pipe:
+            pipe.xadd(
+                key,
+                {"type": event_type, "data": json.dumps(data, ensure_ascii=False, default=str)},
+                maxlen=settings.session_channel_maxlen,
+                approximate=True,
+            )
+            pipe.expire(key, settings.session_channel_ttl_seconds)
+            event_id, _ = await pipe.execute()
+    except RedisError as e:
+        metrics.inc("session_channel_publish_errors")
+        logger.warning("Session event not published", session_id=str(session_id), error=str(e))
+        return None
+    metrics.inc("session_channel_published")
+    return str(event_id)
+
+
+class SessionChannel:
+    """Subscription to the events of one session."""
+
+    def __init__(
+        self,
+        session_id: str,
+        last_event_id: str | None = None,
+        redis: Redis | None = None,
+        block_ms: int | None = None,
+    ) -> None:
+        self.session_id = str(session_id)
+        self.last_event_id = validate_event_id(last_event_id) if last_event_id else None
+        self._redis = redis
+        self.block_ms = block_ms or settings.session_channel_block_ms
+
+    @property
+    def redis(self) -> Redis:
+        return self._redis or get_redis()
+
+    async def events(self) -> AsyncIterator[SessionEvent]:
+        """Yield events after ``last_event_id`` (or published from now on).
+
+        Redis errors are retried with backoff, resuming after the last event
+        yielded, so no event is skipped across reconnects.
+        """
+        key = _key(self.session_id)
+        backoff = 0.5
+        while True:
+            try:
+                position = await self.mark_position()
+                response = cast(
+                    StreamReadReply | None,
+                    await self.redis.xread({key: position}, count=100, block=self.block_ms),
+                )
+            except RedisError as e:
+                metrics.inc("session_channel_read_errors")
+                logger.warning(
+                    "Session channel read failed",
+                    session_id=self.session_id,
+                    retry_in=backoff,
+                    error=str(e),
+                )
+                await asyncio.sleep(backoff)
+                backoff = min(backoff * 2, 10)
+                continue
+
+            backoff = 0.5
+            for _, messages in response or []:
+                for event_id, fields in messages:
+                    self.last_event_id = event_id
+                    yield SessionEvent(
+                        id=event_id,
+                        type=fields.get("type", "message"),
+                        data=json.loads(fields.get("data", "null")),
+                    )
+
+    async def mark_position(self) -> str:
+        """Start after the newest event, unless resuming from a client's event ID.
+
+        Call before reading state that later events update, so nothing
+        published in between is missed. Returns the position.
+        """
+        if self.last_event_id is None:
+            latest = cast(
+                list[tuple[str, Any]],
+                await self.redis.xrevrange(_key(self.session_id), count=1),
+            )
+            self.last_event_id = latest[0][0] if latest else "0-0"
+        return self.last_event_id
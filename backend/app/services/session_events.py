@@ -0,0 +1,253 @@
+"""Append-only session telemetry log.
+
+Fine-grained interview telemetry (answer timings, face aggregates,
+reconnects, skips) is recorded into an in-process buffer and written to the
+``session_events`` table in batches with ``COPY`` (asyncpg
+``copy_records_to_table``), never through the ORM on the request path. The
+buffer is flushed when it holds ``session_events_batch_size`` events or every
+``session_events_flush_interval_seconds``. Failed batches are retried with
+backoff and dropped after ``session_events_max_retries`` attempts; while the
+database is unavailable the buffer keeps at most
+``session_events_max_buffered`` events, dropping the oldest. Telemetry is
+best effort: events still buffered when a process dies are lost.
+"""
+
+import asyncio
+import json
+from collections import deque
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.session import engine
+from app.models.interview import InterviewSession, SessionTelemetryEvent
+from app.schemas.session import (
+    SessionEventItem,
+    SessionEventListResponse,
+    SessionEventRequest,
+)
+
+logger = get_logger(__name__)
+
+# (session_id, event_type, payload JSON, occurred_at), in COPY column order
+EventRecord = tuple[UUID, str, str | None, datetime]
+COLUMNS = ("session_id", "event_type", "payload", "occurred_at")
+
+
+async def copy_session_events(records: list[EventRecord]) -> None:
+    """Write events with a single COPY."""
+    async with engine.connect() as conn:
+        raw = await conn.get_raw_connection()
+        if raw.driver_connection is None:
+            raise RuntimeError("Database connection is closed")
+        await raw.driver_connection.copy_records_to_table(
+            SessionTelemetryEvent.__tablename__,
+            records=records,
+            columns=COLUMNS,
+        )
+
+
+class SessionEventBuffer:
+    """Buffers session events and writes them in batches."""
+
+    def __init__(
+        self,
+        writer: Callable[[list[EventRecord]], Awaitable[None]] = copy_session_events,
+        batch_size: int | None = None,
+        flush_interval_seconds: float | None = None,
+        max_buffered: int | None = None,
+        max_retries: int | None = None,
+        retry_backoff_seconds: float = 0.5,
+    ) -> None:
+        self.writer = writer
+        self.batch_size = batch_size or settings.session_events_batch_size
+        self.flush_interval = flush_interval_seconds or settings.session_events_flush_interval_seconds
+        self.max_buffered = max_buffered or settings.session_events_max_buffered
+        self.max_retries = max_retries or settings.session_events_max_retries
+        self.retry_backoff = retry_backoff_seconds
+        self._events: deque[EventRecord] = deque()
+        self._wake = asyncio.Event()
+        self._stopping = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    def record(
+        self,
+        session_id: str | UUID,
+        event_type: str,
+        payload: dict[str, Any] | None = None,
+        occurred_at: datetime | None = None,
+    ) -> None:
+        """Buffer an event; raises ValueError for an invalid session ID."""
+        if occurred_at is None:
+            occurred_at = datetime.now(timezone.utc)
+        elif occurred_at.tzinfo is None:
+            occurred_at = occurred_at.replace(tzinfo=timezone.utc)
+        record = (
+            session_id if isinstance(session_id, UUID) else UUID(session_id),
+            event_type,
+            json.dumps(payload, ensure_ascii=False, default=str) if payload is not None else None,
+            occurred_at,
+        )
+        if len(self._events) >= self.max_buffered:
+            self._events.popleft()
+            metrics.inc("session_events_dropped")
+        self._events.append(record)
+        metrics.inc("session_events_recorded")
+        if len(self._events) >= self.batch_size:
+            self._wake.set()
+
+    async def run(self) -> None:
+        """Flush on size or time thresholds until stopped, then flush the rest."""
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+        await self.flush()
+
+    def stop(self) -> None:
+        """Ask the buffer to flush what it holds and stop."""
+        self._stopping.set()
+        self._wake.set()
+
+    async def flush(self) -> int:
+        """Write the events buffered so far, returning how many were written."""
+        async with self._flush_lock:
+            remaining = len(self._events)
+            written = 0
+            while remaining > 0 and self._events:
+                size = min(self.batch_size, remaining, len(self._events))
+                batch = [self._events.popleft() for _ in range(size)]
+                remaining -= size
+                if await self._write(batch):
+                    written += size
+            metrics.set_gauge("session_events_buffered", len(self._events))
+            return written
+
+    async def _write(self, batch: list[EventRecord]) -> bool:
+        for attempt in range(1, self.max_retries + 1):
+            try:
+                await self.writer(batch)
+            except Exception as e:
+                metrics.inc("session_events_write_errors")
+                logger.warning(
+                    "Session event batch write failed",
+                    size=len(batch),
+                    attempt=attempt,
+                    error=str(e),
+                )
+                if attempt < self.max_retries:
+                    await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+                continue
+            metrics.inc("session_events_written", len(batch))
+            return True
+
+        metrics.inc("session_events_dropped", len(batch))
+        logger.error("Dropped session event batch", size=len(batch), attempts=self.max_retries)
+        return False
+
+
+_buffer: SessionEventBuffer | None = None
+
+
+def get_session_event_buffer() -> SessionEventBuffer:
+    """Get the process-wide session event buffer."""
+    global _buffer
+    if _buffer is None:
+        _buffer = SessionEventBuffer()
+    return _buffer
+
+
+def record_session_event(
+    session_id: str | UUID,
+    event_type: str,
+    payload: dict[str, Any] | None = None,
+    occurred_at: datetime | None = None,
+) -> None:
+    """Record a session event, if the session event log is enabled."""
+    if settings.session_events_enabled:
+        get_session_event_buffer().record(session_id, event_type, payload, occurred_at)
+
+
+class SessionEventService:
+    """Service for session telemetry events."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self.db = db
+
+    async def record_events(
+        self,
+        session_id: str,
+        user_id: str,
+        events: list[SessionEventRequest],
+    ) -> int | None:
+        """Buffer client-reported events of the user's session.
+
+        Returns the number of events accepted, or None if the session does
+        not exist.
+        """
+        if not await self._owns(session_id, user_id):
+            return None
+        for event in events:
+            record_session_event(session_id, event.type, event.data, event.occurred_at)
+        return len(events) if settings.session_events_enabled else 0
+
+    async def list_events(
+        self,
+        session_id: str,
+        user_id: str,
+        after: int | None = None,
+        limit: int = 100,
+        event_type: str | None = None,
+    ) -> SessionEventListResponse | None:
+        """List written events of the user's session in recording order."""
+        if not await self._owns(session_id, user_id):
+            return None
+
+        stmt = (
+            select(SessionTelemetryEvent)
+            .where(SessionTelemetryEvent.session_id == session_id)
+            .order_by(SessionTelemetryEvent.id)
+            .limit(limit + 1)
+        )
+        if after is not None:
+            stmt = stmt.where(SessionTelemetryEvent.id > after)
+        if event_type is not None:
+            stmt = stmt.where(SessionTelemetryEvent.event_type == event_type)
+        result = await self.db.execute(stmt)
+        rows = list(result.scalars().all())
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return SessionEventListResponse(
+            events=[
+                SessionEventItem(
+                    id=row.id,
+                    type=row.event_type,
+                    data=row.payload,
+                    occurred_at=row.occurred_at,
+                )
+                for row in rows
+            ],
+            next_after=rows[-1].id if has_more else None,
+        )
+
+    async def _owns(self, session_id: str, user_id: str) -> bool:
+        stmt = select(InterviewSession.id).where(
+            InterviewSession.id == session_id,
+            InterviewSession.user_id == user_id,
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() is not None
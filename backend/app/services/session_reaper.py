@@ -0,0 +1,131 @@
+"""Marks abandoned in-progress sessions.
+
+Sessions left mid-interview would otherwise stay ``in_progress`` forever. The
+reaper periodically marks sessions with no activity (start or answer) within
+``session_idle_timeout_seconds`` as ``abandoned`` and stops their avatar
+sessions. Each batch is a single
+``UPDATE ... WHERE id IN (SELECT ... LIMIT n FOR UPDATE SKIP LOCKED)``
+committed on its own, so row locks are held only for one small batch and
+sessions being answered concurrently are skipped rather than waited on.
+Several API instances can run the reaper at once.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import and_, exists, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.sql.dml import ReturningUpdate
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.session import async_session_factory
+from app.models.interview import InterviewSession, SessionAnswer
+from app.services.heygen import close_avatar_session
+from app.services.session_state import SessionStateStore
+
+logger = get_logger(__name__)
+
+STATUS_ABANDONED = "abandoned"
+
+
+def reap_batch_statement(
+    cutoff: datetime, batch_size: int
+) -> ReturningUpdate[UUID, str | None]:
+    """Statement marking up to ``batch_size`` sessions idle since ``cutoff``."""
+    recent_answer = exists().where(
+        and_(
+            SessionAnswer.session_id == InterviewSession.id,
+            SessionAnswer.answered_at >= cutoff,
+        )
+    )
+    candidates = (
+        select(InterviewSession.id)
+        .where(
+            InterviewSession.status == "in_progress",
+            InterviewSession.started_at < cutoff,
+            ~recent_answer,
+        )
+        .order_by(InterviewSession.started_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    return (
+        update(InterviewSession)
+        .where(
+            InterviewSession.id.in_(candidates),
+            # Re-checked under the row lock
+            InterviewSession.status == "in_progress",
+        )
+        .values(status=STATUS_ABANDONED)
+        .returning(InterviewSession.id, InterviewSession.heygen_session_id)
+        .execution_options(synchronize_session=False)
+    )
+
+
+class SessionReaper:
+    """Periodically marks idle in-progress sessions as abandoned."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = async_session_factory,
+        idle_timeout_seconds: int | None = None,
+        batch_size: int | None = None,
+        interval_seconds: float | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.idle_timeout = timedelta(
+            seconds=idle_timeout_seconds or settings.session_idle_timeout_seconds
+        )
+        self.batch_size = batch_size or settings.session_reaper_batch_size
+        self.interval = interval_seconds or settings.session_reaper_interval_seconds
+        self.state = SessionStateStore()
+        self._stopping = asyncio.Event()
+
+    async def run(self) -> None:
+        """Reap sessions every interval until stopped."""
+        while not self._stopping.is_set():
+            try:
+                await self.reap()
+            except Exception as e:
+                logger.warning("Session reaper run failed", error=str(e))
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def stop(self) -> None:
+        """Ask the reaper to stop after the current batch."""
+        self._stopping.set()
+
+    async def reap(self) -> int:
+        """Mark idle sessions as abandoned in batches, returning the count."""
+        cutoff = datetime.now(timezone.utc) - self.idle_timeout
+        total = 0
+        for _ in range(settings.session_reaper_max_batches):
+            if self._stopping.is_set():
+                break
+            reaped = await self._reap_batch(cutoff)
+            total += len(reaped)
+            for session_id, heygen_session_id in reaped:
+                await self.state.delete(str(session_id))
+                close_avatar_session(heygen_session_id)
+            if len(reaped) < self.batch_size:
+                break
+
+        metrics.set_gauge("sessions_reaped_last_run", total)
+        if total:
+            logger.info("Marked idle sessions as abandoned", count=total, cutoff=cutoff.isoformat())
+        return total
+
+    async def _reap_batch(self, cutoff: datetime) -> list[tuple[UUID, str | None]]:
+        """Reap one batch, returning the session and avatar session IDs."""
+        async with self.session_factory() as db:
+            result = await db.execute(reap_batch_statement(cutoff, self.batch_size))
+            reaped = [(session_id, avatar_id) for session_id, avatar_id in result.all()]
+            await db.commit()
+        metrics.inc("sessions_reaped_total", len(reaped))
+        return reaped
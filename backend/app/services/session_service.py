@@ -1,18 +1,52 @@
 """Session service for interview session management."""
 
+import base64
+import binascii
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    JSON,
+    Boolean,
+    DateTime,
+    Integer,
+    String,
+    Text,
+    cast,
+    column,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    true,
+    update,
+    values,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.dialects.postgresql import Insert, aggregate_order_by, insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
+from sqlalchemy.sql.dml import ReturningInsert
 
+from app.core.config import settings
+from app.core.pagination import after_cursor, next_cursor
+from app.db.uuid7 import uuid7
 from app.models.interview import InterviewSession, SessionAnswer
-from app.models.question import Script
+from app.models.question import Script, ScriptQuestion
 from app.schemas.session import (
     AnswerInfo,
+    AnswerRequest,
     AnswerResponse,
+    AudioUploadResponse,
+    AudioUploadUrlResponse,
+    BulkAnswerResponse,
+    BulkAnswerResult,
     HeyGenSession,
+    InterviewManifest,
     NextQuestion,
     ScriptInfo,
     SessionCompleteResponse,
@@ -21,13 +55,241 @@ from app.schemas.session import (
     SessionHistoryResponse,
     SessionResponse,
 )
+from app.services.evaluation_jobs import enqueue_evaluation
+from app.services.heygen import close_avatar_session, get_avatar_pool
+from app.services.manifest_service import ManifestService
+from app.services.script_cache import CachedQuestion, get_ordered_questions
+from app.services.session_state import AnswerState, SessionState, SessionStateStore
+from app.services.storage import StorageBackend, audio_key, get_storage, is_audio_key
+from app.services.transcription import schedule_transcription
+
+
+async def _limit_size(chunks: AsyncIterable[bytes], max_bytes: int) -> AsyncIterator[bytes]:
+    """Pass chunks through, failing once the total exceeds max_bytes."""
+    total = 0
+    async for chunk in chunks:
+        total += len(chunk)
+        if total > max_bytes:
+            raise ValueError("Audio data is too large")
+        yield chunk
+
+
+_ANSWER_ROW_COLUMNS = (
+    column("id", PG_UUID(as_uuid=True)),
+    column("question_id", PG_UUID(as_uuid=True)),
+    column("question_order", Integer),
+    column("audio_url", String),
+    column("transcript", Text),
+    column("skipped", Boolean),
+    column("idempotency_key", String),
+)
+
+
+def guarded_answer_insert(
+    session_id: UUID, rows: list[dict[str, Any]], answered_at: datetime
+) -> Insert:
+    """``INSERT ... SELECT`` of answers that inserts nothing unless the session is in progress.
+
+    The session row is read ``FOR SHARE``, so completing or abandoning the
+    session waits for the insert, and an insert after completion sees the
+    new status. Callers add the conflict clause and ``RETURNING``.
+    """
+    answer_rows = values(*_ANSWER_ROW_COLUMNS, name="answer_rows").data(
+        [tuple(row.get(c.name) for c in _ANSWER_ROW_COLUMNS) for row in rows]
+    )
+    source = (
+        select(
+            answer_rows.c.id,
+            InterviewSession.id,
+            answer_rows.c.question_id,
+            answer_rows.c.question_order,
+            answer_rows.c.audio_url,
+            answer_rows.c.transcript,
+            answer_rows.c.skipped,
+            answer_rows.c.idempotency_key,
+            literal(answered_at, DateTime(timezone=True)).label("answered_at"),
+            literal(answered_at, DateTime(timezone=True)).label("created_at"),
+        )
+        .select_from(InterviewSession)
+        .join(answer_rows, true())
+        .where(
+            InterviewSession.id == session_id,
+            InterviewSession.status == "in_progress",
+        )
+        .with_for_update(of=InterviewSession, read=True)
+    )
+    return insert(SessionAnswer).from_select(
+        [
+            "id",
+            "session_id",
+            "question_id",
+            "question_order",
+            "audio_url",
+            "transcript",
+            "skipped",
+            "idempotency_key",
+            "answered_at",
+            "created_at",
+        ],
+        source,
+    )
+
+
+def is_answer_retry(original_key: str | None, idempotency_key: str | None) -> bool:
+    """Whether a submission repeats an answer recorded under ``original_key``.
+
+    Submissions with the same key, or without a key, are retries.
+    """
+    return idempotency_key is None or idempotency_key == original_key
+
+
+def idempotent_answer_statement(
+    session_id: UUID, row: dict[str, Any], answered_at: datetime
+) -> ReturningInsert[UUID, str | None, bool]:
+    """Insert an answer, or return the existing one if the submission is a retry.
+
+    Returns ``(id, transcript, inserted)``; no row if the session is not in
+    progress or the question was already answered under a different key.
+    Mirrors ``is_answer_retry``.
+    """
+    stmt = guarded_answer_insert(session_id, [row], answered_at)
+    return stmt.on_conflict_do_update(
+        constraint="uq_session_answers_session_order",
+        # No-op update so the original row (and its key) is returned
+        set_={"idempotency_key": SessionAnswer.idempotency_key},
+        where=or_(
+            stmt.excluded.idempotency_key.is_(None),
+            SessionAnswer.idempotency_key.is_not_distinct_from(stmt.excluded.idempotency_key),
+        ),
+    ).returning(
+        SessionAnswer.id,
+        SessionAnswer.transcript,
+        literal_column("xmax = 0").label("inserted"),
+    )
+
+
+@dataclass
+class _SessionDetail:
+    """Session state with the text of answered questions."""
+
+    state: SessionState
+    question_texts: dict[int, str]
+    total_questions: int
 
 
 class SessionService:
     """Service for interview session operations."""
 
-    def __init__(self, db: AsyncSession) -> None:
+    def __init__(
+        self,
+        db: AsyncSession,
+        state: SessionStateStore | None = None,
+        storage: StorageBackend | None = None,
+    ) -> None:
         self.db = db
+        self.state = state or SessionStateStore()
+        self.storage = storage or get_storage()
+
+    async def _load_state(self, session_id: str, user_id: str) -> SessionState | None:
+        """Get session state from Redis, rebuilding it from Postgres on a miss."""
+        state = await self.state.get(session_id)
+        if state is not None:
+            return state if state.user_id == str(user_id) else None
+
+        detail = await self._fetch_session_detail(session_id, user_id)
+        return detail.state if detail is not None else None
+
+    async def _fetch_session_detail(self, session_id: str, user_id: str) -> "_SessionDetail | None":
+        """Load a session, its answers with question text and the question count.
+
+        Runs as a single SQL statement: answers are aggregated into JSON and
+        the question count is a correlated subquery. In-progress sessions are
+        written to the state store.
+        """
+        answers = (
+            select(
+                func.coalesce(
+                    func.json_agg(
+                        aggregate_order_by(
+                            func.json_build_object(
+                                "question_order",
+                                SessionAnswer.question_order,
+                                "transcript",
+                                SessionAnswer.transcript,
+                                "answered_at",
+                                SessionAnswer.answered_at,
+                                "question_text",
+                                ScriptQuestion.question_text,
+                            ),
+                            SessionAnswer.question_order,
+                        )
+                    ),
+                    literal_column("'[]'::json"),
+                    type_=JSON,
+                )
+            )
+            .select_from(SessionAnswer)
+            .join(ScriptQuestion, ScriptQuestion.id == SessionAnswer.question_id)
+            .where(SessionAnswer.session_id == InterviewSession.id)
+            .correlate(InterviewSession)
+            .scalar_subquery()
+        )
+        question_count = (
+            select(func.count())
+            .select_from(ScriptQuestion)
+            .where(
+                ScriptQuestion.script_id == InterviewSession.script_id,
+                ScriptQuestion.is_deleted == False,
+            )
+            .correlate(InterviewSession)
+            .scalar_subquery()
+        )
+        stmt = (
+            select(
+                InterviewSession.id,
+                InterviewSession.user_id,
+                InterviewSession.script_id,
+                InterviewSession.status,
+                InterviewSession.started_at,
+                Script.synced_at,
+                answers.label("answers"),
+                question_count.label("total_questions"),
+            )
+            .join(Script, Script.id == InterviewSession.script_id)
+            .where(
+                InterviewSession.id == session_id,
+                InterviewSession.user_id == user_id,
+            )
+        )
+        result = await self.db.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+
+        state = SessionState(
+            session_id=str(row.id),
+            user_id=str(row.user_id),
+            script_id=str(row.script_id),
+            synced_at=row.synced_at,
+            status=row.status,
+            started_at=row.started_at,
+            answers={
+                a["question_order"]: AnswerState(
+                    question_order=a["question_order"],
+                    transcript=a["transcript"],
+                    answered_at=datetime.fromisoformat(a["answered_at"]),
+                )
+                for a in row.answers
+            },
+        )
+        if state.status == "in_progress":
+            await self.state.put(state)
+
+        return _SessionDetail(
+            state=state,
+            question_texts={a["question_order"]: a["question_text"] for a in row.answers},
+            total_questions=row.total_questions,
+        )
 
     async def create_session(
         self,
@@ -57,15 +319,34 @@ class SessionService:
             created_at=now,
         )
 
-        # TODO: Initialize HeyGen session
-        # heygen_session = await self._init_heygen_session()
-        # session.heygen_session_id = heygen_session.session_id
+        # Take a pre-created avatar session (mock token when HeyGen is not configured)
+        avatar_id = settings.heygen_default_avatar_id
         heygen_session_token = "heygen_mock_token"
-        avatar_id = "wayne_asian_male"
-
-        self.db.add(session)
-        await self.db.commit()
-        await self.db.refresh(session)
+        avatar_pool = get_avatar_pool()
+        if avatar_pool is not None:
+            avatar_session = await avatar_pool.acquire(avatar_id)
+            session.heygen_session_id = avatar_session.session_id
+            heygen_session_token = avatar_session.session_token
+
+        try:
+            self.db.add(session)
+            await self.db.commit()
+            await self.db.refresh(session)
+        except BaseException:
+            # No interview will use the avatar session
+            close_avatar_session(session.heygen_session_id)
+            raise
+
+        await self.state.put(
+            SessionState(
+                session_id=str(session.id),
+                user_id=str(session.user_id),
+                script_id=str(script.id),
+                synced_at=script.synced_at,
+                status=session.status,
+                started_at=session.started_at,
+            )
+        )
 
         return SessionCreateResponse(
             session_id=str(session.id),
@@ -79,48 +360,83 @@ class SessionService:
                 avatar_id=avatar_id,
             ),
             started_at=session.started_at,
+            # Never wait for synthesis here; missing audio comes with a manifest refetch
+            manifest=await ManifestService(self.db).build(
+                str(session.id), script, jlpt_level, audio_timeout=0
+            ),
         )
 
-    async def get_session(
+    async def get_manifest(
         self,
         session_id: str,
         user_id: str,
-    ) -> SessionResponse | None:
-        """Get session details."""
+        jlpt_level: str | None = None,
+    ) -> InterviewManifest | None:
+        """Get the interview manifest of a session.
+
+        Defaults to the script's JLPT level.
+        """
         stmt = (
-            select(InterviewSession)
+            select(Script)
+            .join(InterviewSession, InterviewSession.script_id == Script.id)
             .where(
                 InterviewSession.id == session_id,
                 InterviewSession.user_id == user_id,
             )
-            .options(
-                selectinload(InterviewSession.script).selectinload(Script.questions),
-                selectinload(InterviewSession.answers),
-            )
         )
         result = await self.db.execute(stmt)
-        session = result.scalar_one_or_none()
+        script = result.scalar_one_or_none()
 
-        if session is None:
+        if script is None:
             return None
 
+        return await ManifestService(self.db).build(
+            session_id,
+            script,
+            jlpt_level or script.jlpt_level,
+        )
+
+    async def get_session(
+        self,
+        session_id: str,
+        user_id: str,
+    ) -> SessionResponse | None:
+        """Get session details."""
+        state = await self.state.get(session_id)
+        if state is not None and state.user_id == str(user_id):
+            # Hot path: Redis state plus the in-process question cache
+            questions = await get_ordered_questions(self.db, state.script_id, state.synced_at)
+            question_texts = {
+                order: questions[order - 1].question_text
+                for order in state.answers
+                if order <= len(questions)
+            }
+            total_questions = len(questions)
+        else:
+            detail = await self._fetch_session_detail(session_id, user_id)
+            if detail is None:
+                return None
+            state = detail.state
+            question_texts = detail.question_texts
+            total_questions = detail.total_questions
+
         answers = [
             AnswerInfo(
                 question_id=answer.question_order,
-                question_text="",  # Would need to join with questions
+                question_text=question_texts.get(answer.question_order, ""),
                 answer_text=answer.transcript,
                 answered_at=answer.answered_at,
             )
-            for answer in session.answers
+            for answer in sorted(state.answers.values(), key=lambda a: a.question_order)
         ]
 
         return SessionResponse(
-            session_id=str(session.id),
-            status=session.status,
-            current_question=len(session.answers) + 1,
-            total_questions=len(session.script.questions),
+            session_id=state.session_id,
+            status=state.status,
+            current_question=state.current_question,
+            total_questions=total_questions,
             answers=answers,
-            started_at=session.started_at,
+            started_at=state.started_at,
         )
 
     async def submit_answer(
@@ -130,58 +446,113 @@ class SessionService:
         question_id: int,
         audio_data: str | None,
         transcript: str | None,
+        idempotency_key: str | None = None,
     ) -> AnswerResponse:
-        """Submit an answer for a question."""
-        # Get session
-        stmt = (
-            select(InterviewSession)
-            .where(
-                InterviewSession.id == session_id,
-                InterviewSession.user_id == user_id,
-                InterviewSession.status == "in_progress",
-            )
-            .options(selectinload(InterviewSession.script).selectinload(Script.questions))
-        )
-        result = await self.db.execute(stmt)
-        session = result.scalar_one_or_none()
-
-        if session is None:
+        """Submit an answer for a question.
+
+        Retries (a second submission for an answered question with the same
+        idempotency key, or without one) return the original answer without
+        storing audio or scheduling transcription again.
+        """
+        # Get session state
+        state = await self._load_state(session_id, user_id)
+        if state is None or state.status != "in_progress":
             raise ValueError("Session not found or not in progress")
 
         # Get question
-        questions = sorted(session.script.questions, key=lambda q: q.order_number)
+        questions = await get_ordered_questions(self.db, state.script_id, state.synced_at)
         if question_id < 1 or question_id > len(questions):
             raise ValueError("Invalid question ID")
 
         question = questions[question_id - 1]
 
-        # TODO: Upload audio to S3 and get URL
+        if question_id in state.answers:
+            original = await self._find_answer(state.session_id, question_id)
+            if original is None or not is_answer_retry(original.idempotency_key, idempotency_key):
+                raise ValueError("Question already answered")
+            return self._answer_response(original.id, question_id, original.transcript, questions)
+
         audio_url = None
+        audio_bytes = None
         if audio_data:
-            # audio_url = await self._upload_audio(audio_data, session_id, question_id)
-            pass
-
-        # TODO: Transcribe audio if transcript not provided
-        if not transcript and audio_data:
-            # transcript = await self._transcribe_audio(audio_data)
-            pass
+            audio_url, audio_bytes = await self._store_base64_audio(
+                state.session_id, question_id, audio_data
+            )
 
-        # Create answer
+        # Create answer, or return the one a concurrent retry created
         now = datetime.now(timezone.utc)
-        answer = SessionAnswer(
-            session_id=session.id,
-            question_id=question.id,
-            question_order=question_id,
-            audio_url=audio_url,
-            transcript=transcript,
-            skipped=not transcript and not audio_data,
-            answered_at=now,
-            created_at=now,
+        stmt = idempotent_answer_statement(
+            UUID(state.session_id),
+            {
+                "id": uuid7(),
+                "question_id": question.id,
+                "question_order": question_id,
+                "audio_url": audio_url,
+                "transcript": transcript,
+                "skipped": not transcript and not audio_data,
+                "idempotency_key": idempotency_key,
+            },
+            now,
         )
-        self.db.add(answer)
-        await self.db.commit()
-        await self.db.refresh(answer)
+        try:
+            result = await self.db.execute(stmt)
+            answer = result.first()
+            await self.db.commit()
+        except BaseException:
+            await self._discard_audio([audio_url])
+            raise
+        if answer is None or not answer.inserted:
+            # The audio stored above belongs to no answer
+            await self._discard_audio([audio_url])
+        if answer is None:
+            # Not in progress in Postgres (the cached state is stale), or
+            # answered under another key
+            original = await self._find_answer(state.session_id, question_id)
+            if original is None:
+                await self.state.delete(state.session_id)
+                raise ValueError("Session not found or not in progress")
+            if not is_answer_retry(original.idempotency_key, idempotency_key):
+                raise ValueError("Question already answered")
+            return self._answer_response(original.id, question_id, original.transcript, questions)
+        if not answer.inserted:
+            return self._answer_response(answer.id, question_id, answer.transcript, questions)
+
+        await self.state.add_answer(
+            state.session_id,
+            AnswerState(question_order=question_id, transcript=transcript, answered_at=now),
+        )
+
+        # Transcribed in the background and written back to the answer
+        if not transcript and audio_url:
+            schedule_transcription(answer.id, audio_url, audio_bytes)
+
+        return self._answer_response(answer.id, question_id, transcript, questions)
+
+    async def _find_answer(
+        self,
+        session_id: str,
+        question_order: int,
+    ) -> SessionAnswer | None:
+        """Get the recorded answer of a question."""
+        stmt = select(SessionAnswer).where(
+            SessionAnswer.session_id == UUID(session_id),
+            SessionAnswer.question_order == question_order,
+        )
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def _is_in_progress(self, session_id: str) -> bool:
+        stmt = select(InterviewSession.status).where(InterviewSession.id == session_id)
+        result = await self.db.execute(stmt)
+        return result.scalar_one_or_none() == "in_progress"
 
+    @staticmethod
+    def _answer_response(
+        answer_id: UUID,
+        question_id: int,
+        transcript: str | None,
+        questions: Sequence[CachedQuestion],
+    ) -> AnswerResponse:
         # Determine next question
         next_question = None
         if question_id < len(questions):
@@ -192,48 +563,367 @@ class SessionService:
             )
 
         return AnswerResponse(
-            answer_id=str(answer.id),
+            answer_id=str(answer_id),
             question_id=question_id,
             transcript=transcript,
             next_question=next_question,
         )
 
+    async def submit_answers_bulk(
+        self,
+        session_id: str,
+        user_id: str,
+        answers: list[AnswerRequest],
+    ) -> BulkAnswerResponse:
+        """Submit buffered answers in one transaction.
+
+        Answers already recorded (replays) are reported as duplicates and
+        answers for unknown questions are rejected; the rest are inserted with
+        a single multi-row statement.
+        """
+        state = await self._load_state(session_id, user_id)
+        if state is None or state.status != "in_progress":
+            raise ValueError("Session not found or not in progress")
+
+        questions = await get_ordered_questions(self.db, state.script_id, state.synced_at)
+        answered = set(state.answers)
+        now = datetime.now(timezone.utc)
+        results = []
+        rows: list[dict[str, Any]] = []
+        to_transcribe = []
+        for item in answers:
+            if item.question_id < 1 or item.question_id > len(questions):
+                results.append(
+                    BulkAnswerResult(
+                        question_id=item.question_id,
+                        status="rejected",
+                        error="Invalid question ID",
+                    )
+                )
+                continue
+            if item.question_id in answered:
+                results.append(BulkAnswerResult(question_id=item.question_id, status="duplicate"))
+                continue
+
+            audio_url = None
+            audio_bytes = None
+            if item.audio_data:
+                try:
+                    audio_url, audio_bytes = await self._store_base64_audio(
+                        state.session_id, item.question_id, item.audio_data
+                    )
+                except ValueError as e:
+                    results.append(
+                        BulkAnswerResult(question_id=item.question_id, status="rejected", error=str(e))
+                    )
+                    continue
+
+            answered.add(item.question_id)
+            answer_id = uuid7()
+            if audio_url and not item.transcript:
+                to_transcribe.append((answer_id, audio_url, audio_bytes))
+            rows.append(
+                {
+                    "id": answer_id,
+                    "question_id": questions[item.question_id - 1].id,
+                    "question_order": item.question_id,
+                    "audio_url": audio_url,
+                    "transcript": item.transcript,
+                    "skipped": not item.transcript and not item.audio_data,
+                }
+            )
+            results.append(
+                BulkAnswerResult(
+                    question_id=item.question_id,
+                    status="accepted",
+                    answer_id=str(answer_id),
+                )
+            )
+
+        if rows:
+            try:
+                result = await self.db.execute(
+                    guarded_answer_insert(UUID(state.session_id), rows, now)
+                    .on_conflict_do_nothing(constraint="uq_session_answers_session_order")
+                    .returning(SessionAnswer.question_order)
+                )
+                inserted = set(result.scalars().all())
+                await self.db.commit()
+            except BaseException:
+                await self._discard_audio([row["audio_url"] for row in rows])
+                raise
+            # Audio of answers that were not inserted belongs to no answer
+            await self._discard_audio(
+                [row["audio_url"] for row in rows if row["question_order"] not in inserted]
+            )
+            if not inserted and not await self._is_in_progress(state.session_id):
+                await self.state.delete(state.session_id)
+                raise ValueError("Session not found or not in progress")
+            if len(inserted) < len(rows):
+                # Recorded by a concurrent submission in the meantime
+                rows = [row for row in rows if row["question_order"] in inserted]
+                inserted_ids = {row["id"] for row in rows}
+                to_transcribe = [item for item in to_transcribe if item[0] in inserted_ids]
+                results = [
+                    BulkAnswerResult(question_id=r.question_id, status="duplicate")
+                    if r.status == "accepted" and r.question_id not in inserted
+                    else r
+                    for r in results
+                ]
+            await self.state.add_answers(
+                state.session_id,
+                [
+                    AnswerState(
+                        question_order=row["question_order"],
+                        transcript=row["transcript"],
+                        answered_at=now,
+                    )
+                    for row in rows
+                ],
+            )
+            for answer_id, audio_url, audio_bytes in to_transcribe:
+                schedule_transcription(answer_id, audio_url, audio_bytes)
+
+        # Next question is the first one still unanswered
+        next_question = None
+        for order, question in enumerate(questions, start=1):
+            if order not in answered:
+                next_question = NextQuestion(id=order, text=question.question_text)
+                break
+
+        return BulkAnswerResponse(results=results, next_question=next_question)
+
+    async def upload_answer_audio(
+        self,
+        session_id: str,
+        user_id: str,
+        question_id: int,
+        chunks: AsyncIterable[bytes],
+        content_type: str,
+    ) -> AudioUploadResponse:
+        """Stream answer audio into storage and attach it to the answer.
+
+        Creates the answer if the client uploads audio before submitting it.
+        """
+        state = await self._load_state(session_id, user_id)
+        if state is None or state.status != "in_progress":
+            raise ValueError("Session not found or not in progress")
+
+        questions = await get_ordered_questions(self.db, state.script_id, state.synced_at)
+        if question_id < 1 or question_id > len(questions):
+            raise ValueError("Invalid question ID")
+
+        key = audio_key(state.session_id, question_id, content_type)
+        stored = await self.storage.upload_stream(
+            key,
+            _limit_size(chunks, settings.audio_upload_max_bytes),
+            content_type,
+        )
+        if stored.size == 0:
+            await self.storage.delete(key)
+            raise ValueError("Audio data is empty")
+
+        try:
+            answer_id = await self._attach_audio(state, questions[question_id - 1], question_id, key)
+        except BaseException:
+            await self.storage.delete(key)
+            raise
+
+        return AudioUploadResponse(
+            answer_id=str(answer_id),
+            question_id=question_id,
+            audio_url=key,
+            size=stored.size,
+        )
+
+    async def create_audio_upload_url(
+        self,
+        session_id: str,
+        user_id: str,
+        question_id: int,
+        content_type: str,
+    ) -> AudioUploadUrlResponse:
+        """Issue a pre-signed URL for uploading answer audio directly."""
+        state = await self._load_state(session_id, user_id)
+        if state is None or state.status != "in_progress":
+            raise ValueError("Session not found or not in progress")
+
+        questions = await get_ordered_questions(self.db, state.script_id, state.synced_at)
+        if question_id < 1 or question_id > len(questions):
+            raise ValueError("Invalid question ID")
+
+        upload = await self.storage.presign_upload(
+            audio_key(state.session_id, question_id, content_type),
+            content_type,
+            settings.storage_presign_expires_seconds,
+        )
+        return AudioUploadUrlResponse(
+            key=upload.key,
+            upload_url=upload.url,
+            headers=upload.headers,
+            expires_at=upload.expires_at,
+        )
+
+    async def confirm_audio_upload(
+        self,
+        session_id: str,
+        user_id: str,
+        question_id: int,
+        key: str,
+    ) -> AudioUploadResponse:
+        """Attach audio uploaded with a pre-signed URL to the answer."""
+        state = await self._load_state(session_id, user_id)
+        if state is None or state.status != "in_progress":
+            raise ValueError("Session not found or not in progress")
+
+        questions = await get_ordered_questions(self.db, state.script_id, state.synced_at)
+        if question_id < 1 or question_id > len(questions):
+            raise ValueError("Invalid question ID")
+
+        # Keys are issued per session and question; reject anything else
+        if not is_audio_key(key, state.session_id, question_id):
+            raise ValueError("Invalid audio key")
+
+        stored = await self.storage.stat(key)
+        if stored is None or stored.size == 0:
+            raise ValueError("Audio has not been uploaded")
+        if stored.size > settings.audio_upload_max_bytes:
+            await self.storage.delete(key)
+            raise ValueError("Audio data is too large")
+
+        answer_id = await self._attach_audio(state, questions[question_id - 1], question_id, key)
+        return AudioUploadResponse(
+            answer_id=str(answer_id),
+            question_id=question_id,
+            audio_url=key,
+            size=stored.size,
+        )
+
+    async def _attach_audio(
+        self,
+        state: SessionState,
+        question: CachedQuestion,
+        question_order: int,
+        audio_url: str,
+    ) -> UUID:
+        """Set the audio of an answer, creating the answer if needed."""
+        now = datetime.now(timezone.utc)
+        insert_stmt = guarded_answer_insert(
+            UUID(state.session_id),
+            [
+                {
+                    "id": uuid7(),
+                    "question_id": question.id,
+                    "question_order": question_order,
+                    "audio_url": audio_url,
+                    "transcript": None,
+                    "skipped": False,
+                }
+            ],
+            now,
+        )
+        stmt: ReturningInsert[UUID, str | None, bool] = insert_stmt.on_conflict_do_update(
+            constraint="uq_session_answers_session_order",
+            set_={"audio_url": insert_stmt.excluded.audio_url, "skipped": False},
+        ).returning(
+            SessionAnswer.id,
+            SessionAnswer.transcript,
+            literal_column("xmax = 0").label("inserted"),
+        )
+        result = await self.db.execute(stmt)
+        answer = result.first()
+        await self.db.commit()
+        if answer is None:
+            await self.state.delete(state.session_id)
+            raise ValueError("Session not found or not in progress")
+
+        if answer.inserted:
+            await self.state.add_answer(
+                state.session_id,
+                AnswerState(question_order=question_order, transcript=None, answered_at=now),
+            )
+        if answer.transcript is None:
+            schedule_transcription(answer.id, audio_url)
+        answer_id: UUID = answer.id
+        return answer_id
+
+    async def _discard_audio(self, keys: list[str | None]) -> None:
+        """Delete stored audio that ended up attached to no answer."""
+        for key in keys:
+            if key:
+                await self.storage.delete(key)
+
+    async def _store_base64_audio(
+        self,
+        session_id: str,
+        question_order: int,
+        audio_data: str,
+    ) -> tuple[str, bytes]:
+        """Decode base64 audio (optionally a data URL) and store it."""
+        content_type = "application/octet-stream"
+        if audio_data.startswith("data:"):
+            header, _, audio_data = audio_data.partition(",")
+            content_type = header[len("data:") :].split(";")[0] or content_type
+
+        try:
+            data = base64.b64decode(audio_data, validate=True)
+        except binascii.Error:
+            raise ValueError("Invalid audio data")
+        if len(data) > settings.audio_upload_max_bytes:
+            raise ValueError("Audio data is too large")
+
+        key = audio_key(session_id, question_order, content_type)
+        await self.storage.upload_bytes(key, data, content_type)
+        return key, data
+
     async def complete_session(
         self,
         session_id: str,
         user_id: str,
     ) -> SessionCompleteResponse:
         """Complete a session and trigger evaluation."""
-        stmt = select(InterviewSession).where(
-            InterviewSession.id == session_id,
-            InterviewSession.user_id == user_id,
-            InterviewSession.status == "in_progress",
+        # Status change and duration in one statement; the WHERE clause
+        # makes concurrent completions of the same session a no-op
+        stmt = (
+            update(InterviewSession)
+            .where(
+                InterviewSession.id == session_id,
+                InterviewSession.user_id == user_id,
+                InterviewSession.status == "in_progress",
+            )
+            .values(
+                status="completed",
+                completed_at=func.now(),
+                duration_seconds=cast(
+                    func.extract("epoch", func.now() - InterviewSession.started_at),
+                    Integer,
+                ),
+            )
+            .returning(
+                InterviewSession.id,
+                InterviewSession.completed_at,
+                InterviewSession.heygen_session_id,
+            )
+            .execution_options(synchronize_session=False)
         )
         result = await self.db.execute(stmt)
-        session = result.scalar_one_or_none()
+        row = result.one_or_none()
 
-        if session is None:
+        if row is None:
             raise ValueError("Session not found or not in progress")
 
-        # Update session status
-        now = datetime.now(timezone.utc)
-        session.status = "completed"
-        session.completed_at = now
-        if session.started_at:
-            session.duration_seconds = int((now - session.started_at).total_seconds())
+        # Queue the evaluation atomically with the status change
+        job_id = await enqueue_evaluation(self.db, row.id)
 
         await self.db.commit()
-        await self.db.refresh(session)
-
-        # TODO: Trigger evaluation asynchronously
-        # evaluation_id = await self._trigger_evaluation(session)
-        evaluation_id = "eval_placeholder"
+        await self.state.delete(str(row.id))
+        close_avatar_session(row.heygen_session_id)
 
         return SessionCompleteResponse(
-            session_id=str(session.id),
+            session_id=str(row.id),
             status="completed",
-            completed_at=now,
-            evaluation_id=evaluation_id,
+            completed_at=row.completed_at,
+            job_id=str(job_id),
         )
 
     async def get_history(
@@ -241,37 +931,44 @@ class SessionService:
         user_id: str,
         limit: int = 20,
         offset: int = 0,
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> SessionHistoryResponse:
-        """Get session history for a user."""
-        # Count total
-        count_stmt = (
-            select(func.count())
-            .select_from(InterviewSession)
-            .where(
-                InterviewSession.user_id == user_id,
-                InterviewSession.status == "completed",
-            )
-        )
-        total_result = await self.db.execute(count_stmt)
-        total = total_result.scalar() or 0
+        """Get session history for a user.
+
+        With a cursor, the page starts after it (keyset pagination) and the
+        offset is ignored.
+        """
+        filters = [
+            InterviewSession.user_id == user_id,
+            InterviewSession.status == "completed",
+            InterviewSession.completed_at.is_not(None),
+        ]
+
+        total = None
+        if include_total:
+            count_stmt = select(func.count()).select_from(InterviewSession).where(*filters)
+            total_result = await self.db.execute(count_stmt)
+            total = total_result.scalar() or 0
 
-        # Get sessions
+        # Get sessions (one extra row tells whether there is a next page)
         stmt = (
             select(InterviewSession)
-            .where(
-                InterviewSession.user_id == user_id,
-                InterviewSession.status == "completed",
-            )
+            .where(*filters)
             .options(
                 selectinload(InterviewSession.script),
                 selectinload(InterviewSession.evaluation),
             )
-            .order_by(InterviewSession.completed_at.desc())
-            .limit(limit)
-            .offset(offset)
+            .order_by(InterviewSession.completed_at.desc(), InterviewSession.id.desc())
+            .limit(limit + 1)
         )
+        if cursor:
+            stmt = stmt.where(after_cursor(InterviewSession.completed_at, InterviewSession.id, cursor))
+            offset = 0
+        else:
+            stmt = stmt.offset(offset)
         result = await self.db.execute(stmt)
-        sessions = result.scalars().all()
+        sessions = list(result.scalars().all())
 
         items = [
             SessionHistoryItem(
@@ -280,7 +977,7 @@ class SessionService:
                 total_score=session.evaluation.total_score if session.evaluation else None,
                 completed_at=session.completed_at,
             )
-            for session in sessions
+            for session in sessions[:limit]
             if session.completed_at is not None
         ]
 
@@ -289,4 +986,5 @@ class SessionService:
             total=total,
             limit=limit,
             offset=offset,
+            next_cursor=next_cursor(sessions, limit, "completed_at"),
         )
@@ -0,0 +1,264 @@
+"""Per-session WebSocket channel.
+
+One authenticated connection per interview carries everything the client
+used to do with separate requests. Messages are JSON envelopes
+``{"type": ..., "id": ..., "data": ...}``; ``id`` is chosen by the client
+(at most 100 characters) and echoed on the reply.
+
+Client → server:
+    auth        ``{"token": <access token>, "last_event_id": <optional>}``,
+                must be the first message
+    answer      ``AnswerRequest`` → ``answer_result`` (+ ``question``); the
+                message ``id`` is the answer's idempotency key
+    face_frame  ``FaceAnalysisRequest`` → ``face_result``
+    complete    → ``completed``, later ``evaluation``
+    ping        → ``pong``
+
+Server → client:
+    session, answer_result, question, face_result, completed, error, and
+    events published on the session channel (e.g. ``evaluation``,
+    ``transcript``), which carry an ``event_id``. Reconnecting clients pass
+    the last ``event_id`` they saw to receive the events they missed.
+
+The token is verified once per connection, and a database session is opened
+per message instead of per HTTP request. Face frames are analysed
+concurrently with answers; frames arriving while ``ws_max_inflight_frames``
+are being analysed are dropped (the next frame supersedes them). Connects,
+disconnects and answer timings are recorded in the session event log.
+"""
+
+import asyncio
+import json
+import time
+from collections.abc import Coroutine
+from typing import Any
+
+from fastapi import WebSocket, WebSocketDisconnect, status
+from pydantic import BaseModel, ValidationError
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.core.security import verify_token
+from app.db.session import async_session_factory
+from app.schemas.face_analysis import FaceAnalysisRequest
+from app.schemas.session import AnswerRequest
+from app.services.face_queue import analyze_face_frame
+from app.services.session_channel import SessionChannel
+from app.services.session_events import record_session_event
+from app.services.session_service import SessionService
+
+logger = get_logger(__name__)
+
+# Application close codes (4000-4999)
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_NOT_FOUND = 4404
+
+# Message IDs double as answer idempotency keys (VARCHAR(100))
+MAX_MESSAGE_ID_LENGTH = 100
+
+
+class SessionSocket:
+    """Serves one interview session over a WebSocket."""
+
+    def __init__(self, websocket: WebSocket, session_id: str) -> None:
+        self.websocket = websocket
+        self.session_id = session_id
+        self.user_id: str | None = None
+        self._send_lock = asyncio.Lock()
+        self._frames_inflight = 0
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._connected_at = time.monotonic()
+
+    async def run(self) -> None:
+        """Authenticate, then dispatch messages until the client disconnects."""
+        await self.websocket.accept()
+        metrics.inc("session_ws_connections")
+        try:
+            if not await self._authenticate():
+                return
+            while True:
+                message = await self.websocket.receive_json()
+                await self._dispatch(message)
+        except WebSocketDisconnect:
+            pass
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            await self.websocket.close(code=status.WS_1003_UNSUPPORTED_DATA)
+        finally:
+            if self.user_id is not None:
+                record_session_event(
+                    self.session_id,
+                    "ws_disconnected",
+                    {"duration_ms": round((time.monotonic() - self._connected_at) * 1000)},
+                )
+            for task in self._tasks:
+                task.cancel()
+            if self._tasks:
+                await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    @property
+    def _authenticated_user(self) -> str:
+        if self.user_id is None:
+            raise RuntimeError("Session socket is not authenticated")
+        return self.user_id
+
+    async def send(
+        self,
+        message_type: str,
+        data: Any = None,
+        message_id: str | None = None,
+        event_id: str | None = None,
+    ) -> None:
+        """Send an envelope; safe to call from concurrent tasks."""
+        if isinstance(data, BaseModel):
+            data = data.model_dump(mode="json")
+        envelope = {"type": message_type, "id": message_id, "data": data}
+        if event_id is not None:
+            envelope["event_id"] = event_id
+        async with self._send_lock:
+            await self.websocket.send_json(envelope)
+
+    async def _authenticate(self) -> bool:
+        try:
+            message = await asyncio.wait_for(
+                self.websocket.receive_json(),
+                timeout=settings.ws_auth_timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            await self.websocket.close(code=CLOSE_UNAUTHORIZED, reason="Authentication timeout")
+            return False
+
+        data: Any = None
+        if isinstance(message, dict) and message.get("type") == "auth":
+            data = message.get("data")
+        if not isinstance(data, dict):
+            data = {}
+        token = data.get("token")
+        payload = verify_token(token, token_type="access") if isinstance(token, str) and token else None
+        if payload is None:
+            await self.websocket.close(code=CLOSE_UNAUTHORIZED, reason="Invalid or expired token")
+            return False
+        self.user_id = payload["sub"]
+
+        try:
+            channel = SessionChannel(self.session_id, last_event_id=data.get("last_event_id"))
+        except ValueError as e:
+            await self.websocket.close(code=status.WS_1008_POLICY_VIOLATION, reason=str(e))
+            return False
+
+        async with async_session_factory() as db:
+            session = await SessionService(db).get_session(self.session_id, self.user_id)
+        if session is None:
+            await self.websocket.close(code=CLOSE_NOT_FOUND, reason="Session not found")
+            return False
+
+        record_session_event(self.session_id, "ws_connected", {"resumed": channel.last_event_id is not None})
+        await self.send("session", session, message.get("id"))
+        if settings.session_channel_enabled:
+            self._spawn(self._forward_events(channel))
+        return True
+
+    async def _forward_events(self, channel: SessionChannel) -> None:
+        """Deliver events published for the session by any process."""
+        async for event in channel.events():
+            await self.send(event.type, event.data, event_id=event.id)
+
+    async def _dispatch(self, message: Any) -> None:
+        if not isinstance(message, dict):
+            await self._error("Messages must be JSON objects", None)
+            return
+        message_type = message.get("type")
+        message_id = message.get("id")
+        if message_id is not None and len(str(message_id)) > MAX_MESSAGE_ID_LENGTH:
+            await self._error(f"Message id must be at most {MAX_MESSAGE_ID_LENGTH} characters", None)
+            return
+        data = message.get("data") or {}
+
+        try:
+            if message_type == "answer":
+                await self._answer(AnswerRequest.model_validate(data), message_id)
+            elif message_type == "face_frame":
+                self._face_frame(FaceAnalysisRequest.model_validate(data), message_id)
+            elif message_type == "complete":
+                await self._complete(message_id)
+            elif message_type == "ping":
+                await self.send("pong", None, message_id)
+            else:
+                await self._error(f"Unknown message type: {message_type}", message_id)
+                return
+            metrics.inc(f"session_ws_messages_{message_type}")
+        except ValidationError as e:
+            await self._error("Invalid message data", message_id, errors=e.errors(include_url=False, include_context=False))
+        except ValueError as e:
+            await self._error(str(e), message_id)
+        except WebSocketDisconnect:
+            raise
+        except Exception as e:
+            # Keep the connection: one failed message should not end the interview
+            metrics.inc("session_ws_message_errors")
+            logger.exception(
+                "Session message failed",
+                session_id=self.session_id,
+                message_type=message_type,
+                error=str(e),
+            )
+            await self._error("Internal server error", message_id)
+
+    async def _answer(self, request: AnswerRequest, message_id: str | None) -> None:
+        started = time.monotonic()
+        async with async_session_factory() as db:
+            result = await SessionService(db).submit_answer(
+                session_id=self.session_id,
+                user_id=self._authenticated_user,
+                question_id=request.question_id,
+                audio_data=request.audio_data,
+                transcript=request.transcript,
+                # A resent message keeps its ID, so it returns the original answer
+                idempotency_key=str(message_id) if message_id is not None else None,
+            )
+        record_session_event(
+            self.session_id,
+            "answer_submitted",
+            {
+                "question_id": request.question_id,
+                "skipped": not (request.audio_data or request.transcript),
+                "latency_ms": round((time.monotonic() - started) * 1000),
+            },
+        )
+        await self.send("answer_result", result, message_id)
+        if result.next_question is not None:
+            await self.send("question", result.next_question, message_id)
+
+    def _face_frame(self, request: FaceAnalysisRequest, message_id: str | None) -> None:
+        if self._frames_inflight >= settings.ws_max_inflight_frames:
+            metrics.inc("session_ws_frames_dropped")
+            return
+        self._frames_inflight += 1
+        self._spawn(self._analyze_frame(request, message_id))
+
+    async def _analyze_frame(self, request: FaceAnalysisRequest, message_id: str | None) -> None:
+        try:
+            result = await analyze_face_frame(request.image_base64)
+        except Exception as e:
+            logger.warning("Face frame analysis failed", session_id=self.session_id, error=str(e))
+            await self._error("Face analysis failed", message_id)
+            return
+        finally:
+            self._frames_inflight -= 1
+        await self.send("face_result", result, message_id)
+
+    async def _complete(self, message_id: str | None) -> None:
+        async with async_session_factory() as db:
+            result = await SessionService(db).complete_session(
+                self.session_id, self._authenticated_user
+            )
+        # The evaluation result follows as an "evaluation" channel event
+        await self.send("completed", result, message_id)
+
+    async def _error(self, detail: str, message_id: str | None, **extra: Any) -> None:
+        await self.send("error", {"detail": detail, **extra}, message_id)
+
+    def _spawn(self, coro: Coroutine[Any, Any, None]) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
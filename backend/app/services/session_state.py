@@ -0,0 +1,173 @@
+"""Redis-backed hot state for in-progress interview sessions.
+
+Each in-progress session is a Redis hash ``session:state:{id}`` holding the
+session metadata under ``meta`` and one ``answer:{order}`` field per answered
+question, so concurrent answers never overwrite each other. Postgres stays the
+source of truth: the session service writes there first and then updates the
+hash, and rebuilds the hash from Postgres on a miss. Redis errors are treated
+as misses.
+"""
+
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import cast
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+from redis.typing import EncodableT, FieldT
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.redis import get_redis
+
+logger = get_logger(__name__)
+
+KEY_PREFIX = "session:state:"
+META_FIELD = "meta"
+ANSWER_FIELD_PREFIX = "answer:"
+
+
+@dataclass
+class AnswerState:
+    """An answered question."""
+
+    question_order: int
+    transcript: str | None
+    answered_at: datetime
+
+
+@dataclass
+class SessionState:
+    """Hot state of an in-progress session."""
+
+    session_id: str
+    user_id: str
+    script_id: str
+    synced_at: str
+    status: str
+    started_at: datetime
+    answers: dict[int, AnswerState] = field(default_factory=dict)
+
+    @property
+    def current_question(self) -> int:
+        """Next question order to answer (1-based)."""
+        return len(self.answers) + 1
+
+
+def _key(session_id: str) -> str:
+    return f"{KEY_PREFIX}{session_id}"
+
+
+def _dump_answer(answer: AnswerState) -> str:
+    data = asdict(answer)
+    data["answered_at"] = answer.answered_at.isoformat()
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _load_answer(raw: str) -> AnswerState:
+    data = json.loads(raw)
+    data["answered_at"] = datetime.fromisoformat(data["answered_at"])
+    return AnswerState(**data)
+
+
+class SessionStateStore:
+    """Reads and writes session hot state in Redis."""
+
+    def __init__(self, redis: Redis | None = None, ttl_seconds: int | None = None) -> None:
+        self._redis = redis
+        self.ttl_seconds = ttl_seconds or settings.session_state_ttl_seconds
+
+    @property
+    def redis(self) -> Redis:
+        return self._redis or get_redis()
+
+    async def get(self, session_id: str) -> SessionState | None:
+        """Get the state of a session, or None on a miss."""
+        if not settings.session_state_enabled:
+            return None
+        try:
+            data = cast(dict[str, str], await self.redis.hgetall(_key(session_id)))
+        except RedisError as e:
+            self._on_error("get", e)
+            return None
+
+        if META_FIELD not in data:
+            metrics.inc("session_state_misses")
+            return None
+        metrics.inc("session_state_hits")
+
+        meta = json.loads(data.pop(META_FIELD))
+        meta["started_at"] = datetime.fromisoformat(meta["started_at"])
+        answers = {}
+        for name, raw in data.items():
+            if name.startswith(ANSWER_FIELD_PREFIX):
+                answer = _load_answer(raw)
+                answers[answer.question_order] = answer
+        return SessionState(**meta, answers=answers)
+
+    async def put(self, state: SessionState) -> None:
+        """Store the state of a session (e.g. rebuilt from Postgres).
+
+        Answer fields already in the hash are kept: they were written by
+        concurrent answers and are at least as new as this snapshot.
+        """
+        if not settings.session_state_enabled:
+            return
+        meta = asdict(state)
+        meta.pop("answers")
+        meta["started_at"] = state.started_at.isoformat()
+
+        key = _key(state.session_id)
+        try:
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, META_FIELD, json.dumps(meta, ensure_ascii=False))
+                for answer in state.answers.values():
+                    pipe.hsetnx(
+                        key,
+                        f"{ANSWER_FIELD_PREFIX}{answer.question_order}",
+                        _dump_answer(answer),
+                    )
+                pipe.expire(key, self.ttl_seconds)
+                await pipe.execute()
+        except RedisError as e:
+            self._on_error("put", e)
+
+    async def add_answer(self, session_id: str, answer: AnswerState) -> None:
+        """Record an answer on a cached session."""
+        await self.add_answers(session_id, [answer])
+
+    async def add_answers(self, session_id: str, answers: list[AnswerState]) -> None:
+        """Record answers on a cached session."""
+        if not settings.session_state_enabled or not answers:
+            return
+        key = _key(session_id)
+        try:
+            # Only update sessions that are cached; a partial hash would
+            # otherwise look like a session with no metadata
+            if not await self.redis.hexists(key, META_FIELD):
+                return
+            mapping: dict[FieldT, EncodableT] = {
+                f"{ANSWER_FIELD_PREFIX}{a.question_order}": _dump_answer(a) for a in answers
+            }
+            async with self.redis.pipeline(transaction=True) as pipe:
+                pipe.hset(key, mapping=mapping)
+                pipe.expire(key, self.ttl_seconds)
+                await pipe.execute()
+        except RedisError as e:
+            self._on_error("add_answers", e)
+            await self.delete(session_id)
+
+    async def delete(self, session_id: str) -> None:
+        """Drop the state of a session."""
+        if not settings.session_state_enabled:
+            return
+        try:
+            await self.redis.delete(_key(session_id))
+        except RedisError as e:
+            self._on_error("delete", e)
+
+    def _on_error(self, operation: str, error: Exception) -> None:
+        metrics.inc("session_state_errors")
+        logger.warning("Session state unavailable", operation=operation, error=str(error))
@@ -0,0 +1,403 @@
+"""Object storage for answer audio.
+
+Uploads are streamed: request bodies are read in chunks and forwarded to the
+backend without holding the whole recording in memory. The S3 backend uses a
+multipart upload; the local backend writes under ``settings.storage_local_dir``
+and stands in for S3 in development and tests.
+
+Clients can also upload directly to storage with a pre-signed PUT URL. For the
+local backend the URL points at the local storage route and is signed with an
+HMAC instead of SigV4.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import os
+import re
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable, AsyncIterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+from urllib.parse import quote, urlencode
+
+import aiofiles
+
+from app.core.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# S3 requires at least 5 MiB per part (except the last one)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+AUDIO_EXTENSIONS = {
+    "audio/webm": "webm",
+    "audio/ogg": "ogg",
+    "audio/wav": "wav",
+    "audio/x-wav": "wav",
+    "audio/mpeg": "mp3",
+    "audio/mp4": "m4a",
+}
+
+
+class StorageError(Exception):
+    """Raised when an object cannot be stored."""
+
+
+@dataclass
+class StoredObject:
+    """An object written to storage."""
+
+    key: str
+    size: int
+    content_type: str
+
+
+@dataclass
+class PresignedUpload:
+    """A URL the client can PUT an object to directly."""
+
+    key: str
+    url: str
+    headers: dict[str, str]
+    expires_at: datetime
+
+
+def audio_key(session_id: str, question_order: int, content_type: str) -> str:
+    """Build the storage key of an answer recording."""
+    extension = AUDIO_EXTENSIONS.get(content_type.split(";")[0].strip(), "bin")
+    return f"audio/{session_id}/{question_order}-{uuid.uuid4().hex}.{extension}"
+
+
+_AUDIO_KEY_RE = re.compile(
+    r"^audio/(?P<session_id>[0-9a-f-]{36})/(?P<question_order>[1-9][0-9]*)-[0-9a-f]{32}\.(?P<extension>[a-z0-9]+)$"
+)
+
+
+def is_audio_key(key: str, session_id: str, question_order: int) -> bool:
+    """Check that a key is one ``audio_key`` issues for a session and question.
+
+    Keys are matched in full, so no path separators or ``..`` segments can
+    point them at another session's objects.
+    """
+    match = _AUDIO_KEY_RE.match(key)
+    return (
+        match is not None
+        and match["session_id"] == str(session_id)
+        and int(match["question_order"]) == question_order
+        and match["extension"] in {*AUDIO_EXTENSIONS.values(), "bin"}
+    )
+
+
+async def _single_chunk(data: bytes) -> AsyncIterator[bytes]:
+    yield data
+
+
+def sign_local_upload(key: str, content_type: str, expires: int) -> str:
+    """Sign a local storage upload URL."""
+    message = f"{key}\n{content_type}\n{expires}".encode()
+    return hmac.new(settings.jwt_secret_key.encode(), message, hashlib.sha256).hexdigest()
+
+
+def verify_local_upload(key: str, content_type: str, expires: int, signature: str) -> bool:
+    """Check the signature and expiry of a local storage upload URL."""
+    if expires < time.time():
+        return False
+    return hmac.compare_digest(sign_local_upload(key, content_type, expires), signature)
+
+
+class StorageBackend(ABC):
+    """Interface of object storage backends."""
+
+    name: str
+
+    @abstractmethod
+    async def upload_stream(
+        self,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        content_type: str,
+    ) -> StoredObject:
+        """Store an object from a stream of chunks."""
+
+    @abstractmethod
+    async def read(self, key: str) -> bytes:
+        """Read a whole object."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Delete an object if it exists."""
+
+    @abstractmethod
+    async def stat(self, key: str) -> StoredObject | None:
+        """Get an object's metadata, or None if it does not exist."""
+
+    @abstractmethod
+    async def presign_upload(
+        self,
+        key: str,
+        content_type: str,
+        expires_in: int,
+    ) -> PresignedUpload:
+        """Create a URL for uploading an object directly."""
+
+    async def upload_bytes(self, key: str, data: bytes, content_type: str) -> StoredObject:
+        """Store an object held in memory."""
+        return await self.upload_stream(key, _single_chunk(data), content_type)
+
+
+class LocalStorageBackend(StorageBackend):
+    """Stores objects as files under a local directory."""
+
+    name = "local"
+
+    def __init__(self, root: Path | str | None = None) -> None:
+        self.root = Path(root or settings.storage_local_dir).resolve()
+
+    def path_for(self, key: str) -> Path:
+        """Resolve the file path of a key, rejecting keys outside the root."""
+        path = (self.root / key).resolve()
+        if not path.is_relative_to(self.root):
+            raise StorageError(f"Invalid storage key: {key}")
+        return path
+
+    async def upload_stream(
+        self,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        content_type: str,
+    ) -> StoredObject:
+        path = self.path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        size = 0
+        try:
+            async with aiofiles.open(tmp_path, "wb") as f:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    await f.write(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return StoredObject(key=key, size=size, content_type=content_type)
+
+    async def read(self, key: str) -> bytes:
+        try:
+            async with aiofiles.open(self.path_for(key), "rb") as f:
+                data: bytes = await f.read()
+                return data
+        except FileNotFoundError:
+            raise StorageError(f"Object not found: {key}")
+
+    async def delete(self, key: str) -> None:
+        self.path_for(key).unlink(missing_ok=True)
+
+    async def stat(self, key: str) -> StoredObject | None:
+        path = self.path_for(key)
+        if not path.is_file():
+            return None
+        return StoredObject(key=key, size=path.stat().st_size, content_type="application/octet-stream")
+
+    async def presign_upload(
+        self,
+        key: str,
+        content_type: str,
+        expires_in: int,
+    ) -> PresignedUpload:
+        self.path_for(key)
+        expires = int(time.time()) + expires_in
+        query = urlencode(
+            {
+                "expires": expires,
+                "content_type": content_type,
+                "signature": sign_local_upload(key, content_type, expires),
+            }
+        )
+        base_url = settings.storage_local_base_url.rstrip("/")
+        return PresignedUpload(
+            key=key,
+            url=f"{base_url}{settings.api_v1_prefix}/storage/local/{quote(key)}?{query}",
+            headers={"Content-Type": content_type},
+            expires_at=datetime.fromtimestamp(expires, timezone.utc),
+        )
+
+
+class S3StorageBackend(StorageBackend):
+    """Stores objects in S3 using multipart uploads."""
+
+    name = "s3"
+
+    def __init__(
+        self,
+        bucket: str | None = None,
+        client: Any | None = None,
+        part_size: int = MIN_PART_SIZE,
+    ) -> None:
+        self.bucket = bucket or settings.s3_bucket_name
+        self.part_size = max(part_size, MIN_PART_SIZE)
+        self._client = client
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            import boto3
+
+            self._client = boto3.client(
+                "s3",
+                region_name=settings.aws_region,
+                aws_access_key_id=settings.aws_access_key_id or None,
+                aws_secret_access_key=settings.aws_secret_access_key or None,
+            )
+        return self._client
+
+    async def upload_stream(
+        self,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        content_type: str,
+    ) -> StoredObject:
+        buffer = bytearray()
+        size = 0
+        upload_id: str | None = None
+        parts: list[dict[str, Any]] = []
+
+        try:
+            async for chunk in chunks:
+                buffer.extend(chunk)
+                size += len(chunk)
+                while len(buffer) >= self.part_size:
+                    if upload_id is None:
+                        upload_id = await self._create_multipart(key, content_type)
+                    part = bytes(buffer[: self.part_size])
+                    del buffer[: self.part_size]
+                    parts.append(await self._upload_part(key, upload_id, len(parts) + 1, part))
+
+            if upload_id is None:
+                # Small object: a single PUT is cheaper than a multipart upload
+                await asyncio.to_thread(
+                    self.client.put_object,
+                    Bucket=self.bucket,
+                    Key=key,
+                    Body=bytes(buffer),
+                    ContentType=content_type,
+                )
+            else:
+                if buffer:
+                    parts.append(await self._upload_part(key, upload_id, len(parts) + 1, bytes(buffer)))
+                await asyncio.to_thread(
+                    self.client.complete_multipart_upload,
+                    Bucket=self.bucket,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
+        except BaseException:
+            if upload_id is not None:
+                await self._abort_multipart(key, upload_id)
+            raise
+
+        return StoredObject(key=key, size=size, content_type=content_type)
+
+    async def read(self, key: str) -> bytes:
+        def _get() -> bytes:
+            response = self.client.get_object(Bucket=self.bucket, Key=key)
+            body: bytes = response["Body"].read()
+            return body
+
+        return await asyncio.to_thread(_get)
+
+    async def delete(self, key: str) -> None:
+        await asyncio.to_thread(self.client.delete_object, Bucket=self.bucket, Key=key)
+
+    async def stat(self, key: str) -> StoredObject | None:
+        from botocore.exceptions import ClientError
+
+        try:
+            response = await asyncio.to_thread(self.client.head_object, Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return StoredObject(
+            key=key,
+            size=response["ContentLength"],
+            content_type=response.get("ContentType", "application/octet-stream"),
+        )
+
+    async def presign_upload(
+        self,
+        key: str,
+        content_type: str,
+        expires_in: int,
+    ) -> PresignedUpload:
+        # Run in a thread: resolving credentials may hit the instance metadata service
+        url = await asyncio.to_thread(
+            self.client.generate_presigned_url,
+            "put_object",
+            Params={"Bucket": self.bucket, "Key": key, "ContentType": content_type},
+            ExpiresIn=expires_in,
+        )
+        return PresignedUpload(
+            key=key,
+            url=url,
+            headers={"Content-Type": content_type},
+            expires_at=datetime.fromtimestamp(int(time.time()) + expires_in, timezone.utc),
+        )
+
+    async def _create_multipart(self, key: str, content_type: str) -> str:
+        response = await asyncio.to_thread(
+            self.client.create_multipart_upload,
+            Bucket=self.bucket,
+            Key=key,
+            ContentType=content_type,
+        )
+        upload_id: str = response["UploadId"]
+        return upload_id
+
+    async def _upload_part(
+        self,
+        key: str,
+        upload_id: str,
+        part_number: int,
+        data: bytes,
+    ) -> dict[str, Any]:
+        response = await asyncio.to_thread(
+            self.client.upload_part,
+            Bucket=self.bucket,
+            Key=key,
+            UploadId=upload_id,
+            PartNumber=part_number,
+            Body=data,
+        )
+        return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+    async def _abort_multipart(self, key: str, upload_id: str) -> None:
+        try:
+            await asyncio.to_thread(
+                self.client.abort_multipart_upload,
+                Bucket=self.bucket,
+                Key=key,
+                UploadId=upload_id,
+            )
+        except Exception as e:
+            logger.warning("Failed to abort multipart upload", key=key, error=str(e))
+
+
+_storage: StorageBackend | None = None
+
+
+def get_storage() -> StorageBackend:
+    """Get the configured storage backend."""
+    global _storage
+    if _storage is None:
+        if settings.storage_backend == "s3":
+            _storage = S3StorageBackend()
+        else:
+            _storage = LocalStorageBackend()
+    return _storage
@@ -0,0 +1,383 @@
+"""Speech-to-text for answer audio.
+
+Transcription runs off the request path: answer submission schedules a
+write-back task and returns immediately; the transcript is written to
+``SessionAnswer.transcript`` when it is ready.
+
+Requests go through a ``TranscriptionPool``: a bounded queue drained by a
+batcher that groups requests up to the backend's batch size, runs at most
+``max_concurrency`` backend calls at a time, applies a timeout and caches
+results by audio SHA-256 (retried uploads of the same recording are free).
+"""
+
+import asyncio
+import hashlib
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import update
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.db.session import async_session_factory
+from app.models.interview import SessionAnswer
+
+logger = get_logger(__name__)
+
+
+class TranscriptionError(Exception):
+    """Raised when audio cannot be transcribed."""
+
+
+@dataclass(frozen=True)
+class AudioInput:
+    """Audio to transcribe."""
+
+    data: bytes
+    content_type: str = "audio/webm"
+
+    @property
+    def sha256(self) -> str:
+        return hashlib.sha256(self.data).hexdigest()
+
+
+class TranscriptionBackend(ABC):
+    """Interface of speech-to-text backends."""
+
+    name: str
+    # Recordings sent in one backend call
+    max_batch_size: int = 1
+    # Backend calls in flight at once
+    max_concurrency: int = 4
+
+    @abstractmethod
+    async def transcribe_batch(self, inputs: list[AudioInput]) -> list[str]:
+        """Transcribe recordings, returning one transcript per input."""
+
+
+class GoogleSpeechBackend(TranscriptionBackend):
+    """Google Cloud Speech-to-Text (synchronous recognition)."""
+
+    name = "google"
+
+    _ENCODINGS = {
+        "audio/webm": ("WEBM_OPUS", 48000),
+        "audio/ogg": ("OGG_OPUS", 48000),
+        "audio/mpeg": ("MP3", None),
+    }
+
+    def __init__(self, language: str | None = None, max_concurrency: int | None = None) -> None:
+        self.language = language or settings.transcription_language
+        self.max_concurrency = max_concurrency or settings.transcription_max_concurrency
+        self._client = None
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            from google.cloud import speech
+
+            if settings.google_cloud_credentials_path:
+                self._client = speech.SpeechAsyncClient.from_service_account_file(
+                    settings.google_cloud_credentials_path
+                )
+            else:
+                self._client = speech.SpeechAsyncClient()
+        return self._client
+
+    async def transcribe_batch(self, inputs: list[AudioInput]) -> list[str]:
+        # The recognize API takes one recording per request
+        return [await self._recognize(audio) for audio in inputs]
+
+    async def _recognize(self, audio: AudioInput) -> str:
+        from google.cloud import speech
+
+        config = speech.RecognitionConfig(
+            language_code=self.language,
+            enable_automatic_punctuation=True,
+        )
+        encoding, sample_rate = self._ENCODINGS.get(audio.content_type.split(";")[0], (None, None))
+        if encoding is not None:
+            config.encoding = speech.RecognitionConfig.AudioEncoding[encoding]
+        if sample_rate is not None:
+            config.sample_rate_hertz = sample_rate
+
+        response = await self.client.recognize(
+            config=config,
+            audio=speech.RecognitionAudio(content=audio.data),
+        )
+        return "".join(
+            result.alternatives[0].transcript for result in response.results if result.alternatives
+        )
+
+
+class FakeTranscriptionBackend(TranscriptionBackend):
+    """Offline backend for development and tests."""
+
+    name = "fake"
+    max_batch_size = 8
+
+    def __init__(self, transcript: str = "テスト回答です", delay: float = 0.0) -> None:
+        self.transcript = transcript
+        self.delay = delay
+        self.batches: list[int] = []
+
+    async def transcribe_batch(self, inputs: list[AudioInput]) -> list[str]:
+        self.batches.append(len(inputs))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return [self.transcript for _ in inputs]
+
+
+class TranscriptCache:
+    """LRU cache of transcripts keyed by audio SHA-256."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, audio_hash: str) -> str | None:
+        with self._lock:
+            transcript = self._entries.get(audio_hash)
+            if transcript is not None:
+                self._entries.move_to_end(audio_hash)
+            return transcript
+
+    def put(self, audio_hash: str, transcript: str) -> None:
+        with self._lock:
+            self._entries[audio_hash] = transcript
+            self._entries.move_to_end(audio_hash)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class TranscriptionPool:
+    """Bounded, batching front end to a transcription backend."""
+
+    def __init__(
+        self,
+        backend: TranscriptionBackend,
+        cache: TranscriptCache | None = None,
+        queue_size: int | None = None,
+        batch_wait_ms: int | None = None,
+        timeout_seconds: float | None = None,
+    ) -> None:
+        self.backend = backend
+        self.cache = cache or TranscriptCache(settings.transcription_cache_size)
+        self.batch_wait = (batch_wait_ms or settings.transcription_batch_wait_ms) / 1000
+        self.timeout = timeout_seconds or settings.transcription_timeout_seconds
+        self._queue: asyncio.Queue[tuple[str, AudioInput]] = asyncio.Queue(
+            maxsize=queue_size or settings.transcription_queue_size
+        )
+        self._semaphore = asyncio.Semaphore(backend.max_concurrency)
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._batcher: asyncio.Task[None] | None = None
+
+    async def transcribe(self, audio: AudioInput) -> str:
+        """Transcribe a recording, waiting for a queue slot if the pool is full."""
+        audio_hash = audio.sha256
+        cached = self.cache.get(audio_hash)
+        if cached is not None:
+            metrics.inc("transcription_cache_hits")
+            return cached
+
+        # Identical recordings already queued share one backend call
+        future = self._inflight.get(audio_hash)
+        if future is None:
+            self._ensure_started()
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[audio_hash] = future
+            try:
+                await self._queue.put((audio_hash, audio))
+            except BaseException:
+                self._inflight.pop(audio_hash, None)
+                raise
+        return await asyncio.shield(future)
+
+    async def close(self) -> None:
+        """Stop the batcher and wait for running batches."""
+        if self._batcher is not None:
+            self._batcher.cancel()
+            try:
+                await self._batcher
+            except asyncio.CancelledError:
+                pass
+            self._batcher = None
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        for future in self._inflight.values():
+            if not future.done():
+                future.set_exception(TranscriptionError("Transcription pool closed"))
+        self._inflight.clear()
+
+    def _ensure_started(self) -> None:
+        if self._batcher is None or self._batcher.done():
+            self._batcher = asyncio.create_task(self._batch_loop())
+
+    async def _batch_loop(self) -> None:
+        """Group queued recordings into batches and dispatch them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_wait
+            while len(batch) < self.backend.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Wait for a backend slot before taking more work off the queue
+            await self._semaphore.acquire()
+            task = asyncio.create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+            task.add_done_callback(lambda _: self._semaphore.release())
+
+    async def _run_batch(self, batch: list[tuple[str, AudioInput]]) -> None:
+        """Call the backend for a batch and resolve its futures."""
+        started = asyncio.get_running_loop().time()
+        try:
+            transcripts = await asyncio.wait_for(
+                self.backend.transcribe_batch([audio for _, audio in batch]),
+                timeout=self.timeout,
+            )
+            error = None
+            if len(transcripts) != len(batch):
+                # Transcripts are matched to inputs by position; never guess
+                error = TranscriptionError(
+                    f"Backend returned {len(transcripts)} transcripts for {len(batch)} inputs"
+                )
+        except asyncio.TimeoutError:
+            error = TranscriptionError(f"Transcription timed out after {self.timeout}s")
+        except Exception as e:
+            error = TranscriptionError(str(e))
+
+        metrics.set_gauge(
+            "transcription_last_batch_ms",
+            round((asyncio.get_running_loop().time() - started) * 1000, 1),
+        )
+        for i, (audio_hash, _) in enumerate(batch):
+            future = self._inflight.pop(audio_hash, None)
+            if future is None or future.done():
+                continue
+            if error is not None:
+                metrics.inc("transcription_errors")
+                future.set_exception(error)
+            else:
+                self.cache.put(audio_hash, transcripts[i])
+                metrics.inc("transcription_completed")
+                future.set_result(transcripts[i])
+
+
+def create_transcription_backend(name: str | None = None) -> TranscriptionBackend:
+    """Create a transcription backend by name."""
+    name = name or settings.transcription_backend
+    if name == "google":
+        return GoogleSpeechBackend()
+    if name == "fake":
+        return FakeTranscriptionBackend()
+    raise ValueError(f"Unknown transcription backend: {name}")
+
+
+_pool: TranscriptionPool | None = None
+_writebacks: set[asyncio.Task[None]] = set()
+
+
+def get_transcription_pool() -> TranscriptionPool:
+    """Get the process-wide transcription pool."""
+    global _pool
+    if _pool is None:
+        _pool = TranscriptionPool(create_transcription_backend())
+    return _pool
+
+
+async def _write_back(answer_id: UUID, audio_key: str, audio: AudioInput | None) -> None:
+    """Transcribe an answer's audio and store the transcript."""
+    from app.services.session_channel import publish_session_event
+    from app.services.session_state import AnswerState, SessionStateStore
+    from app.services.storage import get_storage
+
+    try:
+        if audio is None:
+            data = await get_storage().read(audio_key)
+            audio = AudioInput(data=data, content_type=_content_type_for(audio_key))
+        transcript = await get_transcription_pool().transcribe(audio)
+    except Exception as e:
+        logger.warning("Transcription failed", answer_id=str(answer_id), error=str(e))
+        return
+
+    async with async_session_factory() as db:
+        # Never overwrite a transcript supplied by the client
+        result = await db.execute(
+            update(SessionAnswer)
+            .where(SessionAnswer.id == answer_id, SessionAnswer.transcript.is_(None))
+            .values(transcript=transcript)
+            .returning(
+                SessionAnswer.session_id,
+                SessionAnswer.question_order,
+                SessionAnswer.answered_at,
+            )
+        )
+        row = result.one_or_none()
+        await db.commit()
+
+    if row is not None:
+        await SessionStateStore().add_answer(
+            str(row.session_id),
+            AnswerState(
+                question_order=row.question_order,
+                transcript=transcript,
+                answered_at=row.answered_at,
+            ),
+        )
+        await publish_session_event(
+            row.session_id,
+            "transcript",
+            {"question_id": row.question_order, "transcript": transcript},
+        )
+
+
+def _content_type_for(audio_key: str) -> str:
+    from app.services.storage import AUDIO_EXTENSIONS
+
+    extension = audio_key.rsplit(".", 1)[-1]
+    for content_type, ext in AUDIO_EXTENSIONS.items():
+        if ext == extension:
+            return content_type
+    return "application/octet-stream"
+
+
+def schedule_transcription(
+    answer_id: UUID,
+    audio_key: str,
+    data: bytes | None = None,
+    content_type: str | None = None,
+) -> None:
+    """Transcribe an answer in the background and write the transcript back."""
+    if not settings.transcription_enabled:
+        return
+    audio = None
+    if data is not None:
+        audio = AudioInput(data=data, content_type=content_type or _content_type_for(audio_key))
+    task = asyncio.create_task(_write_back(answer_id, audio_key, audio))
+    _writebacks.add(task)
+    task.add_done_callback(_writebacks.discard)
+
+
+async def close_transcription() -> None:
+    """Wait for pending write-backs and stop the pool."""
+    global _pool
+    if _writebacks:
+        await asyncio.wait(_writebacks, timeout=settings.transcription_timeout_seconds)
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
@@ -0,0 +1,293 @@
+"""Text-to-speech assets for interview questions.
+
+Question texts are spoken at a handful of JLPT speech rates, so audio is
+synthesised once per (backend, voice, speech rate, text) and reused. Assets
+are content-addressed by the SHA-256 of that tuple and stored in object
+storage under ``tts/``; a size-bounded local disk tier (LRU) in front of it
+serves hot assets without a storage round-trip. Concurrent requests for the
+same asset share one synthesis.
+"""
+
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import aiofiles
+
+from app.core.config import settings
+from app.core.logging import get_logger
+from app.core.metrics import metrics
+from app.services.storage import StorageBackend, get_storage
+
+logger = get_logger(__name__)
+
+_HASH_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class TTSError(Exception):
+    """Raised when speech cannot be synthesised."""
+
+
+class TTSBackend(ABC):
+    """Interface of text-to-speech backends."""
+
+    name: str
+    content_type: str = "audio/mpeg"
+    extension: str = "mp3"
+
+    @abstractmethod
+    async def synthesize(self, text: str, voice: str, speech_rate: float) -> bytes:
+        """Synthesise speech for a text."""
+
+
+class OpenAITTSBackend(TTSBackend):
+    """OpenAI speech API."""
+
+    name = "openai"
+
+    def __init__(self, model: str | None = None) -> None:
+        self.model = model or settings.tts_model
+        self._client = None
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            from openai import AsyncOpenAI
+
+            self._client = AsyncOpenAI(api_key=settings.openai_api_key)
+        return self._client
+
+    async def synthesize(self, text: str, voice: str, speech_rate: float) -> bytes:
+        try:
+            response = await self.client.audio.speech.create(
+                model=self.model,
+                voice=voice,
+                input=text,
+                speed=max(0.25, min(speech_rate, 4.0)),
+                response_format="mp3",
+            )
+        except Exception as e:
+            raise TTSError(str(e))
+        content: bytes = response.content
+        return content
+
+
+class FakeTTSBackend(TTSBackend):
+    """Offline backend for development and tests."""
+
+    name = "fake"
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.calls: list[tuple[str, str, float]] = []
+
+    async def synthesize(self, text: str, voice: str, speech_rate: float) -> bytes:
+        self.calls.append((text, voice, speech_rate))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return f"{voice}:{speech_rate}:{text}".encode()
+
+
+def asset_hash(backend: str, voice: str, speech_rate: float, text: str) -> str:
+    """Content address of a synthesised text."""
+    payload = json.dumps(
+        [backend, voice, round(speech_rate, 3), text],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def is_asset_hash(value: str) -> bool:
+    return bool(_HASH_RE.match(value))
+
+
+def tts_url(audio_hash: str) -> str:
+    """URL the client fetches an asset from."""
+    return f"{settings.api_v1_prefix}/tts/{audio_hash}"
+
+
+class LocalAssetCache:
+    """Size-bounded LRU cache of assets on local disk."""
+
+    def __init__(self, root: Path | str, max_bytes: int) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._load()
+
+    def path_for(self, audio_hash: str) -> Path:
+        return self.root / audio_hash[:2] / audio_hash
+
+    def get(self, audio_hash: str) -> Path | None:
+        """Path of a cached asset, marking it recently used."""
+        with self._lock:
+            if audio_hash not in self._entries:
+                return None
+            self._entries.move_to_end(audio_hash)
+        return self.path_for(audio_hash)
+
+    async def put(self, audio_hash: str, data: bytes) -> Path:
+        """Write an asset, evicting least recently used ones over the size limit."""
+        path = self.path_for(audio_hash)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        async with aiofiles.open(tmp_path, "wb") as f:
+            await f.write(data)
+        os.replace(tmp_path, path)
+
+        evicted = []
+        with self._lock:
+            self._size -= self._entries.pop(audio_hash, 0)
+            self._entries[audio_hash] = len(data)
+            self._size += len(data)
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                old_hash, size = self._entries.popitem(last=False)
+                self._size -= size
+                evicted.append(old_hash)
+        for old_hash in evicted:
+            self.path_for(old_hash).unlink(missing_ok=True)
+            metrics.inc("tts_local_evictions")
+        return path
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def _load(self) -> None:
+        """Index assets left by a previous process, oldest access first."""
+        if not self.root.is_dir():
+            return
+        files = [p for p in self.root.glob("*/*") if p.is_file() and is_asset_hash(p.name)]
+        for path in sorted(files, key=lambda p: p.stat().st_atime):
+            size = path.stat().st_size
+            self._entries[path.name] = size
+            self._size += size
+
+
+class TTSAssetStore:
+    """Synthesises, stores and looks up question audio."""
+
+    def __init__(
+        self,
+        backend: TTSBackend,
+        storage: StorageBackend | None = None,
+        local: LocalAssetCache | None = None,
+        voice: str | None = None,
+    ) -> None:
+        self.backend = backend
+        self._storage = storage
+        self.local = local or LocalAssetCache(settings.tts_cache_dir, settings.tts_cache_max_bytes)
+        self.voice = voice or settings.tts_voice
+        self._semaphore = asyncio.Semaphore(settings.tts_max_concurrency)
+        self._inflight: dict[str, asyncio.Future[str]] = {}
+
+    @property
+    def storage(self) -> StorageBackend:
+        return self._storage or get_storage()
+
+    def storage_key(self, audio_hash: str) -> str:
+        return f"tts/{audio_hash[:2]}/{audio_hash}.{self.backend.extension}"
+
+    def cached(self, text: str, speech_rate: float, voice: str | None = None) -> str | None:
+        """Asset hash of a text if it is cached locally, without synthesising it."""
+        audio_hash = asset_hash(self.backend.name, voice or self.voice, speech_rate, text)
+        if self.local.get(audio_hash) is None:
+            return None
+        metrics.inc("tts_local_hits")
+        return audio_hash
+
+    async def ensure(self, text: str, speech_rate: float, voice: str | None = None) -> str:
+        """Synthesise a text if needed, returning its asset hash."""
+        voice = voice or self.voice
+        audio_hash = asset_hash(self.backend.name, voice, speech_rate, text)
+        if self.local.get(audio_hash) is not None:
+            metrics.inc("tts_local_hits")
+            return audio_hash
+
+        future = self._inflight.get(audio_hash)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[audio_hash] = future
+            try:
+                await self._materialize(audio_hash, text, voice, speech_rate)
+                future.set_result(audio_hash)
+            except asyncio.CancelledError:
+                future.cancel()
+                raise
+            except Exception as e:
+                future.set_exception(e)
+                # Mark as retrieved; waiters (if any) get it through the shield
+                future.exception()
+                raise
+            finally:
+                self._inflight.pop(audio_hash, None)
+        return await asyncio.shield(future)
+
+    async def read(self, audio_hash: str) -> bytes | None:
+        """Contents of an asset, fetching it from storage on a local miss."""
+        path = self.local.get(audio_hash)
+        if path is not None:
+            try:
+                async with aiofiles.open(path, "rb") as f:
+                    data: bytes = await f.read()
+                    return data
+            except FileNotFoundError:
+                # Evicted by a concurrent put since the lookup
+                metrics.inc("tts_local_eviction_races")
+        try:
+            data = await self.storage.read(self.storage_key(audio_hash))
+        except Exception:
+            return None
+        metrics.inc("tts_storage_hits")
+        await self.local.put(audio_hash, data)
+        return data
+
+    async def _materialize(self, audio_hash: str, text: str, voice: str, speech_rate: float) -> None:
+        key = self.storage_key(audio_hash)
+        if await self.storage.stat(key) is not None:
+            metrics.inc("tts_storage_hits")
+            await self.local.put(audio_hash, await self.storage.read(key))
+            return
+
+        async with self._semaphore:
+            try:
+                data = await self.backend.synthesize(text, voice, speech_rate)
+            except TTSError:
+                raise
+            except Exception as e:
+                raise TTSError(str(e))
+        metrics.inc("tts_synthesized")
+        await self.storage.upload_bytes(key, data, self.backend.content_type)
+        await self.local.put(audio_hash, data)
+
+
+def create_tts_backend(name: str | None = None) -> TTSBackend:
+    """Create a TTS backend by name."""
+    name = name or settings.tts_backend
+    if name == "openai":
+        return OpenAITTSBackend()
+    if name == "fake":
+        return FakeTTSBackend()
+    raise ValueError(f"Unknown TTS backend: {name}")
+
+
+_store: TTSAssetStore | None = None
+
+
+def get_tts_store() -> TTSAssetStore:
+    """Get the process-wide TTS asset store."""
+    global _store
+    if _store is None:
+        _store = TTSAssetStore(create_tts_backend())
+    return _store
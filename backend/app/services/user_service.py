@@ -1,8 +1,10 @@
 """User service for user management."""
 
+from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.user import User
@@ -45,33 +47,53 @@ class UserService:
             return None
 
     async def get_or_create_user(self, user_data: dict[str, Any]) -> User:
-        """Get existing user or create a new one from SSO data."""
-        # Try to find existing user
-        stmt = select(User).where(User.mintoku_user_id == user_data["mintoku_user_id"])
+        """Get existing user or create a new one from SSO data.
+
+        Existing users get their SSO profile refreshed in a single UPDATE,
+        keeping their email and name when the SSO data omits them. The insert
+        only runs on a first login.
+        """
+        now = datetime.now(timezone.utc)
+        profile = {
+            "organization": user_data.get("organization"),
+            "jlpt_level": user_data.get("jlpt_level"),
+        }
+        for key in ("email", "name"):
+            if user_data.get(key) is not None:
+                profile[key] = user_data[key]
+
+        stmt = (
+            update(User)
+            .where(User.mintoku_user_id == user_data["mintoku_user_id"])
+            .values(**profile, updated_at=now)
+            .returning(User)
+            .execution_options(populate_existing=True)
+        )
         result = await self.db.execute(stmt)
         user = result.scalar_one_or_none()
 
-        if user is not None:
-            # Update user info from SSO
-            user.email = user_data.get("email", user.email)
-            user.name = user_data.get("name", user.name)
-            user.organization = user_data.get("organization")
-            user.jlpt_level = user_data.get("jlpt_level")
-            await self.db.commit()
-            await self.db.refresh(user)
-            return user
-
-        # Create new user
-        user = User(
-            mintoku_user_id=user_data["mintoku_user_id"],
-            email=user_data["email"],
-            name=user_data["name"],
-            organization=user_data.get("organization"),
-            jlpt_level=user_data.get("jlpt_level"),
-        )
-        self.db.add(user)
+        if user is None:
+            # A concurrent first login turns the insert into the same update
+            insert_stmt = (
+                insert(User)
+                .values(
+                    mintoku_user_id=user_data["mintoku_user_id"],
+                    email=user_data["email"],
+                    name=user_data["name"],
+                    organization=profile["organization"],
+                    jlpt_level=profile["jlpt_level"],
+                )
+                .on_conflict_do_update(
+                    index_elements=[User.mintoku_user_id],
+                    set_={**profile, "updated_at": now},
+                )
+                .returning(User)
+                .execution_options(populate_existing=True)
+            )
+            result = await self.db.execute(insert_stmt)
+            user = result.scalar_one()
+
         await self.db.commit()
-        await self.db.refresh(user)
         return user
 
     async def get_user_by_id(self, user_id: str) -> User | None:
@@ -0,0 +1,44 @@
+"""Evaluation worker process.
+
+Usage:
+    python -m app.workers.evaluation_worker [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import signal
+
+from app.core.logging import get_logger, setup_logging
+from app.db.redis import close_redis
+from app.db.session import engine
+from app.services.evaluation_jobs import EvaluationJobWorker
+
+logger = get_logger(__name__)
+
+
+async def run_worker(concurrency: int | None = None) -> None:
+    """Run an evaluation worker until SIGINT/SIGTERM."""
+    worker = EvaluationJobWorker(concurrency=concurrency)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await close_redis()
+        await engine.dispose()
+
+
+def main() -> None:
+    """Worker entry point."""
+    parser = argparse.ArgumentParser(prog="python -m app.workers.evaluation_worker")
+    parser.add_argument("--concurrency", type=int, help="Jobs run in parallel")
+    args = parser.parse_args()
+
+    setup_logging()
+    asyncio.run(run_worker(concurrency=args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
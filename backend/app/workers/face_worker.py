@@ -0,0 +1,47 @@
+"""Face inference worker process.
+
+Usage:
+    python -m app.workers.face_worker [--concurrency N]
+"""
+
+import argparse
+import asyncio
+import signal
+
+from app.core.logging import get_logger, setup_logging
+from app.db.redis import close_redis
+from app.services.face_detection import init_face_detector
+from app.services.face_queue import FaceInferenceWorker
+from app.services.model_registry import configure_model_environment
+
+logger = get_logger(__name__)
+
+
+async def run_worker(concurrency: int | None = None) -> None:
+    """Run a face worker until SIGINT/SIGTERM."""
+    configure_model_environment()
+    init_face_detector()
+
+    worker = FaceInferenceWorker(concurrency=concurrency)
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, worker.stop)
+
+    try:
+        await worker.run()
+    finally:
+        await close_redis()
+
+
+def main() -> None:
+    """Worker entry point."""
+    parser = argparse.ArgumentParser(prog="python -m app.workers.face_worker")
+    parser.add_argument("--concurrency", type=int, help="Frames processed in parallel")
+    args = parser.parse_args()
+
+    setup_logging()
+    asyncio.run(run_worker(concurrency=args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
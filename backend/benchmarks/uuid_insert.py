@@ -0,0 +1,116 @@
+"""Insert benchmark: random UUIDv4 vs time-ordered UUIDv7 primary keys.
+
+Inserts the same number of rows into two scratch tables shaped like
+``session_answers`` (UUID primary key plus a few columns), one keyed by
+``uuid4`` and one by ``uuid7``, and reports throughput, primary key index
+size and the WAL written. Run against a disposable database:
+
+    python -m benchmarks.uuid_insert --rows 1000000 --batch 1000
+
+The database defaults to the application's (POSTGRES_* settings).
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timezone
+
+import asyncpg
+
+from app.core.config import settings
+from app.db.uuid7 import uuid7
+
+SCHEMES: dict[str, Callable[[], uuid.UUID]] = {"uuid4": uuid.uuid4, "uuid7": uuid7}
+
+
+async def run_scheme(
+    conn: asyncpg.Connection,
+    name: str,
+    generate: Callable[[], uuid.UUID],
+    rows: int,
+    batch: int,
+) -> dict:
+    table = f"bench_pk_{name}"
+    await conn.execute(f"DROP TABLE IF EXISTS {table}")
+    await conn.execute(
+        f"""
+        CREATE TABLE {table} (
+            id uuid PRIMARY KEY,
+            session_id uuid NOT NULL,
+            question_order integer NOT NULL,
+            transcript text,
+            created_at timestamptz NOT NULL
+        )
+        """
+    )
+    insert = (
+        f"INSERT INTO {table} (id, session_id, question_order, transcript, created_at) "
+        f"SELECT * FROM unnest($1::uuid[], $2::uuid[], $3::int[], $4::text[], $5::timestamptz[])"
+    )
+
+    wal_start = await conn.fetchval("SELECT pg_current_wal_insert_lsn()")
+    started = time.perf_counter()
+    for offset in range(0, rows, batch):
+        size = min(batch, rows - offset)
+        now = datetime.now(timezone.utc)
+        session_id = generate()
+        await conn.execute(
+            insert,
+            [generate() for _ in range(size)],
+            [session_id] * size,
+            [(offset + i) % 10 + 1 for i in range(size)],
+            ["はい、よろしくお願いします。"] * size,
+            [now] * size,
+        )
+    elapsed = time.perf_counter() - started
+    wal_bytes = await conn.fetchval(
+        "SELECT pg_wal_lsn_diff(pg_current_wal_insert_lsn(), $1)", wal_start
+    )
+
+    await conn.execute(f"VACUUM ANALYZE {table}")
+    index_bytes = await conn.fetchval(f"SELECT pg_relation_size('{table}_pkey')")
+    table_bytes = await conn.fetchval(f"SELECT pg_relation_size('{table}')")
+    await conn.execute(f"DROP TABLE {table}")
+
+    return {
+        "scheme": name,
+        "rows_per_second": rows / elapsed,
+        "seconds": elapsed,
+        "index_mb": index_bytes / 2**20,
+        "table_mb": table_bytes / 2**20,
+        "wal_mb": float(wal_bytes) / 2**20,
+    }
+
+
+async def main(rows: int, batch: int, dsn: str) -> None:
+    conn = await asyncpg.connect(dsn)
+    try:
+        results = [
+            await run_scheme(conn, name, generate, rows, batch)
+            for name, generate in SCHEMES.items()
+        ]
+    finally:
+        await conn.close()
+
+    print(f"{rows} rows, batches of {batch}")
+    print(f"{'scheme':<8}{'rows/s':>12}{'seconds':>10}{'index MB':>10}{'table MB':>10}{'WAL MB':>10}")
+    for r in results:
+        print(
+            f"{r['scheme']:<8}{r['rows_per_second']:>12.0f}{r['seconds']:>10.1f}"
+            f"{r['index_mb']:>10.1f}{r['table_mb']:>10.1f}{r['wal_mb']:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.uuid_insert")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch", type=int, default=1000)
+    parser.add_argument(
+        "--dsn",
+        default=settings.database_url.replace("postgresql+asyncpg://", "postgresql://"),
+        help="PostgreSQL DSN (default: application database)",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.batch, args.dsn))
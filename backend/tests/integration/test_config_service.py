@@ -0,0 +1,91 @@
+"""Integration tests for evaluation config updates.
+
+Run against the PostgreSQL test database, on the session event loop the
+engine fixture was created on.
+"""
+
+import uuid
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.security import get_password_hash
+from app.models.admin import Admin
+from app.models.evaluation_config import EvaluationConfig, EvaluationConfigHistory
+from app.schemas.evaluation_config import EvaluationConfigUpdateRequest
+from app.services.config_service import ConfigService
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+SCORING_CONFIG = {
+    "gradeThresholds": [
+        {"grade": "A", "label": "優秀", "minScore": 80, "recommendation": "推薦"},
+        {"grade": "B", "label": "良好", "minScore": 0, "recommendation": "条件付き"},
+    ],
+    "performanceGrades": {"excellentMin": 80, "goodMin": 60, "passMin": 40},
+    "levelAdjustment": {"highThreshold": 80, "lowThreshold": 40, "dailyChallengeLimit": 3},
+    "jobSuitability": {},
+}
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session(test_engine):
+    """Database session on the engine's event loop."""
+    async with async_sessionmaker(test_engine, expire_on_commit=False)() as session:
+        yield session
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def admin_id(db_session: AsyncSession):
+    """An admin and a scoring config row, removed afterwards."""
+    admin = Admin(
+        email=f"{uuid.uuid4().hex}@example.com",
+        name="Config Admin",
+        password_hash=get_password_hash("securepassword123"),
+        role="admin",
+    )
+    db_session.add(admin)
+    db_session.add(
+        EvaluationConfig(config_key="scoring_config", config_value=SCORING_CONFIG, version=1)
+    )
+    await db_session.commit()
+
+    yield str(admin.id)
+
+    await db_session.execute(delete(EvaluationConfigHistory))
+    await db_session.execute(delete(EvaluationConfig))
+    await db_session.execute(delete(Admin).where(Admin.id == admin.id))
+    await db_session.commit()
+
+
+async def test_update_config_records_history(db_session: AsyncSession, admin_id: str):
+    """Test that an update bumps the version and records the previous value."""
+    new_value = {**SCORING_CONFIG, "jobSuitability": {"介護": {"requiredLevel": "N3", "minScore": 60}}}
+
+    result = await ConfigService(db_session).update_config(
+        "scoring_config",
+        EvaluationConfigUpdateRequest(config_value=new_value, description="updated"),
+        admin_id,
+    )
+
+    assert result is not None
+    assert result.version == 2
+    assert result.description == "updated"
+    assert result.updated_by == admin_id
+    assert result.config_value["jobSuitability"]["介護"]["minScore"] == 60
+
+    history = (await db_session.execute(select(EvaluationConfigHistory))).scalars().all()
+    assert len(history) == 1
+    assert history[0].previous_value == SCORING_CONFIG
+    assert history[0].version == 2
+
+
+async def test_update_missing_config(db_session: AsyncSession, admin_id: str):
+    """Test that keys without a config row are not found, valid value or not."""
+    service = ConfigService(db_session)
+    request = EvaluationConfigUpdateRequest(config_value=SCORING_CONFIG)
+
+    assert await service.update_config("weak_point_config", request, admin_id) is None
+    assert await service.update_config("no_such_config", request, admin_id) is None
@@ -0,0 +1,170 @@
+"""Integration tests for session evaluation.
+
+Run against the PostgreSQL test database, on the session event loop the
+engine fixture was created on.
+"""
+
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.evaluation import Evaluation, EvaluationDetail
+from app.models.interview import InterviewSession, SessionAnswer
+from app.models.question import Script, ScriptQuestion
+from app.models.user import User, WeakPoint
+from app.services.answer_scoring import FakeAnswerScorer
+from app.services.evaluation_service import EvaluationService
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+LONG_ANSWER = "私は前職でホテルのフロント業務を三年間担当しており、" * 5
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session(test_engine):
+    """Database session on the engine's event loop."""
+    async with async_sessionmaker(test_engine, expire_on_commit=False)() as session:
+        yield session
+        await session.rollback()
+        await session.execute(delete(User))
+        await session.execute(delete(Script))
+        await session.commit()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def script(db_session: AsyncSession) -> Script:
+    """N3 script with three questions."""
+    script = Script(
+        mintoku_script_id=f"script-{uuid.uuid4().hex[:8]}",
+        title="接客業面接",
+        jlpt_level="N3",
+        synced_at="2026-01-01T00:00:00Z",
+        questions=[
+            ScriptQuestion(order_number=n, question_text=f"質問{n}") for n in (1, 2, 3)
+        ],
+    )
+    db_session.add(script)
+    await db_session.commit()
+    return script
+
+
+async def _completed_session(
+    db: AsyncSession,
+    user: User,
+    script: Script,
+    transcripts: list[str | None],
+    audio_url: str | None = None,
+) -> InterviewSession:
+    """Completed session with an answer (None: skipped) per question."""
+    now = datetime.now(timezone.utc)
+    session = InterviewSession(
+        user_id=user.id,
+        script_id=script.id,
+        status="completed",
+        started_at=now - timedelta(minutes=10),
+        completed_at=now,
+        created_at=now,
+    )
+    db.add(session)
+    await db.flush()
+    for question, transcript in zip(script.questions, transcripts, strict=True):
+        db.add(
+            SessionAnswer(
+                session_id=session.id,
+                question_id=question.id,
+                question_order=question.order_number,
+                transcript=transcript,
+                audio_url=audio_url if transcript is None else None,
+                skipped=transcript is None and audio_url is None,
+                answered_at=now,
+                created_at=now,
+            )
+        )
+    await db.commit()
+    return session
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def user(db_session: AsyncSession, sample_user_data: dict[str, Any]) -> User:
+    """User taking the sessions."""
+    user = User(**sample_user_data)
+    db_session.add(user)
+    await db_session.commit()
+    return user
+
+
+async def test_scores_answered_questions(db_session: AsyncSession, user: User, script: Script):
+    """Test that answered questions are scored and stored with weak points."""
+    session = await _completed_session(db_session, user, script, [LONG_ANSWER, "はい", None])
+    scorer = FakeAnswerScorer()
+
+    evaluation_id = await EvaluationService(db_session).evaluate_session(session.id, scorer)
+    await db_session.commit()
+
+    # Skipped questions are not scored
+    assert [call[1] for call in scorer.calls] == [LONG_ANSWER, "はい"]
+    assert all(call[2] == "N3" for call in scorer.calls)
+
+    evaluation = await db_session.get(Evaluation, evaluation_id)
+    assert evaluation is not None
+    # Category scores average 85 and 50
+    assert evaluation.total_score == 68
+    details = await db_session.execute(
+        select(EvaluationDetail.category, EvaluationDetail.score).where(
+            EvaluationDetail.evaluation_id == evaluation_id
+        )
+    )
+    assert dict(details.all()) == {
+        "vocabulary": 68,
+        "grammar": 68,
+        "content": 68,
+        "honorifics": 68,
+    }
+
+    weak_points = (
+        await db_session.execute(select(WeakPoint).where(WeakPoint.user_id == user.id))
+    ).scalars().all()
+    assert {wp.category for wp in weak_points} == {"vocabulary", "grammar", "content", "honorifics"}
+    assert all(wp.occurrence_count == 1 and wp.priority == "medium" for wp in weak_points)
+
+
+async def test_weak_points_reoccur(db_session: AsyncSession, user: User, script: Script):
+    """Test that a weak point found again is counted and reprioritised."""
+    service = EvaluationService(db_session)
+    for _ in range(2):
+        session = await _completed_session(db_session, user, script, ["はい", "はい", "はい"])
+        await service.evaluate_session(session.id, FakeAnswerScorer())
+        await db_session.commit()
+
+    weak_points = (
+        await db_session.execute(select(WeakPoint).where(WeakPoint.user_id == user.id))
+    ).scalars().all()
+    assert len(weak_points) == 4
+    assert all(wp.occurrence_count == 2 and wp.priority == "high" for wp in weak_points)
+
+
+async def test_returns_existing_evaluation(db_session: AsyncSession, user: User, script: Script):
+    """Test that a retried job reuses the stored evaluation."""
+    session = await _completed_session(db_session, user, script, ["はい", "はい", "はい"])
+    service = EvaluationService(db_session)
+    evaluation_id = await service.evaluate_session(session.id, FakeAnswerScorer())
+    await db_session.commit()
+
+    scorer = FakeAnswerScorer()
+    assert await service.evaluate_session(session.id, scorer) == evaluation_id
+    assert scorer.calls == []
+
+
+async def test_waits_for_transcription(db_session: AsyncSession, user: User, script: Script):
+    """Test that answers still being transcribed make the job retry."""
+    session = await _completed_session(
+        db_session, user, script, ["はい", None, None], audio_url="answers/q2.webm"
+    )
+
+    with pytest.raises(RuntimeError):
+        await EvaluationService(db_session).evaluate_session(session.id, FakeAnswerScorer())
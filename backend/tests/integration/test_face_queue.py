@@ -0,0 +1,111 @@
+"""Integration tests for the Redis Streams face inference queue.
+
+Requires a local Redis (settings.redis_url); skipped when unreachable.
+"""
+
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.schemas.face_analysis import FaceAnalysisResponse
+from app.services.face_queue import FaceInferenceWorker, submit_face_analysis
+
+
+@pytest_asyncio.fixture
+async def redis():
+    """Redis client on a dedicated stream, skipped if Redis is unavailable."""
+    client = Redis.from_url(settings.redis_url, decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        pytest.skip("Redis is not available")
+
+    original_stream = settings.face_stream_name
+    settings.face_stream_name = "face:requests:test"
+    await client.delete(settings.face_stream_name)
+
+    yield client
+
+    await client.delete(settings.face_stream_name)
+    settings.face_stream_name = original_stream
+    await client.aclose()
+
+
+def _echo(image_base64: str) -> FaceAnalysisResponse:
+    return FaceAnalysisResponse(success=True, face_detected=False, error_message=image_base64)
+
+
+@pytest.mark.asyncio
+async def test_round_trip(redis: Redis):
+    """Test that a worker processes a frame and replies to the producer."""
+    worker = FaceInferenceWorker(analyze=_echo, redis=redis, concurrency=2)
+    task = asyncio.create_task(worker.run())
+
+    try:
+        results = await asyncio.gather(
+            submit_face_analysis("frame-1", redis=redis),
+            submit_face_analysis("frame-2", redis=redis),
+        )
+    finally:
+        worker.stop()
+        await task
+
+    assert [r.error_message for r in results] == ["frame-1", "frame-2"]
+    pending = await redis.xpending(settings.face_stream_name, settings.face_stream_group)
+    assert pending["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_reclaims_message_from_crashed_worker(redis: Redis, monkeypatch):
+    """Test that a message left pending by a dead consumer is retried."""
+    monkeypatch.setattr(settings, "face_worker_claim_idle_ms", 0)
+
+    crashed = FaceInferenceWorker(consumer_name="crashed", analyze=_echo, redis=redis)
+    await crashed.ensure_group()
+    producer = asyncio.create_task(submit_face_analysis("frame", redis=redis))
+    # Read the message without ever processing it
+    while not await redis.xreadgroup(
+        settings.face_stream_group, "crashed", {settings.face_stream_name: ">"}, block=100
+    ):
+        pass
+
+    worker = FaceInferenceWorker(consumer_name="healthy", analyze=_echo, redis=redis)
+    task = asyncio.create_task(worker.run())
+    try:
+        result = await producer
+    finally:
+        worker.stop()
+        await task
+
+    assert result.error_message == "frame"
+
+
+@pytest.mark.asyncio
+async def test_slow_message_not_reclaimed(redis: Redis, monkeypatch):
+    """Test that a message still being processed is not run again by another worker."""
+    monkeypatch.setattr(settings, "face_worker_claim_idle_ms", 300)
+    calls = []
+
+    def slow_echo(image_base64: str) -> FaceAnalysisResponse:
+        calls.append(image_base64)
+        time.sleep(1)
+        return _echo(image_base64)
+
+    workers = [
+        FaceInferenceWorker(consumer_name=f"worker-{i}", analyze=slow_echo, redis=redis)
+        for i in range(2)
+    ]
+    tasks = [asyncio.create_task(worker.run()) for worker in workers]
+    try:
+        result = await submit_face_analysis("frame", redis=redis)
+    finally:
+        for worker in workers:
+            worker.stop()
+        await asyncio.gather(*tasks)
+
+    assert result.error_message == "frame"
+    assert calls == ["frame"]
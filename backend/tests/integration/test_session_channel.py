@@ -0,0 +1,67 @@
+"""Integration tests for Redis Streams session channels.
+
+Requires a local Redis (settings.redis_url); skipped when unreachable.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.services.session_channel import SessionChannel, publish_session_event
+
+SESSION_ID = "test-channel-session"
+
+
+@pytest_asyncio.fixture
+async def redis():
+    """Redis client, skipped if Redis is unavailable."""
+    client = Redis.from_url(settings.redis_url, decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        pytest.skip("Redis is not available")
+
+    await client.delete(f"session:events:{SESSION_ID}")
+    yield client
+
+    await client.delete(f"session:events:{SESSION_ID}")
+    await client.aclose()
+
+
+async def _take(channel: SessionChannel, n: int) -> list:
+    events = []
+    async for event in channel.events():
+        events.append(event)
+        if len(events) == n:
+            return events
+
+
+@pytest.mark.asyncio
+async def test_delivers_events_published_after_subscribe(redis: Redis):
+    """Test that only events published after subscribing are delivered."""
+    await publish_session_event(SESSION_ID, "old", redis=redis)
+    channel = SessionChannel(SESSION_ID, redis=redis, block_ms=100)
+    reader = asyncio.create_task(_take(channel, 1))
+    await asyncio.sleep(0.05)
+
+    await publish_session_event(SESSION_ID, "evaluation", {"status": "succeeded"}, redis=redis)
+    events = await asyncio.wait_for(reader, timeout=2)
+
+    assert [(e.type, e.data) for e in events] == [("evaluation", {"status": "succeeded"})]
+
+
+@pytest.mark.asyncio
+async def test_resume_from_last_event_id(redis: Redis):
+    """Test that a reconnecting subscriber receives the events it missed."""
+    first = await publish_session_event(SESSION_ID, "transcript", {"question_id": 1}, redis=redis)
+    await publish_session_event(SESSION_ID, "transcript", {"question_id": 2}, redis=redis)
+    await publish_session_event(SESSION_ID, "transcript", {"question_id": 3}, redis=redis)
+
+    channel = SessionChannel(SESSION_ID, last_event_id=first, redis=redis, block_ms=100)
+    events = await asyncio.wait_for(_take(channel, 2), timeout=2)
+
+    assert [e.data["question_id"] for e in events] == [2, 3]
+    assert channel.last_event_id == events[-1].id
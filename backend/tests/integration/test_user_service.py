@@ -0,0 +1,65 @@
+"""Integration tests for SSO user provisioning.
+
+Run against the PostgreSQL test database, on the session event loop the
+engine fixture was created on.
+"""
+
+from typing import Any
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.user import User
+from app.services.user_service import UserService
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def db_session(test_engine):
+    """Database session on the engine's event loop."""
+    async with async_sessionmaker(test_engine, expire_on_commit=False)() as session:
+        yield session
+        await session.execute(delete(User))
+        await session.commit()
+
+
+async def test_creates_user(db_session: AsyncSession, sample_user_data: dict[str, Any]):
+    """Test that the first login creates the user."""
+    user = await UserService(db_session).get_or_create_user(sample_user_data)
+
+    assert user.mintoku_user_id == sample_user_data["mintoku_user_id"]
+    assert user.email == sample_user_data["email"]
+    assert user.jlpt_level == "N3"
+
+
+async def test_refreshes_profile(db_session: AsyncSession, sample_user_data: dict[str, Any]):
+    """Test that a later login updates the same user."""
+    service = UserService(db_session)
+    created = await service.get_or_create_user(sample_user_data)
+
+    user = await service.get_or_create_user(
+        {**sample_user_data, "email": "new@example.com", "jlpt_level": "N2"}
+    )
+
+    assert user.id == created.id
+    assert user.email == "new@example.com"
+    assert user.jlpt_level == "N2"
+
+
+async def test_keeps_email_and_name_when_omitted(
+    db_session: AsyncSession, sample_user_data: dict[str, Any]
+):
+    """Test that SSO data without email or name keeps the stored values."""
+    service = UserService(db_session)
+    await service.get_or_create_user(sample_user_data)
+
+    user = await service.get_or_create_user(
+        {"mintoku_user_id": sample_user_data["mintoku_user_id"], "organization": "New Org"}
+    )
+
+    assert user.email == sample_user_data["email"]
+    assert user.name == sample_user_data["name"]
+    assert user.organization == "New Org"
@@ -0,0 +1,72 @@
+"""Stub of the HeyGen streaming API.
+
+Used in tests through ``httpx.ASGITransport``; it can also be served locally
+for development (``uvicorn tests.stubs.heygen:app --port 8100`` with
+``HEYGEN_BASE_URL=http://localhost:8100``).
+"""
+
+import asyncio
+import uuid
+
+from fastapi import FastAPI, Header, HTTPException
+from pydantic import BaseModel
+
+
+class NewSessionRequest(BaseModel):
+    avatar_id: str
+    quality: str = "medium"
+    version: str = "v2"
+
+
+class StopSessionRequest(BaseModel):
+    session_id: str
+
+
+class HeyGenStub:
+    """In-memory HeyGen streaming API."""
+
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.delay = delay
+        self.fail = fail
+        self.sessions: dict[str, str] = {}
+        self.created = 0
+        self.stopped: list[str] = []
+        self.app = self._build()
+
+    def _build(self) -> FastAPI:
+        app = FastAPI(title="HeyGen stub")
+
+        @app.post("/v1/streaming.new")
+        async def new_session(
+            request: NewSessionRequest,
+            x_api_key: str = Header(""),
+        ) -> dict:
+            if not x_api_key:
+                raise HTTPException(status_code=401, detail="Missing API key")
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            if self.fail:
+                raise HTTPException(status_code=500, detail="Stub failure")
+            session_id = uuid.uuid4().hex
+            self.sessions[session_id] = request.avatar_id
+            self.created += 1
+            return {
+                "code": 100,
+                "data": {
+                    "session_id": session_id,
+                    "access_token": f"token-{session_id}",
+                    "url": f"wss://stub.heygen.local/{session_id}",
+                },
+            }
+
+        @app.post("/v1/streaming.stop")
+        async def stop_session(request: StopSessionRequest) -> dict:
+            if self.sessions.pop(request.session_id, None) is None:
+                raise HTTPException(status_code=404, detail="Session not found")
+            self.stopped.append(request.session_id)
+            return {"code": 100, "data": None}
+
+        return app
+
+
+app = HeyGenStub().app
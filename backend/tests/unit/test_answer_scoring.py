@@ -0,0 +1,57 @@
+"""Unit tests for answer scoring."""
+
+import pytest
+
+from app.services.answer_scoring import (
+    DEFAULT_JLPT_WEIGHTS,
+    ScoringError,
+    parse_answer_score,
+    weighted_total,
+)
+
+
+class TestParseAnswerScore:
+    """Tests for parse_answer_score."""
+
+    def test_parses_verdict(self):
+        """Scores and feedback are read from the JSON verdict."""
+        score = parse_answer_score(
+            '{"scores": {"vocabulary": 80, "grammar": 70.4, "content": 90, "honorifics": 60},'
+            ' "feedback": {"grammar": "助詞に注意"}, "overall_feedback": "良い回答です"}'
+        )
+        assert score.scores == {"vocabulary": 80, "grammar": 70, "content": 90, "honorifics": 60}
+        assert score.feedback["grammar"] == "助詞に注意"
+        assert score.feedback["vocabulary"] == ""
+        assert score.overall_feedback == "良い回答です"
+
+    def test_json_block_and_clamping(self):
+        """Verdicts in a ```json block are accepted and scores kept in 0-100."""
+        score = parse_answer_score(
+            '```json\n{"scores": {"vocabulary": 120, "grammar": -5, "content": 50, "honorifics": 50}}\n```'
+        )
+        assert score.scores["vocabulary"] == 100
+        assert score.scores["grammar"] == 0
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "not json",
+            '{"feedback": {}}',
+            '{"scores": {"vocabulary": 80, "grammar": 70, "content": 90}}',
+            '{"scores": {"vocabulary": "80", "grammar": 70, "content": 90, "honorifics": 60}}',
+        ],
+    )
+    def test_invalid_verdict(self, text):
+        """Verdicts without all four numeric scores are rejected."""
+        with pytest.raises(ScoringError):
+            parse_answer_score(text)
+
+
+class TestWeightedTotal:
+    """Tests for weighted_total."""
+
+    def test_level_weights(self):
+        """Honorifics weigh more at N1 than at N5."""
+        scores = {"vocabulary": 80, "grammar": 80, "content": 80, "honorifics": 40}
+        assert weighted_total(scores, DEFAULT_JLPT_WEIGHTS["N1"]) == 66
+        assert weighted_total(scores, DEFAULT_JLPT_WEIGHTS["N5"]) == 78
@@ -0,0 +1,119 @@
+"""Unit tests for the evaluation server-sent event stream."""
+
+import json
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+
+from app.schemas.evaluation import EvaluationJobResponse
+from app.services import evaluation_events
+from app.services.evaluation_events import evaluation_event_stream, format_sse
+from app.services.session_channel import SessionEvent
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+USER_ID = "00000000-0000-0000-0000-0000000000aa"
+
+
+@asynccontextmanager
+async def _no_db():
+    yield None
+
+
+def _job(status: str) -> EvaluationJobResponse:
+    now = datetime.now(timezone.utc)
+    return EvaluationJobResponse(
+        job_id="job-1",
+        session_id=SESSION_ID,
+        status=status,
+        attempts=1,
+        created_at=now,
+        updated_at=now,
+    )
+
+
+class _FakeChannel:
+    def __init__(self, events: list[SessionEvent]) -> None:
+        self._events = events
+        self.marked = False
+
+    async def mark_position(self) -> None:
+        self.marked = True
+
+    async def events(self):
+        for event in self._events:
+            yield event
+
+
+def _fake_service(job: EvaluationJobResponse | None):
+    class _FakeEvaluationService:
+        def __init__(self, db):
+            pass
+
+        async def get_session_job(self, session_id, user_id):
+            return True, job
+
+        async def get_evaluation(self, session_id, user_id):
+            return {"session_id": session_id, "total_score": 80}
+
+    return _FakeEvaluationService
+
+
+def _parse(frame: str) -> dict:
+    fields = dict(line.split(": ", 1) for line in frame.strip().splitlines())
+    return {"id": fields.get("id"), "event": fields["event"], "data": json.loads(fields["data"])}
+
+
+@pytest.fixture
+def stream(monkeypatch):
+    monkeypatch.setattr(evaluation_events, "async_session_factory", _no_db)
+
+    async def _run(job, events) -> list[dict]:
+        monkeypatch.setattr(evaluation_events, "EvaluationService", _fake_service(job))
+        channel = _FakeChannel(events)
+        frames = [frame async for frame in evaluation_event_stream(SESSION_ID, USER_ID, channel)]
+        assert channel.marked
+        return [_parse(frame) for frame in frames]
+
+    return _run
+
+
+class TestFormatSSE:
+    """Tests for format_sse."""
+
+    def test_formats_event(self):
+        """Frames carry the ID, event name and JSON data, ending with a blank line."""
+        frame = format_sse("progress", {"status": "running"}, "1-0")
+        assert frame == 'id: 1-0\nevent: progress\ndata: {"status": "running"}\n\n'
+
+    def test_omits_missing_id(self):
+        """Events without an ID have no id field."""
+        assert format_sse("job", None) == "event: job\ndata: null\n\n"
+
+
+class TestEvaluationEventStream:
+    """Tests for evaluation_event_stream."""
+
+    async def test_finished_job_sends_evaluation(self, stream):
+        """An already evaluated session gets its evaluation without waiting."""
+        events = await stream(_job("succeeded"), [])
+        assert [e["event"] for e in events] == ["job", "evaluation"]
+        assert events[1]["data"]["total_score"] == 80
+
+    async def test_forwards_progress_until_evaluated(self, stream):
+        """Progress events are forwarded until the evaluation arrives."""
+        events = await stream(
+            _job("pending"),
+            [
+                SessionEvent("1-0", "transcript", {}),
+                SessionEvent("2-0", "evaluation_progress", {"status": "running"}),
+                SessionEvent("3-0", "evaluation", {"status": "succeeded"}),
+            ],
+        )
+        assert [e["event"] for e in events] == ["job", "progress", "evaluation"]
+        assert [e["id"] for e in events] == [None, "2-0", "3-0"]
+
+    async def test_failed_job_ends_stream(self, stream):
+        """A job that fails for good ends the stream with a failed event."""
+        events = await stream(None, [SessionEvent("1-0", "evaluation", {"status": "failed"})])
+        assert [e["event"] for e in events] == ["failed"]
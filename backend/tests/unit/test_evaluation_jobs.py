@@ -0,0 +1,170 @@
+"""Unit tests for the evaluation job queue."""
+
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+from app.services import evaluation_jobs
+from app.services.evaluation_jobs import EvaluationJobWorker, retry_delay
+
+
+class TestRetryDelay:
+    """Tests for retry_delay."""
+
+    def test_exponential_backoff(self):
+        """The delay doubles with each attempt (within jitter)."""
+        base = settings.evaluation_job_backoff_seconds
+        assert base * 0.8 <= retry_delay(1) <= base * 1.2
+        assert base * 2 * 0.8 <= retry_delay(2) <= base * 2 * 1.2
+        assert base * 4 * 0.8 <= retry_delay(3) <= base * 4 * 1.2
+
+    def test_capped(self):
+        """The delay never exceeds the configured maximum."""
+        assert retry_delay(50) <= settings.evaluation_job_backoff_max_seconds
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+    def scalar(self):
+        return self._rows[0] if self._rows else None
+
+
+class _FakeSession:
+    """Returns queued rows for each executed statement."""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result(self.results.pop(0) if self.results else [])
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.fixture
+def events(monkeypatch):
+    published = []
+
+    async def publish(session_id, event, payload):
+        published.append((event, payload))
+
+    monkeypatch.setattr(evaluation_jobs, "publish_session_event", publish)
+    return published
+
+
+def _worker(db, evaluation_id=None) -> EvaluationJobWorker:
+    async def evaluate(session, session_id):
+        return evaluation_id
+
+    return EvaluationJobWorker(evaluate=evaluate, session_factory=lambda: db, worker_id="worker-1")
+
+
+class TestClaim:
+    """Tests for EvaluationJobWorker._claim."""
+
+    async def test_claims_due_jobs(self):
+        """Due and expired jobs are locked to this worker without blocking other workers."""
+        row = (uuid.uuid4(), uuid.uuid4(), 1)
+        db = _FakeSession([row])
+
+        assert await _worker(db)._claim(2) == [row]
+        sql = _sql(db.statements[0])
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert db.statements[0].compile().params["locked_by"] == "worker-1"
+        assert db.commits == 1
+
+
+class TestRun:
+    """Tests for EvaluationJobWorker._run."""
+
+    async def test_success_requires_lease(self, events):
+        """The job is marked succeeded only while this worker still holds it."""
+        job_id, session_id, evaluation_id = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        db = _FakeSession([True], [(job_id,)])
+
+        await _worker(db, evaluation_id)._run(job_id, session_id, 1)
+
+        sql = _sql(db.statements[1])
+        assert "evaluation_jobs.locked_by = %(locked_by_1)s" in sql
+        assert "evaluation_jobs.status = %(status_1)s" in sql
+        assert db.commits == 1
+        assert events[-1] == (
+            "evaluation",
+            {"job_id": str(job_id), "status": "succeeded", "evaluation_id": str(evaluation_id)},
+        )
+
+    async def test_lost_lease_discards_result(self, events):
+        """A worker whose job was reclaimed rolls back and publishes no outcome."""
+        db = _FakeSession([True], [])
+
+        await _worker(db, uuid.uuid4())._run(uuid.uuid4(), uuid.uuid4(), 1)
+
+        assert db.rollbacks == 1
+        assert db.commits == 0
+        assert [event for event, _ in events] == ["evaluation_progress"]
+
+    async def test_no_evaluation_is_retried(self, events):
+        """An evaluator that produces nothing does not mark the job succeeded."""
+        job_id = uuid.uuid4()
+        db = _FakeSession([True], [(job_id,)])
+
+        await _worker(db, None)._run(job_id, uuid.uuid4(), 1)
+
+        params = db.statements[1].compile().params
+        assert params["status"] == "pending"
+        assert params["last_error"] == "No evaluation was produced"
+        assert events[-1][1]["status"] == "pending"
+
+
+class TestFail:
+    """Tests for EvaluationJobWorker._fail."""
+
+    async def test_retries_exhausted(self, events):
+        """The final attempt marks the job failed and ends the event stream."""
+        job_id = uuid.uuid4()
+        db = _FakeSession([(job_id,)])
+        attempts = settings.evaluation_job_max_attempts
+
+        await _worker(db)._fail(job_id, uuid.uuid4(), attempts, RuntimeError("boom"))
+
+        assert "evaluation_jobs.locked_by = %(locked_by_1)s" in _sql(db.statements[0])
+        assert db.statements[0].compile().params["status"] == "failed"
+        assert events == [
+            ("evaluation", {"job_id": str(job_id), "status": "failed", "evaluation_id": None})
+        ]
+
+    async def test_lost_lease_publishes_nothing(self, events):
+        """A failure is not recorded over a job another worker has reclaimed."""
+        db = _FakeSession([])
+
+        await _worker(db)._fail(uuid.uuid4(), uuid.uuid4(), 1, RuntimeError("boom"))
+
+        assert events == []
@@ -0,0 +1,104 @@
+"""Unit tests for compact face analysis encoding."""
+
+import json
+
+from app.schemas.face_analysis import (
+    EmotionScores,
+    FaceAnalysisResponse,
+    FaceRegion,
+    HeadPose,
+    ImageQuality,
+    TensionAnalysis,
+)
+from app.services import face_messages
+from app.services.face_compact import (
+    CODE_TABLE_VERSION,
+    MESSAGES,
+    dumps_compact,
+    encode_compact,
+    get_code_tables,
+)
+
+
+def _full_response() -> FaceAnalysisResponse:
+    return FaceAnalysisResponse(
+        success=True,
+        face_detected=True,
+        face_region=FaceRegion(x=100, y=50, w=200, h=200),
+        emotions=EmotionScores(
+            angry=0.5, disgust=0.1, fear=15.3, happy=10.2, sad=3.1, surprise=2.5, neutral=68.3
+        ),
+        tension=TensionAnalysis(
+            tension_level=0.25,
+            relax_level=0.75,
+            dominant_emotion="neutral",
+            feedback_message="リラックスして話せていますね",
+            feedback_type="positive",
+        ),
+        image_quality=ImageQuality(
+            average_brightness=120.4,
+            brightness_status="ok",
+            is_too_dark=False,
+            is_too_bright=False,
+        ),
+        head_pose=HeadPose(
+            yaw=-20.0,
+            pitch=1.0,
+            roll=0.5,
+            is_looking_at_camera=False,
+            face_direction="left",
+            feedback_message="少し左を向いています。カメラを見てください",
+        ),
+    )
+
+
+class TestCompactEncoding:
+    """Tests for the compact response encoding."""
+
+    def test_round_trip_with_code_tables(self):
+        """Test that codes decode back to the original values."""
+        tables = get_code_tables()
+        payload = encode_compact(_full_response())
+
+        assert payload[0] == CODE_TABLE_VERSION == tables.version
+        assert payload[1:3] == [1, 1]
+        assert payload[3] == [100, 50, 200, 200]
+        tension = payload[5]
+        assert tables.emotions[tension[2]] == "neutral"
+        assert tables.messages[tension[3]] == "リラックスして話せていますね"
+        assert tables.feedback_types[tension[4]] == "positive"
+        assert tables.brightness_statuses[payload[6][1]] == "ok"
+        pose = payload[7]
+        assert tables.face_directions[pose[4]] == "left"
+        assert payload[8] is None
+
+    def test_all_pipeline_messages_have_codes(self):
+        """Every fixed message of the pipeline is in the message table once."""
+        messages = [
+            value
+            for name, value in vars(face_messages).items()
+            if name.isupper() and isinstance(value, str)
+        ]
+        assert sorted(messages) == sorted(MESSAGES)
+
+    def test_unknown_message_passed_through(self):
+        """Test that messages outside the table are sent as text."""
+        response = FaceAnalysisResponse(
+            success=False,
+            face_detected=False,
+            error_message="分析中にエラーが発生しました: boom",
+        )
+
+        payload = encode_compact(response)
+
+        assert payload[3:8] == [None] * 5
+        assert payload[8] == "分析中にエラーが発生しました: boom"
+
+    def test_compact_is_smaller(self):
+        """Test that the compact payload is smaller than the full JSON."""
+        response = _full_response()
+
+        compact = dumps_compact(response)
+
+        assert json.loads(compact)[0] == CODE_TABLE_VERSION
+        assert len(compact) < len(response.model_dump_json()) / 3
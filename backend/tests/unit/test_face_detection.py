@@ -0,0 +1,80 @@
+"""Unit tests for face detector backends and calibration."""
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.services.face_detection import (
+    DetectedFace,
+    FaceDetector,
+    OpenCVHaarDetector,
+    benchmark_detector,
+    create_detector,
+    load_calibration_frames,
+    select_detector,
+)
+
+
+class FixedDetector(FaceDetector):
+    """Detector returning a fixed set of faces."""
+
+    name = "fixed"
+
+    def __init__(self, faces: list[DetectedFace]) -> None:
+        super().__init__()
+        self._faces = faces
+
+    def _detect(self, image: np.ndarray) -> list[DetectedFace]:
+        return list(self._faces)
+
+
+class TestFaceDetector:
+    """Tests for detector backends."""
+
+    def test_detect_sorts_largest_first(self):
+        """Test that detections are ordered by area."""
+        small = DetectedFace(0, 0, 10, 10, 0.9)
+        large = DetectedFace(5, 5, 50, 50, 0.8)
+        detector = FixedDetector([small, large])
+
+        faces = detector.detect(np.zeros((64, 64, 3), dtype=np.uint8))
+
+        assert faces == [large, small]
+
+    def test_haar_detector_blank_image(self):
+        """Test that the Haar detector finds no face in a blank frame."""
+        detector = OpenCVHaarDetector()
+
+        assert detector.detect(np.zeros((240, 320, 3), dtype=np.uint8)) == []
+
+    def test_create_unknown_detector(self):
+        """Test that unknown backends are rejected."""
+        with pytest.raises(ValueError):
+            create_detector("unknown")
+
+
+class TestCalibration:
+    """Tests for detector calibration."""
+
+    def test_benchmark_accuracy(self):
+        """Test accuracy is the fraction of frames with the expected face count."""
+        detector = FixedDetector([DetectedFace(0, 0, 10, 10, 1.0)])
+        frame = np.zeros((32, 32, 3), dtype=np.uint8)
+
+        result = benchmark_detector(detector, [(frame, 1), (frame, 0)], rounds=1)
+
+        assert result.backend == "fixed"
+        assert result.accuracy == 0.5
+        assert result.mean_latency_ms >= 0
+
+    def test_missing_manifest(self, tmp_path):
+        """Test that a directory without a manifest yields no frames."""
+        assert load_calibration_frames(tmp_path) == []
+
+    def test_auto_requires_calibration_dir(self, monkeypatch):
+        """Test that automatic selection without calibration frames is rejected."""
+        monkeypatch.setattr(settings, "face_detector_backend", "auto")
+        monkeypatch.setattr(settings, "face_calibration_dir", "")
+
+        with pytest.raises(ValueError):
+            select_detector()
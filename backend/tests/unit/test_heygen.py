@@ -0,0 +1,93 @@
+"""Unit tests for the HeyGen avatar session pool."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.heygen import AvatarSessionPool, HeyGenClient, HeyGenError
+from tests.stubs.heygen import HeyGenStub
+
+AVATAR = "test_avatar"
+
+
+def _client(stub: HeyGenStub) -> HeyGenClient:
+    http = httpx.AsyncClient(transport=httpx.ASGITransport(app=stub.app), base_url="http://heygen")
+    return HeyGenClient(api_key="test-key", http=http)
+
+
+class TestHeyGenClient:
+    """Tests for HeyGenClient."""
+
+    async def test_create_and_close(self):
+        """Sessions are created and stopped through the API."""
+        stub = HeyGenStub()
+        client = _client(stub)
+        session = await client.create_session(AVATAR)
+        assert session.session_token == f"token-{session.session_id}"
+        await client.close_session(session.session_id)
+        assert stub.stopped == [session.session_id]
+
+    async def test_error(self):
+        """API failures raise HeyGenError."""
+        client = _client(HeyGenStub(fail=True))
+        with pytest.raises(HeyGenError):
+            await client.create_session(AVATAR)
+
+
+class TestAvatarSessionPool:
+    """Tests for AvatarSessionPool."""
+
+    async def test_refill_and_hit(self):
+        """Warm sessions are handed out without calling HeyGen."""
+        stub = HeyGenStub()
+        pool = AvatarSessionPool(_client(stub), avatar_ids=[AVATAR], size=2, ttl_seconds=60)
+        await pool.refill()
+        assert pool.idle_count(AVATAR) == 2
+
+        session = await pool.acquire(AVATAR)
+        assert session.session_id in stub.sessions
+        assert stub.created == 2
+        assert pool.idle_count(AVATAR) == 1
+
+    async def test_concurrent_acquire_is_unique(self):
+        """Concurrent requests never receive the same session."""
+        stub = HeyGenStub()
+        pool = AvatarSessionPool(_client(stub), avatar_ids=[AVATAR], size=3, ttl_seconds=60)
+        await pool.refill()
+        sessions = await asyncio.gather(*(pool.acquire(AVATAR) for _ in range(5)))
+        assert len({s.session_id for s in sessions}) == 5
+        assert stub.created == 5
+
+    async def test_stale_sessions_replaced(self):
+        """Sessions idle past the TTL are closed and not handed out."""
+        stub = HeyGenStub()
+        pool = AvatarSessionPool(_client(stub), avatar_ids=[AVATAR], size=1, ttl_seconds=60)
+        await pool.refill()
+        pool._idle[AVATAR][0].created_at -= 120
+        stale_id = pool._idle[AVATAR][0].session_id
+
+        await pool.refill()
+        await pool.stop()
+        assert stale_id in stub.stopped
+        assert stub.created == 2
+
+    async def test_stop_closes_idle_sessions(self):
+        """Stopping the pool stops its idle sessions."""
+        stub = HeyGenStub()
+        pool = AvatarSessionPool(_client(stub), avatar_ids=[AVATAR], size=2, ttl_seconds=60)
+        pool.start()
+        await asyncio.sleep(0.05)
+        await pool.stop()
+        assert stub.sessions == {}
+        assert len(stub.stopped) == 2
+
+    async def test_release_stops_session(self):
+        """Sessions handed out for an interview are stopped when released."""
+        stub = HeyGenStub()
+        pool = AvatarSessionPool(_client(stub), avatar_ids=[AVATAR], size=0, ttl_seconds=60)
+        session = await pool.acquire(AVATAR)
+
+        pool.release(session.session_id)
+        await pool.stop()
+        assert stub.stopped == [session.session_id]
@@ -0,0 +1,49 @@
+"""Unit tests for the event loop lag monitor."""
+
+import asyncio
+import time
+
+from app.core.loop_monitor import EventLoopMonitor, _task_routes
+
+
+def _blocking_call() -> None:
+    time.sleep(0.3)
+
+
+class TestEventLoopMonitor:
+    """Tests for EventLoopMonitor."""
+
+    async def test_reports_blocking_call_with_route(self):
+        """A blocking call is reported with its stack and route."""
+        monitor = EventLoopMonitor(interval_ms=10, threshold_ms=100)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.05)
+            _task_routes[asyncio.current_task()] = "POST /api/v1/test"
+            _blocking_call()
+            await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+
+        report = monitor.last_report
+        assert report is not None
+        assert report.blocked_ms >= 100
+        assert report.route == "POST /api/v1/test"
+        assert "_blocking_call" in report.stack
+
+    async def test_lag_percentiles(self):
+        """Lag samples are summarized as percentiles."""
+        monitor = EventLoopMonitor(interval_ms=10, threshold_ms=1000)
+        monitor.start()
+        try:
+            await asyncio.sleep(0.1)
+            time.sleep(0.05)
+            await asyncio.sleep(0.05)
+        finally:
+            await monitor.stop()
+
+        lag = monitor.percentiles()
+        assert set(lag) == {"p50", "p95", "p99", "max"}
+        assert lag["max"] >= 40
+        assert lag["p50"] <= lag["p99"] <= lag["max"]
+        assert monitor.last_report is None
@@ -0,0 +1,180 @@
+"""Unit tests for interview manifests."""
+
+import asyncio
+import uuid
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+
+from app.api.routes import sessions as session_routes
+from app.core.config import settings
+from app.core.deps import get_current_user, get_db
+from app.schemas.session import InterviewManifest
+from app.services import manifest_service
+from app.services.manifest_service import LevelSettings, ManifestService
+from app.services.storage import LocalStorageBackend
+from app.services.tts import FakeTTSBackend, LocalAssetCache, TTSAssetStore
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+USER_ID = "00000000-0000-0000-0000-0000000000aa"
+
+
+class _Result:
+    def __init__(self, rows: list) -> None:
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _FakeDB:
+    """Returns the question rows for the manifest query."""
+
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result(self.rows)
+
+
+def _row(order: int, text: str, simplified: str | None = None) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid.uuid4(),
+        order_number=order,
+        question_text=text,
+        expected_duration_seconds=60,
+        question_simplified=simplified,
+        question_reading=None,
+    )
+
+
+def _script() -> SimpleNamespace:
+    return SimpleNamespace(id=uuid.uuid4(), synced_at="2026-10-19T00:00:00+00:00")
+
+
+@pytest.fixture
+async def store(tmp_path: Path, monkeypatch):
+    store = TTSAssetStore(
+        FakeTTSBackend(delay=0.2),
+        storage=LocalStorageBackend(tmp_path / "objects"),
+        local=LocalAssetCache(tmp_path / "cache", 1024 * 1024),
+        voice="alloy",
+    )
+    monkeypatch.setattr(manifest_service, "get_tts_store", lambda: store)
+    monkeypatch.setattr(settings, "tts_enabled", True)
+    yield store
+    await asyncio.gather(*manifest_service._background, return_exceptions=True)
+
+
+def _level(monkeypatch, **kwargs) -> None:
+    async def level_settings(self, jlpt_level):
+        return LevelSettings(**kwargs)
+
+    monkeypatch.setattr(ManifestService, "_level_settings", level_settings)
+
+
+class TestManifestServiceBuild:
+    """Tests for ManifestService.build."""
+
+    async def test_variant_and_order(self, monkeypatch, store):
+        """Questions keep script order and use the simplified text where the level asks for it."""
+        _level(monkeypatch, use_simplified=True)
+        db = _FakeDB([_row(1, "自己紹介をしてください", "じこしょうかいをしてください"), _row(2, "趣味は何ですか")])
+
+        manifest = await ManifestService(db).build(SESSION_ID, _script(), "N5", audio_timeout=0)
+
+        assert [q.id for q in manifest.questions] == [1, 2]
+        assert [q.text for q in manifest.questions] == ["じこしょうかいをしてください", "趣味は何ですか"]
+        assert manifest.questions[0].question_ja == "自己紹介をしてください"
+        sql = str(db.statements[0].compile(dialect=postgresql.dialect()))
+        assert "SELECT DISTINCT ON (script_questions.order_number)" in sql
+        assert "ORDER BY script_questions.order_number" in sql
+
+    async def test_zero_timeout_uses_cached_audio_only(self, monkeypatch, store):
+        """Without a wait, cached audio is listed and the rest synthesises in the background."""
+        _level(monkeypatch)
+        cached = await store.ensure("自己紹介をしてください", 1.0)
+        db = _FakeDB([_row(1, "自己紹介をしてください"), _row(2, "趣味は何ですか")])
+
+        manifest = await ManifestService(db).build(SESSION_ID, _script(), "N3", audio_timeout=0)
+
+        assert manifest.questions[0].audio_url.endswith(cached)
+        assert manifest.questions[1].audio_url is None
+        assert manifest.audio_pending
+        await asyncio.gather(*manifest_service._background)
+        assert store.cached("趣味は何ですか", 1.0) is not None
+
+    async def test_timeout_changes_etag_when_audio_arrives(self, monkeypatch, store):
+        """Audio ready within the timeout is included, and the ETag reflects it."""
+        _level(monkeypatch)
+        rows = [_row(1, "趣味は何ですか")]
+        script = _script()
+
+        pending = await ManifestService(_FakeDB(rows)).build(SESSION_ID, script, "N3", audio_timeout=0)
+        ready = await ManifestService(_FakeDB(rows)).build(SESSION_ID, script, "N3", audio_timeout=5)
+
+        assert ready.questions[0].audio_url is not None
+        assert not ready.audio_pending
+        assert ready.etag != pending.etag
+
+
+def _client(monkeypatch, manifest: InterviewManifest) -> TestClient:
+    class _Service:
+        def __init__(self, db):
+            pass
+
+        async def get_manifest(self, **kwargs):
+            return manifest
+
+    monkeypatch.setattr(session_routes, "SessionService", _Service)
+    app = FastAPI()
+    app.include_router(session_routes.router, prefix="/sessions")
+    app.dependency_overrides[get_db] = lambda: None
+    app.dependency_overrides[get_current_user] = lambda: {"sub": USER_ID}
+    return TestClient(app)
+
+
+def _manifest(audio_pending: bool) -> InterviewManifest:
+    return InterviewManifest(
+        session_id=SESSION_ID,
+        script_id=SESSION_ID,
+        jlpt_level="N3",
+        speech_rate=1.0,
+        use_simplified=False,
+        total_questions=0,
+        questions=[],
+        audio_pending=audio_pending,
+        etag="abc",
+    )
+
+
+class TestManifestRoute:
+    """Tests for GET /sessions/{id}/manifest."""
+
+    def test_not_modified(self, monkeypatch):
+        """A matching If-None-Match gets 304 with the ETag and no body."""
+        client = _client(monkeypatch, _manifest(audio_pending=False))
+
+        response = client.get(f"/sessions/{SESSION_ID}/manifest", headers={"If-None-Match": '"abc"'})
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == '"abc"'
+        assert response.content == b""
+
+    def test_pending_audio_is_revalidated(self, monkeypatch):
+        """Manifests with pending audio are not cached without revalidation."""
+        pending = _client(monkeypatch, _manifest(audio_pending=True)).get(
+            f"/sessions/{SESSION_ID}/manifest"
+        )
+        complete = _client(monkeypatch, _manifest(audio_pending=False)).get(
+            f"/sessions/{SESSION_ID}/manifest"
+        )
+
+        assert pending.headers["Cache-Control"] == "private, no-cache"
+        assert complete.headers["Cache-Control"] == "private, max-age=3600"
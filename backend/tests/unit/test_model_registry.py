@@ -0,0 +1,69 @@
+"""Unit tests for the model artifact registry."""
+
+import json
+
+import pytest
+
+from app.services.model_registry import ModelArtifactError, ModelRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Registry with one declared artifact already present on disk."""
+    source_manifest = tmp_path / "source.json"
+    source_manifest.write_text(
+        json.dumps(
+            {
+                "artifacts": [
+                    {
+                        "name": "weights",
+                        "path": "nested/weights.bin",
+                        "url": "https://example.invalid/weights.bin",
+                        "sha256": None,
+                    }
+                ]
+            }
+        )
+    )
+    root = tmp_path / "registry"
+    (root / "nested").mkdir(parents=True)
+    (root / "nested" / "weights.bin").write_bytes(b"model-bytes")
+    return ModelRegistry(root=root, source_manifest=source_manifest)
+
+
+class TestModelRegistry:
+    """Tests for prefetch and verification."""
+
+    def test_prefetch_records_existing_file(self, registry):
+        """Test that prefetch records checksums without downloading present files."""
+        artifacts = registry.prefetch()
+
+        assert len(artifacts) == 1
+        assert artifacts[0].size == len(b"model-bytes")
+        assert registry.stored_artifacts()["weights"].sha256 == artifacts[0].sha256
+
+    def test_verify_ok(self, registry):
+        """Test verification of an untouched artifact."""
+        registry.prefetch()
+
+        assert [a.name for a in registry.verify()] == ["weights"]
+
+    def test_verify_detects_tampering(self, registry):
+        """Test that a modified file fails verification."""
+        registry.prefetch()
+        registry.path_for("weights").write_bytes(b"tampered")
+
+        with pytest.raises(ModelArtifactError):
+            registry.verify()
+
+    def test_verify_missing_manifest(self, registry):
+        """Test that an unpopulated registry fails verification."""
+        with pytest.raises(ModelArtifactError):
+            registry.verify()
+
+    def test_pin_writes_source_checksum(self, registry):
+        """Test that pinning stores checksums in the source manifest."""
+        artifacts = registry.prefetch()
+        registry.pin(artifacts)
+
+        assert registry.declared_artifacts()[0].sha256 == artifacts[0].sha256
@@ -0,0 +1,72 @@
+"""Unit tests for keyset pagination helpers."""
+
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.pagination import (
+    InvalidCursorError,
+    after_cursor,
+    decode_cursor,
+    encode_cursor,
+    next_cursor,
+)
+from app.models.interview import InterviewSession
+
+
+@dataclass
+class _Row:
+    id: uuid.UUID
+    created_at: datetime
+
+
+def _rows(n: int) -> list[_Row]:
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return [_Row(uuid.uuid4(), start - timedelta(minutes=i)) for i in range(n)]
+
+
+class TestCursor:
+    """Tests for cursor encoding."""
+
+    def test_round_trip(self):
+        """A cursor decodes to the sort key it was built from."""
+        row_id = uuid.uuid4()
+        created_at = datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc)
+        assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+    def test_url_safe(self):
+        """Cursors can be passed in a query string unescaped."""
+        token = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+        assert all(c.isalnum() or c in "-_" for c in token)
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "W10", "WyJ4IiwieSJd"])
+    def test_invalid_cursor(self, token):
+        """Malformed cursors raise a ValueError."""
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(token)
+        assert issubclass(InvalidCursorError, ValueError)
+
+    def test_after_cursor_compares_rows(self):
+        """The condition is a row comparison on (sort, id)."""
+        token = encode_cursor(datetime.now(timezone.utc), uuid.uuid4())
+        condition = after_cursor(InterviewSession.created_at, InterviewSession.id, token)
+        sql = str(condition.compile(dialect=postgresql.dialect()))
+        assert "(interview_sessions.created_at, interview_sessions.id) <" in sql
+
+
+class TestNextCursor:
+    """Tests for next_cursor."""
+
+    def test_last_page(self):
+        """No cursor is returned when there is no extra row."""
+        assert next_cursor(_rows(3), 3, "created_at") is None
+        assert next_cursor(_rows(2), 3, "created_at") is None
+
+    def test_points_at_last_row_of_page(self):
+        """The cursor is the sort key of the last row returned."""
+        rows = _rows(4)
+        token = next_cursor(rows, 3, "created_at")
+        assert decode_cursor(token) == (rows[2].created_at, rows[2].id)
@@ -0,0 +1,51 @@
+"""Unit tests for the script question cache."""
+
+import uuid
+
+from app.services.script_cache import CachedQuestion, ScriptQuestionCache
+
+
+def _questions(n: int) -> tuple[CachedQuestion, ...]:
+    return tuple(CachedQuestion(uuid.uuid4(), i + 1, f"質問{i + 1}") for i in range(n))
+
+
+class TestScriptQuestionCache:
+    """Tests for ScriptQuestionCache."""
+
+    def test_hit_for_same_version(self):
+        """Cached questions are returned for the stored version."""
+        cache = ScriptQuestionCache(max_scripts=2)
+        questions = _questions(3)
+        cache.put("s1", "2024-01-01", questions)
+        assert cache.get("s1", "2024-01-01") == questions
+
+    def test_miss_for_new_version(self):
+        """A resynced script is not served from the cache."""
+        cache = ScriptQuestionCache(max_scripts=2)
+        cache.put("s1", "2024-01-01", _questions(3))
+        assert cache.get("s1", "2024-02-01") is None
+
+    def test_lru_eviction(self):
+        """The least recently used script is evicted first."""
+        cache = ScriptQuestionCache(max_scripts=2)
+        cache.put("s1", "v", _questions(1))
+        cache.put("s2", "v", _questions(1))
+        cache.get("s1", "v")
+        cache.put("s3", "v", _questions(1))
+
+        assert cache.get("s1", "v") is not None
+        assert cache.get("s2", "v") is None
+        assert len(cache) == 2
+
+    def test_invalidate(self):
+        """Invalidation drops one script or all of them."""
+        cache = ScriptQuestionCache(max_scripts=4)
+        cache.put("s1", "v", _questions(1))
+        cache.put("s2", "v", _questions(1))
+
+        cache.invalidate("s1")
+        assert cache.get("s1", "v") is None
+        assert cache.get("s2", "v") is not None
+
+        cache.invalidate()
+        assert len(cache) == 0
@@ -0,0 +1,65 @@
+"""Unit tests for idempotent answer submission."""
+
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from app.services.session_service import idempotent_answer_statement, is_answer_retry
+
+
+def _statement(idempotency_key: str | None = "key-1"):
+    return idempotent_answer_statement(
+        uuid.uuid4(),
+        {
+            "id": uuid.uuid4(),
+            "question_id": uuid.uuid4(),
+            "question_order": 1,
+            "audio_url": None,
+            "transcript": "はい",
+            "skipped": False,
+            "idempotency_key": idempotency_key,
+        },
+        datetime.now(timezone.utc),
+    )
+
+
+class TestIdempotentAnswerStatement:
+    """Tests for the answer upsert."""
+
+    def test_conflict_returns_original_for_same_key(self):
+        """A conflicting insert returns the stored row only if the key matches."""
+        sql = str(_statement().compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO session_answers")
+        assert "ON CONFLICT ON CONSTRAINT uq_session_answers_session_order DO UPDATE" in sql
+        assert (
+            "WHERE excluded.idempotency_key IS NULL"
+            " OR session_answers.idempotency_key IS NOT DISTINCT FROM excluded.idempotency_key"
+        ) in sql
+        # The stored key is kept when a keyless retry matches
+        assert "SET idempotency_key = session_answers.idempotency_key" in sql
+        assert "RETURNING session_answers.id, session_answers.transcript, xmax = 0 AS inserted" in sql
+
+    def test_inserts_only_into_in_progress_sessions(self):
+        """Rows are selected from the session only while it is in progress, under a share lock."""
+        sql = str(_statement().compile(dialect=postgresql.dialect()))
+        assert "FROM interview_sessions JOIN (VALUES" in sql
+        assert "interview_sessions.status = %(status_1)s" in sql
+        assert "FOR SHARE OF interview_sessions" in sql
+
+    def test_binds_key(self):
+        """The idempotency key is stored with the answer."""
+        params = _statement("retry-key").compile(dialect=postgresql.dialect()).params
+        assert "retry-key" in params.values()
+
+
+class TestIsAnswerRetry:
+    """Tests for is_answer_retry."""
+
+    def test_same_key_or_no_key(self):
+        """Submissions with the original key or without a key are retries."""
+        assert is_answer_retry("key-1", "key-1")
+        assert is_answer_retry("key-1", None)
+        assert is_answer_retry(None, None)
+        assert not is_answer_retry("key-1", "key-2")
+        assert not is_answer_retry(None, "key-1")
@@ -0,0 +1,111 @@
+"""Unit tests for the session event buffer."""
+
+import asyncio
+import json
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services.session_events import SessionEventBuffer
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+
+
+class _Writer:
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.batches: list[list] = []
+
+    async def __call__(self, records) -> None:
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database unavailable")
+        self.batches.append(list(records))
+
+
+def _buffer(writer, **kwargs) -> SessionEventBuffer:
+    kwargs.setdefault("batch_size", 3)
+    kwargs.setdefault("flush_interval_seconds", 60)
+    kwargs.setdefault("max_buffered", 100)
+    kwargs.setdefault("max_retries", 3)
+    return SessionEventBuffer(writer, retry_backoff_seconds=0, **kwargs)
+
+
+class TestSessionEventBuffer:
+    """Tests for SessionEventBuffer."""
+
+    async def test_records_copy_rows(self):
+        """Events become COPY records with a UUID, JSON payload and aware timestamp."""
+        writer = _Writer()
+        buffer = _buffer(writer)
+        buffer.record(SESSION_ID, "answer_submitted", {"question_id": 1}, datetime(2026, 1, 1))
+        buffer.record(SESSION_ID, "reconnect")
+
+        assert await buffer.flush() == 2
+        [batch] = writer.batches
+        first, second = batch
+        assert first[0] == uuid.UUID(SESSION_ID)
+        assert json.loads(first[2]) == {"question_id": 1}
+        assert first[3] == datetime(2026, 1, 1, tzinfo=timezone.utc)
+        assert second[2] is None
+
+    def test_rejects_invalid_session_id(self):
+        """Invalid session IDs are rejected before they can fail a batch."""
+        with pytest.raises(ValueError):
+            _buffer(_Writer()).record("not-a-uuid", "reconnect")
+
+    async def test_flushes_in_batches(self):
+        """Buffered events are written in batches of at most batch_size."""
+        writer = _Writer()
+        buffer = _buffer(writer)
+        for _ in range(7):
+            buffer.record(SESSION_ID, "face")
+
+        assert await buffer.flush() == 7
+        assert [len(batch) for batch in writer.batches] == [3, 3, 1]
+        assert len(buffer) == 0
+
+    async def test_retries_failed_batches(self):
+        """A batch is retried until it is written."""
+        writer = _Writer(failures=2)
+        buffer = _buffer(writer)
+        buffer.record(SESSION_ID, "face")
+
+        assert await buffer.flush() == 1
+        assert len(writer.batches) == 1
+
+    async def test_drops_batch_after_retries(self):
+        """A batch still failing after max_retries is dropped."""
+        writer = _Writer(failures=3)
+        buffer = _buffer(writer)
+        buffer.record(SESSION_ID, "face")
+
+        assert await buffer.flush() == 0
+        assert writer.batches == []
+        assert len(buffer) == 0
+
+    def test_bounded_buffer_drops_oldest(self):
+        """Over max_buffered, the oldest events are dropped."""
+        buffer = _buffer(_Writer(), max_buffered=2)
+        for i in range(3):
+            buffer.record(SESSION_ID, f"event_{i}")
+        assert [record[1] for record in buffer._events] == ["event_1", "event_2"]
+
+    async def test_run_flushes_on_size_and_stop(self):
+        """The run loop flushes a full batch promptly and the rest on stop."""
+        writer = _Writer()
+        buffer = _buffer(writer)
+        task = asyncio.create_task(buffer.run())
+
+        for _ in range(4):
+            buffer.record(SESSION_ID, "face")
+        for _ in range(50):
+            if writer.batches:
+                break
+            await asyncio.sleep(0.01)
+        assert sum(len(batch) for batch in writer.batches) >= 3
+
+        buffer.stop()
+        await asyncio.wait_for(task, timeout=1)
+        assert sum(len(batch) for batch in writer.batches) == 4
@@ -0,0 +1,82 @@
+"""Unit tests for the abandoned session reaper."""
+
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from app.services import session_reaper
+from app.services.session_reaper import SessionReaper, reap_batch_statement
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    """Returns queued batches for each executed statement."""
+
+    def __init__(self, batches):
+        self.batches = batches
+        self.commits = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, stmt):
+        return _Result(self.batches.pop(0) if self.batches else [])
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _rows(*ids):
+    return [(session_id, None) for session_id in ids]
+
+
+class TestReapBatchStatement:
+    """Tests for the batch statement."""
+
+    def test_bounded_skip_locked_update(self):
+        """Batches lock a bounded set of rows without waiting on others."""
+        stmt = reap_batch_statement(datetime.now(timezone.utc), 100)
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE interview_sessions SET status=")
+        assert "LIMIT" in sql
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "NOT (EXISTS" in sql
+        assert "RETURNING interview_sessions.id, interview_sessions.heygen_session_id" in sql
+
+
+class TestSessionReaper:
+    """Tests for SessionReaper."""
+
+    async def test_reaps_until_short_batch(self):
+        """Batches run until one returns fewer rows than the batch size."""
+        db = _FakeSession([_rows("a", "b"), _rows("c", "d"), _rows("e"), _rows("f")])
+        reaper = SessionReaper(session_factory=lambda: db, idle_timeout_seconds=60, batch_size=2)
+        assert await reaper.reap() == 5
+        assert db.commits == 3
+
+    async def test_closes_avatar_sessions(self, monkeypatch):
+        """Avatar sessions of abandoned interviews are stopped."""
+        closed = []
+        monkeypatch.setattr(session_reaper, "close_avatar_session", closed.append)
+        db = _FakeSession([[("a", "heygen-a"), ("b", None)]])
+        reaper = SessionReaper(session_factory=lambda: db, idle_timeout_seconds=60, batch_size=5)
+        await reaper.reap()
+        assert closed == ["heygen-a", None]
+
+    async def test_stopped_reaper_does_nothing(self):
+        """A stopped reaper does not start new batches."""
+        db = _FakeSession([_rows("a", "b")])
+        reaper = SessionReaper(session_factory=lambda: db, idle_timeout_seconds=60, batch_size=2)
+        reaper.stop()
+        assert await reaper.reap() == 0
+        assert db.commits == 0
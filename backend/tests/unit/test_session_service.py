@@ -0,0 +1,352 @@
+"""Unit tests for SessionService answer and audio paths."""
+
+import base64
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes import sessions as session_routes
+from app.core.deps import get_current_user, get_db
+from app.schemas.session import AnswerRequest
+from app.services import session_service
+from app.services.heygen import AvatarSession
+from app.services.script_cache import CachedQuestion, script_question_cache
+from app.services.session_service import SessionService
+from app.services.session_state import AnswerState, SessionState
+from app.services.storage import LocalStorageBackend, StorageError, audio_key, is_audio_key
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+OTHER_SESSION_ID = "00000000-0000-0000-0000-000000000002"
+USER_ID = "00000000-0000-0000-0000-0000000000aa"
+SCRIPT_ID = "00000000-0000-0000-0000-0000000000bb"
+SYNCED_AT = "2026-10-19T00:00:00+00:00"
+
+
+class _Result:
+    def __init__(self, rows: list) -> None:
+        self._rows = rows
+
+    def first(self):
+        return self._rows[0] if self._rows else None
+
+    def one(self):
+        assert len(self._rows) == 1
+        return self._rows[0]
+
+    def one_or_none(self):
+        return self.first()
+
+    def scalar_one_or_none(self):
+        return self.first()
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _FakeDB:
+    """Returns queued rows for each executed statement."""
+
+    def __init__(self, *results: list) -> None:
+        self.results = list(results)
+        self.statements = []
+        self.commits = 0
+        self.rollbacks = 0
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+        return _Result(self.results.pop(0) if self.results else [])
+
+    async def commit(self):
+        self.commits += 1
+
+    async def rollback(self):
+        self.rollbacks += 1
+
+
+class _FakeStateStore:
+    def __init__(self, state: SessionState | None) -> None:
+        self.state = state
+        self.deleted: list[str] = []
+
+    async def get(self, session_id):
+        return self.state
+
+    async def put(self, state):
+        self.state = state
+
+    async def add_answer(self, session_id, answer):
+        await self.add_answers(session_id, [answer])
+
+    async def add_answers(self, session_id, answers):
+        for answer in answers:
+            self.state.answers[answer.question_order] = answer
+
+    async def delete(self, session_id):
+        self.deleted.append(session_id)
+
+
+def _state(status: str = "in_progress") -> SessionState:
+    return SessionState(
+        session_id=SESSION_ID,
+        user_id=USER_ID,
+        script_id=SCRIPT_ID,
+        synced_at=SYNCED_AT,
+        status=status,
+        started_at=datetime.now(timezone.utc),
+    )
+
+
+@pytest.fixture(autouse=True)
+def questions():
+    questions = tuple(
+        CachedQuestion(id=uuid.uuid4(), order_number=i, question_text=f"質問{i}") for i in (1, 2)
+    )
+    script_question_cache.put(SCRIPT_ID, SYNCED_AT, questions)
+    return questions
+
+
+@pytest.fixture
+def transcriptions(monkeypatch):
+    scheduled = []
+    monkeypatch.setattr(
+        session_service,
+        "schedule_transcription",
+        lambda answer_id, audio_url, audio_bytes=None: scheduled.append((answer_id, audio_url)),
+    )
+    return scheduled
+
+
+def _service(db, storage=None, state=None) -> SessionService:
+    return SessionService(db, state=_FakeStateStore(state or _state()), storage=storage)
+
+
+class TestIsAudioKey:
+    """Tests for is_audio_key."""
+
+    def test_accepts_issued_key(self):
+        """Keys built by audio_key are accepted for their session and question."""
+        key = audio_key(SESSION_ID, 1, "audio/webm")
+        assert is_audio_key(key, SESSION_ID, 1)
+        assert not is_audio_key(key, SESSION_ID, 2)
+        assert not is_audio_key(key, OTHER_SESSION_ID, 1)
+
+    @pytest.mark.parametrize(
+        "key",
+        [
+            f"audio/{SESSION_ID}/1-/../../{OTHER_SESSION_ID}/2-{'a' * 32}.webm",
+            f"audio/{SESSION_ID}/1-{'a' * 32}.webm/../../{OTHER_SESSION_ID}/2-{'a' * 32}.webm",
+            f"audio/{SESSION_ID}/1-../{'a' * 30}.webm",
+            f"audio/{SESSION_ID}/1-{'a' * 32}.exe",
+        ],
+    )
+    def test_rejects_traversal(self, key):
+        """Keys with extra segments or unknown extensions are rejected."""
+        assert not is_audio_key(key, SESSION_ID, 1)
+
+
+class TestConfirmAudioUpload:
+    """Tests for SessionService.confirm_audio_upload."""
+
+    async def test_attaches_uploaded_audio(self, tmp_path: Path, transcriptions):
+        """An uploaded key is attached to the answer and transcribed."""
+        storage = LocalStorageBackend(tmp_path)
+        key = audio_key(SESSION_ID, 1, "audio/webm")
+        await storage.upload_bytes(key, b"audio", "audio/webm")
+        answer_id = uuid.uuid4()
+        db = _FakeDB([SimpleNamespace(id=answer_id, transcript=None, inserted=True)])
+
+        result = await _service(db, storage).confirm_audio_upload(SESSION_ID, USER_ID, 1, key)
+
+        assert result.answer_id == str(answer_id)
+        assert result.size == 5
+        assert transcriptions == [(answer_id, key)]
+
+    async def test_rejects_other_sessions_recording(self, tmp_path: Path, transcriptions):
+        """A key climbing into another session's folder is rejected."""
+        storage = LocalStorageBackend(tmp_path)
+        other_key = f"audio/{OTHER_SESSION_ID}/2-{'a' * 32}.webm"
+        await storage.upload_bytes(other_key, b"secret", "audio/webm")
+        key = f"audio/{SESSION_ID}/1-/../../{OTHER_SESSION_ID}/2-{'a' * 32}.webm"
+        db = _FakeDB()
+
+        with pytest.raises(ValueError, match="Invalid audio key"):
+            await _service(db, storage).confirm_audio_upload(SESSION_ID, USER_ID, 1, key)
+        assert db.statements == []
+        assert transcriptions == []
+
+    def test_route_maps_storage_errors_to_400(self, monkeypatch):
+        """Storage errors from the confirm endpoint are client errors, not 500s."""
+
+        class _FailingService:
+            def __init__(self, db):
+                pass
+
+            async def confirm_audio_upload(self, **kwargs):
+                raise StorageError("Invalid storage key")
+
+        monkeypatch.setattr(session_routes, "SessionService", _FailingService)
+        app = FastAPI()
+        app.include_router(session_routes.router, prefix="/sessions")
+        app.dependency_overrides[get_db] = lambda: None
+        app.dependency_overrides[get_current_user] = lambda: {"sub": USER_ID}
+
+        response = TestClient(app).post(
+            f"/sessions/{SESSION_ID}/answers/1/audio/confirm",
+            json={"key": "audio/x"},
+        )
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid storage key"
+
+
+class TestCompletedSessionGuard:
+    """Answers are not written once Postgres says the session is over."""
+
+    async def test_submit_answer_rejected_with_stale_state(self, transcriptions):
+        """A stale in-progress cache does not let answers into a completed session."""
+        # Guarded insert selects nothing; no answer exists for the question
+        db = _FakeDB([], [])
+        service = _service(db)
+
+        with pytest.raises(ValueError, match="not in progress"):
+            await service.submit_answer(SESSION_ID, USER_ID, 1, None, "はい")
+        assert service.state.deleted == [SESSION_ID]
+        assert transcriptions == []
+
+    async def test_bulk_rejected_with_stale_state(self, transcriptions):
+        """Bulk answers into a completed session are rejected, not reported as duplicates."""
+        db = _FakeDB([], ["completed"])
+        service = _service(db)
+
+        with pytest.raises(ValueError, match="not in progress"):
+            await service.submit_answers_bulk(
+                SESSION_ID, USER_ID, [AnswerRequest(question_id=1, transcript="はい")]
+            )
+        assert service.state.deleted == [SESSION_ID]
+
+
+AUDIO = "data:audio/webm;base64," + base64.b64encode(b"audio").decode()
+
+
+def _stored_audio(root: Path) -> list[Path]:
+    return [p for p in root.rglob("*") if p.is_file()]
+
+
+class TestIdempotentSubmitAnswer:
+    """Retried answer submissions."""
+
+    async def test_retry_returns_original(self, tmp_path: Path, transcriptions):
+        """A retry racing the original gets its answer; its audio is dropped and not transcribed."""
+        original_id = uuid.uuid4()
+        # Conflict with the same key: the original row comes back, not inserted
+        db = _FakeDB([SimpleNamespace(id=original_id, transcript="はい", inserted=False)])
+        service = _service(db, LocalStorageBackend(tmp_path))
+
+        result = await service.submit_answer(SESSION_ID, USER_ID, 1, AUDIO, None, "key-1")
+
+        assert result.answer_id == str(original_id)
+        assert result.transcript == "はい"
+        assert transcriptions == []
+        assert _stored_audio(tmp_path) == []
+
+    async def test_keyless_retry_returns_original(self, transcriptions):
+        """A retry without a key matches an answer recorded with one."""
+        original_id = uuid.uuid4()
+        state = _state()
+        state.answers[1] = AnswerState(
+            question_order=1, transcript="はい", answered_at=datetime.now(timezone.utc)
+        )
+        db = _FakeDB([SimpleNamespace(id=original_id, transcript="はい", idempotency_key="key-1")])
+        service = _service(db, state=state)
+
+        result = await service.submit_answer(SESSION_ID, USER_ID, 1, None, "はい")
+
+        assert result.answer_id == str(original_id)
+        assert transcriptions == []
+
+    async def test_other_key_rejected(self, tmp_path: Path, transcriptions):
+        """A different key for an answered question is rejected and its audio dropped."""
+        # Conflict with another key: nothing returned, the stored answer has key-1
+        db = _FakeDB([], [SimpleNamespace(id=uuid.uuid4(), transcript="はい", idempotency_key="key-1")])
+        service = _service(db, LocalStorageBackend(tmp_path))
+
+        with pytest.raises(ValueError, match="already answered"):
+            await service.submit_answer(SESSION_ID, USER_ID, 1, AUDIO, None, "key-2")
+        assert transcriptions == []
+        assert _stored_audio(tmp_path) == []
+        assert service.state.deleted == []
+
+    async def test_bulk_drops_audio_of_duplicates(self, tmp_path: Path, transcriptions):
+        """Audio of bulk answers recorded concurrently elsewhere is deleted."""
+        # Only question 1 is inserted; question 2 was answered in the meantime
+        db = _FakeDB([1])
+        service = _service(db, LocalStorageBackend(tmp_path))
+
+        result = await service.submit_answers_bulk(
+            SESSION_ID,
+            USER_ID,
+            [
+                AnswerRequest(question_id=1, audio_data=AUDIO),
+                AnswerRequest(question_id=2, audio_data=AUDIO),
+            ],
+        )
+
+        assert [r.status for r in result.results] == ["accepted", "duplicate"]
+        stored = _stored_audio(tmp_path)
+        assert len(stored) == 1 and stored[0].name.startswith("1-")
+        assert [url.split("/")[-1][:2] for _, url in transcriptions] == ["1-"]
+
+
+class TestAvatarSessionClose:
+    """Avatar sessions are stopped when their interview ends."""
+
+    @pytest.fixture
+    def closed(self, monkeypatch):
+        closed = []
+        monkeypatch.setattr(session_service, "close_avatar_session", closed.append)
+        return closed
+
+    async def test_complete_session(self, closed):
+        """Completing a session stops its avatar session."""
+        row = SimpleNamespace(
+            id=uuid.UUID(SESSION_ID),
+            completed_at=datetime.now(timezone.utc),
+            heygen_session_id="heygen-1",
+        )
+        job_id = uuid.uuid4()
+        db = _FakeDB([row], [job_id])
+
+        result = await _service(db).complete_session(SESSION_ID, USER_ID)
+
+        assert closed == ["heygen-1"]
+        assert result.job_id == str(job_id)
+        assert result.evaluation_id is None
+
+    async def test_create_session_commit_failure(self, monkeypatch, closed):
+        """An avatar session taken for a session that failed to save is stopped."""
+
+        class _Pool:
+            async def acquire(self, avatar_id):
+                return AvatarSession(session_id="heygen-1", session_token="token", avatar_id=avatar_id)
+
+        class _FailingDB(_FakeDB):
+            def add(self, obj):
+                pass
+
+            async def commit(self):
+                raise RuntimeError("connection lost")
+
+        monkeypatch.setattr(session_service, "get_avatar_pool", lambda: _Pool())
+        db = _FailingDB([SimpleNamespace(id=uuid.UUID(SCRIPT_ID), questions=[])])
+
+        with pytest.raises(RuntimeError):
+            await _service(db).create_session(USER_ID, SCRIPT_ID, "N3")
+
+        assert closed == ["heygen-1"]
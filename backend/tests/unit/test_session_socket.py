@@ -0,0 +1,162 @@
+"""Unit tests for the session WebSocket channel."""
+
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.schemas.session import AnswerResponse, NextQuestion, SessionResponse
+from app.services import session_socket
+from app.services.session_socket import CLOSE_UNAUTHORIZED, SessionSocket
+
+SESSION_ID = "00000000-0000-0000-0000-000000000001"
+USER_ID = "00000000-0000-0000-0000-0000000000aa"
+
+
+@asynccontextmanager
+async def _no_db():
+    yield None
+
+
+class _FakeSessionService:
+    def __init__(self, db):
+        pass
+
+    async def get_session(self, session_id, user_id):
+        if user_id != USER_ID:
+            return None
+        return SessionResponse(
+            session_id=session_id,
+            status="in_progress",
+            current_question=1,
+            total_questions=2,
+            answers=[],
+            started_at=datetime.now(timezone.utc),
+        )
+
+    async def submit_answer(
+        self, session_id, user_id, question_id, audio_data, transcript, idempotency_key=None
+    ):
+        if question_id == 2:
+            raise RuntimeError("database unavailable")
+        if question_id != 1:
+            raise ValueError("Invalid question ID")
+        return AnswerResponse(
+            answer_id="answer-1",
+            question_id=question_id,
+            transcript=transcript,
+            next_question=NextQuestion(id=2, text="次の質問"),
+        )
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(session_socket, "async_session_factory", _no_db)
+    monkeypatch.setattr(session_socket, "SessionService", _FakeSessionService)
+    monkeypatch.setattr(settings, "session_channel_enabled", False)
+    monkeypatch.setattr(settings, "session_events_enabled", False)
+
+    app = FastAPI()
+
+    @app.websocket("/sessions/{session_id}/ws")
+    async def endpoint(websocket: WebSocket, session_id: str):
+        await SessionSocket(websocket, session_id).run()
+
+    return TestClient(app)
+
+
+def _auth(ws, user_id: str = USER_ID) -> dict:
+    ws.send_json({"type": "auth", "id": "a", "data": {"token": create_access_token({"sub": user_id})}})
+    return ws.receive_json()
+
+
+class TestSessionSocket:
+    """Tests for SessionSocket."""
+
+    def test_rejects_invalid_token(self, client):
+        """Connections without a valid token are closed."""
+        with client.websocket_connect(f"/sessions/{SESSION_ID}/ws") as ws:
+            ws.send_json({"type": "auth", "data": {"token": "bad"}})
+            with pytest.raises(WebSocketDisconnect) as exc:
+                ws.receive_json()
+        assert exc.value.code == CLOSE_UNAUTHORIZED
+
+    @pytest.mark.parametrize("data", ["token", ["token"], {"token": 1}])
+    def test_rejects_malformed_auth(self, client, data):
+        """Auth messages without a token object are closed as unauthorized."""
+        with client.websocket_connect(f"/sessions/{SESSION_ID}/ws") as ws:
+            ws.send_json({"type": "auth", "data": data})
+            with pytest.raises(WebSocketDisconnect) as exc:
+                ws.receive_json()
+        assert exc.value.code == CLOSE_UNAUTHORIZED
+
+    def test_rejects_invalid_last_event_id(self, client):
+        """Malformed resume positions are rejected."""
+        token = create_access_token({"sub": USER_ID})
+        with client.websocket_connect(f"/sessions/{SESSION_ID}/ws") as ws:
+            ws.send_json({"type": "auth", "data": {"token": token, "last_event_id": "latest"}})
+            with pytest.raises(WebSocketDisconnect) as exc:
+                ws.receive_json()
+        assert exc.value.code == 1008
+
+    def test_session_sent_after_auth(self, client):
+        """The session state is the first message after authentication."""
+        with client.websocket_connect(f"/sessions/{SESSION_ID}/ws") as ws:
+            message = _auth(ws)
+        assert message["type"] == "session"
+        assert message["id"] == "a"
+        assert message["data"]["session_id"] == SESSION_ID
+
+    def test_answer_and_next_question(self, client):
+        """Answers are acknowledged and followed by the next question."""
+        with client.websocket_connect(f"/sessions/{SESSION_ID}/ws") as ws:
+            _auth(ws)
+            ws.send_json({"type": "answer", "id": "1", "data": {"question_id": 1, "transcript": "はい"}})
+            result = ws.receive_json()
+            question = ws.receive_json()
+        assert (result["type"], result["id"]) == ("answer_result", "1")
+        assert result["data"]["transcript"] == "はい"
+        assert question["type"] == "question"
+        assert question["data"] == {"id": 2, "text": "次の質問"}
+
+    def test_errors_keep_connection_open(self, client):
+        """Invalid messages get an error reply and the channel stays usable."""
+        with client.websocket_connect(f"/sessions/{SESSION_ID}/ws") as ws:
+            _auth(ws)
+            ws.send_json({"type": "answer", "id": "1", "data": {"question_id": 5}})
+            assert ws.receive_json()["data"]["detail"] == "Invalid question ID"
+            ws.send_json({"type": "answer", "id": "2", "data": {}})
+            assert ws.receive_json()["data"]["detail"] == "Invalid message data"
+            ws.send_json({"type": "unknown", "id": "3"})
+            assert ws.receive_json()["type"] == "error"
+            ws.send_json({"type": "ping", "id": "4"})
+            assert ws.receive_json() == {"type": "pong", "id": "4", "data": None}
+
+    def test_rejects_long_message_id(self, client):
+        """Message IDs longer than an idempotency key are rejected."""
+        with client.websocket_connect(f"/sessions/{SESSION_ID}/ws") as ws:
+            _auth(ws)
+            ws.send_json({"type": "answer", "id": "x" * 101, "data": {"question_id": 1}})
+            error = ws.receive_json()
+            ws.send_json({"type": "ping", "id": "x" * 100})
+            pong = ws.receive_json()
+        assert (error["type"], error["id"]) == ("error", None)
+        assert pong["type"] == "pong"
+
+    def test_unexpected_errors_reported(self, client):
+        """Unexpected failures get an error reply instead of dropping the connection."""
+        with client.websocket_connect(f"/sessions/{SESSION_ID}/ws") as ws:
+            _auth(ws)
+            ws.send_json({"type": "answer", "id": "1", "data": {"question_id": 2}})
+            assert ws.receive_json() == {
+                "type": "error",
+                "id": "1",
+                "data": {"detail": "Internal server error"},
+            }
+            ws.send_json({"type": "ping", "id": "2"})
+            assert ws.receive_json()["type"] == "pong"
@@ -0,0 +1,170 @@
+"""Unit tests for object storage backends."""
+
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.services.storage import (
+    MIN_PART_SIZE,
+    LocalStorageBackend,
+    S3StorageBackend,
+    StorageError,
+    audio_key,
+    sign_local_upload,
+    verify_local_upload,
+)
+
+
+async def _chunks(*sizes: int) -> AsyncIterator[bytes]:
+    for size in sizes:
+        yield b"a" * size
+
+
+class _RecordingS3Client:
+    """Records the S3 calls made by the backend."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict]] = []
+
+    def put_object(self, **kwargs):
+        self.calls.append(("put_object", kwargs))
+
+    def create_multipart_upload(self, **kwargs):
+        self.calls.append(("create_multipart_upload", kwargs))
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, **kwargs):
+        self.calls.append(("upload_part", kwargs))
+        return {"ETag": f"etag-{kwargs['PartNumber']}"}
+
+    def complete_multipart_upload(self, **kwargs):
+        self.calls.append(("complete_multipart_upload", kwargs))
+
+    def abort_multipart_upload(self, **kwargs):
+        self.calls.append(("abort_multipart_upload", kwargs))
+
+
+class TestLocalStorageBackend:
+    """Tests for LocalStorageBackend."""
+
+    async def test_upload_stream(self, tmp_path: Path):
+        """Chunks are written to a file under the root."""
+        storage = LocalStorageBackend(tmp_path)
+        stored = await storage.upload_stream("audio/s1/1.webm", _chunks(10, 20), "audio/webm")
+
+        assert stored.size == 30
+        assert (tmp_path / "audio/s1/1.webm").read_bytes() == b"a" * 30
+
+    async def test_failed_upload_leaves_no_file(self, tmp_path: Path):
+        """A failing stream does not leave partial files behind."""
+
+        async def failing() -> AsyncIterator[bytes]:
+            yield b"a"
+            raise ValueError("too large")
+
+        storage = LocalStorageBackend(tmp_path)
+        with pytest.raises(ValueError):
+            await storage.upload_stream("audio/s1/1.webm", failing(), "audio/webm")
+
+        assert list((tmp_path / "audio/s1").iterdir()) == []
+
+    def test_rejects_keys_outside_root(self, tmp_path: Path):
+        """Keys cannot escape the storage root."""
+        storage = LocalStorageBackend(tmp_path)
+        with pytest.raises(StorageError):
+            storage.path_for("../outside")
+
+
+class TestS3StorageBackend:
+    """Tests for S3StorageBackend."""
+
+    async def test_small_object_uses_single_put(self):
+        """Objects smaller than a part are uploaded with one PUT."""
+        client = _RecordingS3Client()
+        storage = S3StorageBackend(bucket="test", client=client)
+        await storage.upload_stream("k", _chunks(100), "audio/webm")
+
+        assert [name for name, _ in client.calls] == ["put_object"]
+
+    async def test_large_object_uses_multipart(self):
+        """Large streams are split into parts of the configured size."""
+        client = _RecordingS3Client()
+        storage = S3StorageBackend(bucket="test", client=client)
+        stored = await storage.upload_stream(
+            "k", _chunks(MIN_PART_SIZE // 2, MIN_PART_SIZE, 10), "audio/webm"
+        )
+
+        names = [name for name, _ in client.calls]
+        assert names == [
+            "create_multipart_upload",
+            "upload_part",
+            "upload_part",
+            "complete_multipart_upload",
+        ]
+        parts = client.calls[-1][1]["MultipartUpload"]["Parts"]
+        assert [p["PartNumber"] for p in parts] == [1, 2]
+        assert stored.size == MIN_PART_SIZE * 3 // 2 + 10
+
+    async def test_failed_stream_aborts_multipart(self):
+        """A failing stream aborts the multipart upload."""
+
+        async def failing() -> AsyncIterator[bytes]:
+            yield b"a" * MIN_PART_SIZE
+            raise ValueError("too large")
+
+        client = _RecordingS3Client()
+        storage = S3StorageBackend(bucket="test", client=client)
+        with pytest.raises(ValueError):
+            await storage.upload_stream("k", failing(), "audio/webm")
+
+        assert client.calls[-1][0] == "abort_multipart_upload"
+
+
+def test_audio_key_extension():
+    """Audio keys get an extension from the content type."""
+    assert audio_key("s1", 2, "audio/webm;codecs=opus").startswith("audio/s1/2-")
+    assert audio_key("s1", 2, "audio/webm;codecs=opus").endswith(".webm")
+    assert audio_key("s1", 2, "application/x-unknown").endswith(".bin")
+
+
+class TestLocalPresignedUpload:
+    """Tests for local pre-signed upload URLs."""
+
+    async def test_presigned_url_verifies(self, tmp_path: Path):
+        """The issued URL carries a valid signature for the key."""
+        storage = LocalStorageBackend(tmp_path)
+        upload = await storage.presign_upload("audio/s1/1-x.webm", "audio/webm", 60)
+        query = parse_qs(urlparse(upload.url).query)
+
+        assert "/storage/local/audio/s1/1-x.webm" in upload.url
+        assert verify_local_upload(
+            "audio/s1/1-x.webm",
+            query["content_type"][0],
+            int(query["expires"][0]),
+            query["signature"][0],
+        )
+
+    def test_rejects_tampered_or_expired(self):
+        """Signatures are bound to the key and expire."""
+        expires = int(time.time()) + 60
+        signature = sign_local_upload("audio/s1/1-x.webm", "audio/webm", expires)
+
+        assert not verify_local_upload("audio/s2/1-x.webm", "audio/webm", expires, signature)
+        expired = int(time.time()) - 1
+        assert not verify_local_upload(
+            "audio/s1/1-x.webm",
+            "audio/webm",
+            expired,
+            sign_local_upload("audio/s1/1-x.webm", "audio/webm", expired),
+        )
+
+    async def test_stat(self, tmp_path: Path):
+        """Stat reports uploaded objects and misses."""
+        storage = LocalStorageBackend(tmp_path)
+        await storage.upload_bytes("audio/s1/1.webm", b"abc", "audio/webm")
+
+        assert (await storage.stat("audio/s1/1.webm")).size == 3
+        assert await storage.stat("audio/s1/2.webm") is None
@@ -0,0 +1,103 @@
+"""Unit tests for the transcription pool."""
+
+import asyncio
+
+import pytest
+
+from app.services.transcription import (
+    AudioInput,
+    FakeTranscriptionBackend,
+    TranscriptionError,
+    TranscriptionPool,
+)
+
+
+class _SlowBackend(FakeTranscriptionBackend):
+    """Fake backend tracking concurrent calls."""
+
+    max_batch_size = 1
+    max_concurrency = 2
+
+    def __init__(self, delay: float) -> None:
+        super().__init__(delay=delay)
+        self.active = 0
+        self.peak = 0
+
+    async def transcribe_batch(self, inputs: list[AudioInput]) -> list[str]:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            return await super().transcribe_batch(inputs)
+        finally:
+            self.active -= 1
+
+
+class TestTranscriptionPool:
+    """Tests for TranscriptionPool."""
+
+    async def test_batches_concurrent_requests(self):
+        """Requests arriving together are sent in one backend call."""
+        backend = FakeTranscriptionBackend()
+        pool = TranscriptionPool(backend, batch_wait_ms=50)
+        try:
+            results = await asyncio.gather(
+                *(pool.transcribe(AudioInput(f"audio-{i}".encode())) for i in range(5))
+            )
+        finally:
+            await pool.close()
+
+        assert results == ["テスト回答です"] * 5
+        assert backend.batches == [5]
+
+    async def test_cache_by_audio_hash(self):
+        """The same recording is transcribed only once."""
+        backend = FakeTranscriptionBackend()
+        pool = TranscriptionPool(backend, batch_wait_ms=1)
+        try:
+            await pool.transcribe(AudioInput(b"same"))
+            await pool.transcribe(AudioInput(b"same"))
+            await asyncio.gather(pool.transcribe(AudioInput(b"other")), pool.transcribe(AudioInput(b"other")))
+        finally:
+            await pool.close()
+
+        assert sum(backend.batches) == 2
+
+    async def test_concurrency_limit(self):
+        """No more than max_concurrency backend calls run at once."""
+        backend = _SlowBackend(delay=0.05)
+        pool = TranscriptionPool(backend, batch_wait_ms=1)
+        try:
+            await asyncio.gather(*(pool.transcribe(AudioInput(bytes([i]))) for i in range(6)))
+        finally:
+            await pool.close()
+
+        assert backend.peak == 2
+        assert len(backend.batches) == 6
+
+    async def test_timeout(self):
+        """Slow backend calls fail with a TranscriptionError."""
+        pool = TranscriptionPool(FakeTranscriptionBackend(delay=1), batch_wait_ms=1, timeout_seconds=0.05)
+        try:
+            with pytest.raises(TranscriptionError):
+                await pool.transcribe(AudioInput(b"slow"))
+        finally:
+            await pool.close()
+
+    async def test_short_result_fails_batch(self):
+        """A backend returning fewer transcripts than inputs fails every request in the batch."""
+
+        class _ShortBackend(FakeTranscriptionBackend):
+            async def transcribe_batch(self, inputs: list[AudioInput]) -> list[str]:
+                return (await super().transcribe_batch(inputs))[:-1]
+
+        pool = TranscriptionPool(_ShortBackend(), batch_wait_ms=50)
+        try:
+            results = await asyncio.gather(
+                *(pool.transcribe(AudioInput(f"audio-{i}".encode())) for i in range(3)),
+                return_exceptions=True,
+            )
+        finally:
+            await pool.close()
+
+        assert all(isinstance(r, TranscriptionError) for r in results)
+        assert "2 transcripts for 3 inputs" in str(results[0])
@@ -0,0 +1,92 @@
+"""Unit tests for question text-to-speech assets."""
+
+import asyncio
+from pathlib import Path
+
+from app.services.storage import LocalStorageBackend
+from app.services.tts import (
+    FakeTTSBackend,
+    LocalAssetCache,
+    TTSAssetStore,
+    asset_hash,
+    is_asset_hash,
+)
+
+
+def _store(tmp_path: Path, backend: FakeTTSBackend, max_bytes: int = 1024) -> TTSAssetStore:
+    return TTSAssetStore(
+        backend,
+        storage=LocalStorageBackend(tmp_path / "objects"),
+        local=LocalAssetCache(tmp_path / "cache", max_bytes),
+        voice="alloy",
+    )
+
+
+class TestAssetHash:
+    """Tests for asset addressing."""
+
+    def test_depends_on_rate_and_voice(self):
+        """Each (voice, rate, text) is a distinct asset."""
+        base = asset_hash("fake", "alloy", 1.0, "自己紹介をしてください")
+        assert is_asset_hash(base)
+        assert base == asset_hash("fake", "alloy", 1.0, "自己紹介をしてください")
+        assert base != asset_hash("fake", "alloy", 0.5, "自己紹介をしてください")
+        assert base != asset_hash("fake", "nova", 1.0, "自己紹介をしてください")
+
+
+class TestTTSAssetStore:
+    """Tests for TTSAssetStore."""
+
+    async def test_synthesised_once(self, tmp_path):
+        """Repeated and concurrent requests share one synthesis."""
+        backend = FakeTTSBackend(delay=0.01)
+        store = _store(tmp_path, backend)
+        hashes = await asyncio.gather(*(store.ensure("質問", 0.75) for _ in range(5)))
+        assert len(set(hashes)) == 1
+        await store.ensure("質問", 0.75)
+        assert backend.calls == [("質問", "alloy", 0.75)]
+
+    async def test_storage_tier_survives_local_eviction(self, tmp_path):
+        """Assets evicted locally are restored from object storage."""
+        backend = FakeTTSBackend()
+        store = _store(tmp_path, backend, max_bytes=40)
+        first = await store.ensure("一つ目の質問です", 1.0)
+        await store.ensure("二つ目の質問です", 1.0)
+        assert store.local.get(first) is None
+
+        assert await store.read(first) == "alloy:1.0:一つ目の質問です".encode()
+        assert len(backend.calls) == 2
+
+    async def test_unknown_asset(self, tmp_path):
+        """Unknown hashes are not found."""
+        store = _store(tmp_path, FakeTTSBackend())
+        assert await store.read("0" * 64) is None
+
+    async def test_read_survives_concurrent_eviction(self, tmp_path):
+        """An asset evicted between lookup and read is served from object storage."""
+        store = _store(tmp_path, FakeTTSBackend())
+        audio_hash = await store.ensure("質問", 1.0)
+        # As if a concurrent put evicted it right after the LRU lookup
+        store.local.path_for(audio_hash).unlink()
+
+        assert await store.read(audio_hash) == "alloy:1.0:質問".encode()
+        assert store.local.path_for(audio_hash).exists()
+
+
+class TestLocalAssetCache:
+    """Tests for LocalAssetCache."""
+
+    async def test_lru_eviction_and_reload(self, tmp_path):
+        """The least recently used asset is evicted; the rest are indexed on restart."""
+        cache = LocalAssetCache(tmp_path, max_bytes=20)
+        a, b, c = ("a" * 64, "b" * 64, "c" * 64)
+        await cache.put(a, b"x" * 8)
+        await cache.put(b, b"x" * 8)
+        cache.get(a)
+        await cache.put(c, b"x" * 8)
+        assert cache.get(b) is None
+        assert not cache.path_for(b).exists()
+
+        reloaded = LocalAssetCache(tmp_path, max_bytes=20)
+        assert reloaded.size == 16
+        assert reloaded.get(a) is not None
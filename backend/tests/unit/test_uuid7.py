@@ -0,0 +1,29 @@
+"""Unit tests for UUIDv7 generation."""
+
+import time
+
+from app.db.uuid7 import uuid7, uuid7_timestamp_ms
+
+
+class TestUUID7:
+    """Tests for uuid7."""
+
+    def test_version_and_variant(self):
+        """Generated IDs are RFC 9562 version 7 UUIDs."""
+        value = uuid7()
+        assert value.version == 7
+        assert value.variant == "specified in RFC 4122"
+
+    def test_encodes_current_time(self):
+        """The leading 48 bits are the Unix time in milliseconds."""
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert before <= uuid7_timestamp_ms(value) <= after + 1
+
+    def test_strictly_increasing(self):
+        """IDs generated in a row sort in generation order, also within a millisecond."""
+        values = [uuid7() for _ in range(10_000)]
+        assert values == sorted(values)
+        assert len(set(values)) == len(values)
+        assert str(values[0]) < str(values[-1])